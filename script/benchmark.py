@@ -0,0 +1,220 @@
+"""Script CLI de benchmarks de desempenho dos estágios de NLP sobre o corpus de referência."""
+
+from __future__ import annotations
+
+from sys import argv, exit
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, NoReturn, Optional
+
+from langdetect import LangDetectException, detect  # type: ignore[import-untyped]
+
+from sa.file import CSVColumnReader
+from sa.logger import create_logger
+from sa.model import Language
+from sa.nlp import LanguageIdentifier, PipelineProfile, load_pipeline, load_stopwords, normalize_text, preprocess_texts
+from sa.parser import parse_benchmark_args
+
+if TYPE_CHECKING:
+    from sa.parser import BenchmarkParserNamespace
+
+logger = create_logger(__name__)
+
+
+def main() -> None:
+    """
+    Executa o benchmark do subcomando solicitado sobre o corpus de referência.
+
+    Passos:
+    - Lê a coluna de textos do corpus CSV (por padrão, `.backup/TESTE_CEGO.csv`).
+    - ``pipeline``: carrega o modelo spaCy em cada perfil (`PipelineProfile`), mede o tempo de carga,
+      o tempo de `preprocess_texts` sobre o corpus e a concordância dos tokens com o perfil completo.
+    - ``language``: mede o langdetect e o `LanguageIdentifier` (texto a texto e em lote) sobre os textos
+      normalizados, com a concordância em relação ao langdetect e a estabilidade entre repetições.
+    """
+
+    args = parse_benchmark_args(argv[1:])
+
+    input_path = args.input_path.resolve()
+
+    if not input_path.exists():
+        fatal(f"O corpus {str(input_path)!r} não existe.")
+
+    try:
+        texts = CSVColumnReader(input_path, args.column).read()
+    except KeyError as e:
+        fatal(str(e))
+
+    if args.limit is not None:
+        texts = texts[: args.limit]
+
+    logger.info("Corpus %s: %d texto(s).", input_path.name, len(texts))
+
+    match args.command:
+        case "pipeline":
+            benchmark_pipeline(texts, args)
+        case "language":
+            benchmark_language(texts, args)
+        case _:
+            fatal(f"Benchmark desconhecido: {args.command}")
+
+
+def benchmark_pipeline(texts: list[str], args: BenchmarkParserNamespace) -> None:
+    """
+    Compara os perfis de pipeline spaCy em tempo de carga, vazão e concordância de tokens.
+
+    Args:
+        texts (list[str]): Textos do corpus.
+        args (BenchmarkParserNamespace): Argumentos do subcomando ``pipeline``.
+    """
+
+    stopwords = load_stopwords(lang="portuguese")
+    baseline: list[list[str]] | None = None
+    rows: list[tuple[str, str, float, float, str]] = []
+
+    # O perfil completo é medido primeiro para servir de referência à concordância
+    profiles = sorted(dict.fromkeys(args.profiles), key=lambda profile: profile is not PipelineProfile.FULL)
+
+    for profile in profiles:
+        logger.info("Carregando %s no perfil %r...", args.model, profile.value)
+
+        started_at = perf_counter()
+
+        try:
+            nlp = load_pipeline(args.model, profile)
+        except OSError as e:
+            fatal(f"erro ao carregar o modelo {args.model!r}: {e}")
+
+        load_seconds = perf_counter() - started_at
+        best = float("inf")
+        tokens: list[list[str]] = []
+
+        for _ in range(args.repeat):
+            started_at = perf_counter()
+            tokens = list(preprocess_texts(texts, stopwords, nlp, batch_size=args.batch_size))
+            best = min(best, perf_counter() - started_at)
+
+        if profile is PipelineProfile.FULL:
+            baseline = tokens
+
+        if baseline is None:
+            agreement = "-"
+        else:
+            agreement = f"{sum(a == b for a, b in zip(tokens, baseline)) / max(len(texts), 1):.1%}"
+
+        rows.append((profile.value, ", ".join(nlp.pipe_names) or "(tokenizador)", load_seconds, best, agreement))
+
+    logger.info("%-10s %9s %13s %10s %12s  %s", "perfil", "carga (s)", "processo (s)", "textos/s", "concordância", "componentes")
+
+    for name, components, load_seconds, seconds, agreement in rows:
+        rate = len(texts) / seconds if seconds > 0 else 0.0
+
+        logger.info("%-10s %9.2f %13.3f %10.1f %12s  %s", name, load_seconds, seconds, rate, agreement, components)
+
+
+def benchmark_language(texts: list[str], args: BenchmarkParserNamespace) -> None:
+    """
+    Compara o identificador de idioma por n-gramas com o langdetect em vazão, concordância e estabilidade.
+
+    Os textos são normalizados com `normalize_text`, como na coleta. A concordância é medida contra
+    a primeira execução do langdetect, considerando apenas os idiomas de `Language` (os demais contam
+    como indeterminados). A estabilidade é a fração de textos que recebem o mesmo idioma em todas as repetições.
+
+    Args:
+        texts (list[str]): Textos do corpus.
+        args (BenchmarkParserNamespace): Argumentos do subcomando ``language``.
+    """
+
+    texts = [normalize_text(text) for text in texts]
+    supported = {lang.value for lang in Language}
+
+    def run_langdetect() -> list[Optional[str]]:
+        results: list[Optional[str]] = []
+
+        for text in texts:
+            try:
+                code = detect(text)
+            except LangDetectException:
+                code = None
+
+            results.append(code if code in supported else None)
+
+        return results
+
+    def run_single() -> list[Optional[str]]:
+        return [lang.value if lang else None for lang in map(identifier.detect, texts)]
+
+    def run_batch() -> list[Optional[str]]:
+        return [
+            lang.value if lang else None
+            for start in range(0, len(texts), args.batch_size)
+            for lang in identifier.detect_batch(texts[start : start + args.batch_size])
+        ]
+
+    # Carrega os perfis do langdetect fora da medição, como já acontece após o primeiro post da coleta
+    started_at = perf_counter()
+    detect("texto de aquecimento")
+    langdetect_load = perf_counter() - started_at
+
+    started_at = perf_counter()
+    identifier = LanguageIdentifier()
+    identifier_load = perf_counter() - started_at
+
+    engines: list[tuple[str, float, Callable[[], list[Optional[str]]]]] = [
+        ("langdetect", langdetect_load, run_langdetect),
+        ("ngram", identifier_load, run_single),
+        (f"ngram-{args.batch_size}", identifier_load, run_batch),
+    ]
+
+    reference: list[Optional[str]] | None = None
+    rows: list[tuple[str, float, float, float, float]] = []
+
+    for name, load_seconds, run in engines:
+        logger.info("Medindo %s...", name)
+
+        best = float("inf")
+        runs: list[list[Optional[str]]] = []
+
+        for _ in range(args.repeat):
+            started_at = perf_counter()
+            runs.append(run())
+            best = min(best, perf_counter() - started_at)
+
+        if reference is None:
+            reference = runs[0]
+
+        total = max(len(texts), 1)
+        agreement = sum(a == b for a, b in zip(runs[0], reference)) / total
+        stability = sum(len(set(results)) == 1 for results in zip(*runs)) / total
+
+        rows.append((name, load_seconds, best, agreement, stability))
+
+    logger.info("%-12s %9s %13s %10s %12s %12s", "detector", "carga (s)", "processo (s)", "textos/s", "concordância", "estabilidade")
+
+    for name, load_seconds, seconds, agreement, stability in rows:
+        rate = len(texts) / seconds if seconds > 0 else 0.0
+
+        logger.info("%-12s %9.2f %13.3f %10.1f %12.1f%% %11.1f%%", name, load_seconds, seconds, rate, agreement * 100, stability * 100)
+
+    decided = identifier.precheck_decided + identifier.model_decided
+
+    if decided:
+        logger.info("Pré-checagem de stopwords decidiu %.1f%% dos textos sem o modelo de n-gramas.", identifier.precheck_decided / decided * 100)
+
+
+def fatal(message: str) -> NoReturn:
+    """
+    Aborta o benchmark registrando o motivo.
+
+    Args:
+        message (str): Mensagem descritiva do erro irrecuperável.
+    """
+
+    logger.fatal(message)
+    exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nBenchmark interrompido pelo usuário.")
@@ -0,0 +1,123 @@
+"""Script CLI de remoção de posts quase duplicados de exportações existentes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from sys import argv, exit
+from time import perf_counter
+from typing import NoReturn
+
+import pandas as pd
+
+from sa.file import FileFormat
+from sa.logger import create_logger
+from sa.nlp import find_near_duplicates
+from sa.parser import parse_dedup_args
+
+logger = create_logger(__name__)
+
+NEAR_DUPLICATE_COLUMN = "near_duplicate_of"
+"""Coluna acrescentada com `--mark`, com o identificador da linha mantida de que cada linha é quase duplicada."""
+
+
+def main() -> None:
+    """
+    Remove (ou marca) as linhas de uma exportação quase duplicadas de linhas anteriores.
+
+    Passos:
+    - Lê a exportação inteira (CSV ou XLSX, pela extensão).
+    - Concatena as colunas `--columns` de cada linha e calcula as assinaturas MinHash em lote.
+    - Insere as linhas em ordem em um índice LSH: a primeira linha de cada grupo é mantida.
+    - Grava as linhas mantidas ou, com `--mark`, todas elas com a coluna `near_duplicate_of`.
+    """
+
+    args = parse_dedup_args(argv[1:])
+
+    input_path = args.input_path.resolve()
+    output_path = args.output_path.resolve()
+
+    if not input_path.exists():
+        fatal(f"O arquivo de entrada {str(input_path)!r} não existe.")
+
+    if output_path.exists():
+        fatal(f"O arquivo de saída {str(output_path)!r} já existe. Por favor, escolha um caminho diferente ou remova o arquivo existente.")
+
+    input_format = file_format(input_path)
+    output_format = file_format(output_path)
+
+    df = pd.read_csv(input_path, dtype=str) if input_format is FileFormat.CSV else pd.read_excel(input_path, dtype=str)
+
+    missing = [column for column in args.columns if column not in df.columns]
+
+    if missing:
+        fatal(f"Coluna(s) ausente(s) em {input_path.name}: {', '.join(missing)}.")
+
+    texts = df[args.columns].fillna("").agg(" ".join, axis=1).tolist()
+
+    logger.info("Procurando quase duplicados em %d linha(s) de %s (limiar %.2f)...", len(texts), input_path.name, args.threshold)
+
+    started_at = perf_counter()
+
+    try:
+        matches = find_near_duplicates(texts, threshold=args.threshold)
+    except ValueError as e:
+        fatal(str(e))
+
+    seconds = perf_counter() - started_at
+    duplicated = pd.Series([match is not None for match in matches], index=df.index)
+
+    logger.info(
+        "%d quase duplicado(s) encontrado(s) em %.2f s (%.0f µs/linha).",
+        int(duplicated.sum()),
+        seconds,
+        seconds / len(texts) * 1e6 if texts else 0.0,
+    )
+
+    if args.mark:
+        ids = df[args.id_column].tolist() if args.id_column in df.columns else list(range(len(df)))
+        df[NEAR_DUPLICATE_COLUMN] = [ids[match] if match is not None else None for match in matches]
+    else:
+        df = df[~duplicated]
+
+    if output_format is FileFormat.CSV:
+        df.to_csv(output_path, index=False)
+    else:
+        df.to_excel(output_path, index=False)
+
+    logger.info("%d linha(s) gravada(s) em %s.", len(df), output_path)
+
+
+def file_format(path: Path) -> FileFormat:
+    """
+    Deduz o formato de um arquivo pela extensão.
+
+    Args:
+        path (Path): Caminho do arquivo.
+
+    Returns:
+        FileFormat: Formato correspondente à extensão.
+    """
+
+    try:
+        return FileFormat(path.suffix.lstrip(".").lower())
+    except ValueError:
+        fatal(f"Extensão não suportada em {path.name!r}; use {', '.join(f'.{fmt.value}' for fmt in FileFormat)}.")
+
+
+def fatal(message: str) -> NoReturn:
+    """
+    Aborta a remoção de quase duplicados registrando o motivo.
+
+    Args:
+        message (str): Mensagem descritiva do erro irrecuperável.
+    """
+
+    logger.fatal(message)
+    exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nRemoção de quase duplicados interrompida pelo usuário.")
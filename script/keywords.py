@@ -0,0 +1,141 @@
+"""Script CLI de atribuição local de palavras-chave em exportações existentes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from sys import argv, exit
+from time import perf_counter
+from typing import NoReturn
+
+import pandas as pd
+
+from sa.file import FileFormat
+from sa.logger import create_logger
+from sa.nlp import KeywordMatcher, load_keywords
+from sa.parser import parse_keywords_args
+
+logger = create_logger(__name__)
+
+KEYWORDS_COLUMN = "matched_keywords"
+"""Coluna acrescentada com as palavras-chave encontradas em cada linha, separadas por `VALUE_SEPARATOR`."""
+
+POLARITIES_COLUMN = "matched_polarities"
+"""Coluna acrescentada com as polaridades das palavras-chave encontradas em cada linha, separadas por `VALUE_SEPARATOR`."""
+
+VALUE_SEPARATOR = ";"
+"""Separador dos valores nas colunas acrescentadas."""
+
+
+def main() -> None:
+    """
+    Acrescenta a uma exportação as palavras-chave e polaridades presentes no texto de cada linha.
+
+    Passos:
+    - Lê o CSV de palavras-chave e compila um único `KeywordMatcher` (Aho-Corasick) para todas elas.
+    - Lê a exportação inteira (CSV ou XLSX, pela extensão).
+    - Concatena as colunas `--columns` de cada linha e localiza todas as palavras-chave em uma passada.
+    - Grava as linhas com as colunas `matched_keywords` e `matched_polarities` (ou, com `--only-matched`,
+      apenas as linhas com ao menos uma palavra-chave).
+    """
+
+    args = parse_keywords_args(argv[1:])
+
+    input_path = args.input_path.resolve()
+    output_path = args.output_path.resolve()
+
+    for path in (input_path, args.keywords):
+        if not path.exists():
+            fatal(f"O arquivo de entrada {str(path)!r} não existe.")
+
+    if output_path.exists():
+        fatal(f"O arquivo de saída {str(output_path)!r} já existe. Por favor, escolha um caminho diferente ou remova o arquivo existente.")
+
+    input_format = file_format(input_path)
+    output_format = file_format(output_path)
+
+    try:
+        matcher = KeywordMatcher(load_keywords(args.keywords))
+    except KeyError as e:
+        fatal(f"Coluna ausente em {args.keywords.name}: {e}.")
+    except ValueError as e:
+        fatal(f"Polaridade inválida em {args.keywords.name}: {e}")
+
+    df = pd.read_csv(input_path, dtype=str) if input_format is FileFormat.CSV else pd.read_excel(input_path, dtype=str)
+
+    missing = [column for column in args.columns if column not in df.columns]
+
+    if missing:
+        fatal(f"Coluna(s) ausente(s) em {input_path.name}: {', '.join(missing)}.")
+
+    texts = df[args.columns].fillna("").agg(" ".join, axis=1).tolist()
+
+    logger.info("Procurando %d palavra(s)-chave em %d linha(s) de %s...", len(matcher), len(texts), input_path.name)
+
+    started_at = perf_counter()
+    keywords: list[str] = []
+    polarities: list[str] = []
+
+    for text in texts:
+        matches = matcher.find(text)
+
+        keywords.append(VALUE_SEPARATOR.join(dict.fromkeys(match.keyword for match in matches)))
+        polarities.append(VALUE_SEPARATOR.join(dict.fromkeys(match.polarity.value for match in matches if match.polarity is not None)))
+
+    seconds = perf_counter() - started_at
+
+    df[KEYWORDS_COLUMN] = keywords
+    df[POLARITIES_COLUMN] = polarities
+    matched = df[KEYWORDS_COLUMN] != ""
+
+    logger.info(
+        "%d linha(s) com palavras-chave em %.2f s (%.0f µs/linha).",
+        int(matched.sum()),
+        seconds,
+        seconds / len(texts) * 1e6 if texts else 0.0,
+    )
+
+    if args.only_matched:
+        df = df[matched]
+
+    if output_format is FileFormat.CSV:
+        df.to_csv(output_path, index=False)
+    else:
+        df.to_excel(output_path, index=False)
+
+    logger.info("%d linha(s) gravada(s) em %s.", len(df), output_path)
+
+
+def file_format(path: Path) -> FileFormat:
+    """
+    Deduz o formato de um arquivo pela extensão.
+
+    Args:
+        path (Path): Caminho do arquivo.
+
+    Returns:
+        FileFormat: Formato correspondente à extensão.
+    """
+
+    try:
+        return FileFormat(path.suffix.lstrip(".").lower())
+    except ValueError:
+        fatal(f"Extensão não suportada em {path.name!r}; use {', '.join(f'.{fmt.value}' for fmt in FileFormat)}.")
+
+
+def fatal(message: str) -> NoReturn:
+    """
+    Aborta a atribuição de palavras-chave registrando o motivo.
+
+    Args:
+        message (str): Mensagem descritiva do erro irrecuperável.
+    """
+
+    logger.fatal(message)
+    exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nAtribuição de palavras-chave interrompida pelo usuário.")
@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import math
 import os
+from datetime import timedelta
+from pathlib import Path
 from sys import argv, exit
+from time import perf_counter
 from typing import TYPE_CHECKING, NoReturn
 
 from dotenv import load_dotenv
 
-from sa.client import create_reddit_client
-from sa.collector import RedditCollector
-from sa.file import CSVPostSaver, FileFormat, XLSXPostSaver
-from sa.logger import create_logger, create_reddit_logger
+from sa.client import (
+    RecordingRedditClient,
+    RedditClient,
+    ReplayRedditClient,
+    RequestScheduler,
+    ScheduledRedditClient,
+    create_reddit_client,
+    estimate_search_requests,
+)
+from sa.collector import MULTIREDDIT_SEPARATOR, CollectionJournal, ConcurrentRedditCollector, SQLiteDedupIndex, WatermarkStore
+from sa.file import DEFAULT_CHUNK_SIZE, ChunkedPostWriter, CSVPostWriter, FileFormat, XLSXPostWriter
+from sa.logger import StageTimer, create_logger, create_reddit_logger
 from sa.model import Language, Polarity
+from sa.nlp import LanguageCache, NearDuplicateIndex
 from sa.parser import parse_reddit_args
+from sa.sentiment import Lexicon, SentimentScorer
 
 if TYPE_CHECKING:
-    from sa.model import KeywordsByPolarity, PostRecord
+    from sa.client import RedditClientProtocol
+    from sa.model import KeywordsByPolarity
 
 DEFAULT_KEYWORDS: "KeywordsByPolarity" = {
     Polarity.POSITIVE: ["amo", "feliz", "alegre", "adoro"],
@@ -25,6 +40,12 @@ DEFAULT_KEYWORDS: "KeywordsByPolarity" = {
 }
 """Lexo/Tag Matrix padrão injetado no collector quando submetido a execução limpa para iniciar a amostragem."""
 
+JOURNAL_SUFFIX = ".journal"
+"""Sufixo acrescentado ao caminho de saída para compor o arquivo de journal de checkpoint."""
+
+PARTIAL_SUFFIX = ".partial"
+"""Sufixo do arquivo escrito durante a coleta, renomeado para o caminho de saída apenas ao final com sucesso."""
+
 
 logger = create_logger(__name__)
 
@@ -34,12 +55,237 @@ def main() -> None:
     Inicializador transacional do script encarregado da captura em série das chamadas Crawler.
 
     Passos essenciais orquestrados sequencialmente:
-    - Importa metadados rígidos dotEnv para proteger tokens e AppSecrets da API PRAW.
+    - Importa metadados rígidos dotEnv para proteger tokens e AppSecrets da API PRAW (dispensados com `--replay`, que reproduz um cassete offline).
+    - Com `--record`, grava as buscas feitas à API em um cassete reproduzível.
     - Restringe caminhos sobrescrevíveis pra evitar sobregravações.
     - Cria Conectores Wrapper que efetuam handshakes do protocolo OAuth2 perante aos servidores Reddit.
-    - Itera sobre N comunindades (subreddits) fornecidas chamando instancias isoladas de Loggers e Scraping Engines independentes.
-    - Funde, estende dados agregando massivamente os registros a uma estrutura Array (`all_posts_`).
-    - Exclusivamente no fim de todos fechamentos, subem arquivos gerados ao disco usando classes abstratas (CSV/XLSX) formatados via Pandas O(n).
+    - Coleta as N comunidades (subreddits) fornecidas em paralelo (`--workers`), com Loggers isolados por subreddit e deduplicação compartilhada.
+    - Funde os fluxos de cada subreddit e os encaminha, post a post, a um escritor incremental que descarrega em blocos.
+    - Com `--keywords-per-query` e `--multireddit`, agrupa palavras-chave e subreddits em menos buscas ao Reddit.
+    - Com `--profile`, mede tempo, chamadas e vazão de cada etapa (busca, normalização, idioma, exportação) e imprime um resumo.
+    - Com `--rpm`, submete as buscas a um orçamento global de requisições por minuto e registra o tempo estimado de conclusão.
+    - Com `--language-cache`, reaproveita os idiomas já detectados em execuções anteriores (por hash do texto).
+    - Com `--score`, pontua o sentimento de cada bloco exportado por léxico (opcionalmente `--lexicon`) e grava a coluna `sentiment`.
+    - Com `--watermarks`, interrompe cada busca ao alcançar posts da execução anterior (coleta incremental).
+    - Registra cada post aceito e cada unidade (subreddit, polaridade, palavra-chave) concluída em um journal durável, retomável via `--resume`.
+    - A escrita ocorre em `<output>.partial` (CSV/XLSX, blocos formatados via Pandas), renomeado para o destino apenas ao final com sucesso.
+
+    Raises:
+        - KeyError: Irá fatalizar se token dotEnv ausente (exceto com `--replay`).
+    """
+
+    args = parse_reddit_args(argv[1:])
+
+    if args.output.exists():
+        fatal(f"O arquivo de saída {str(args.output)!r} já existe. Por favor, escolha um caminho diferente ou remova o arquivo existente.")
+
+    journal_path = args.output.with_name(args.output.name + JOURNAL_SUFFIX).resolve()
+
+    try:
+        journal = CollectionJournal(journal_path, resume=args.resume)
+    except FileExistsError:
+        fatal(f"Existe uma coleta interrompida em {str(journal_path)!r}. Use --resume para retomá-la ou remova o arquivo.")
+
+    if args.resume:
+        logger.info("Retomando coleta a partir do journal %s...", journal_path)
+
+    reddit_client: RedditClientProtocol
+    recorder: RecordingRedditClient | None = None
+
+    if args.replay:
+        try:
+            replay_client = ReplayRedditClient(args.replay.resolve(), latency=args.replay_latency)
+        except (FileNotFoundError, ValueError) as e:
+            fatal(f"erro ao carregar o cassete {str(args.replay)!r}: {e}")
+
+        logger.info("Reproduzindo %d busca(s) gravada(s) em %s (sem acesso à API).", len(replay_client), args.replay)
+
+        reddit_client = replay_client
+    else:
+        reddit_client = connect()
+
+        if args.record:
+            logger.info("Gravando as buscas no cassete %s...", args.record)
+
+            reddit_client = recorder = RecordingRedditClient(reddit_client, args.record.resolve())
+
+    scheduler: RequestScheduler | None = None
+
+    if args.rpm is not None:
+        try:
+            scheduler = RequestScheduler(args.rpm)
+        except ValueError as e:
+            fatal(str(e))
+
+        reddit_client = ScheduledRedditClient(reddit_client, scheduler)
+
+    # Confirmado apenas após a exportação, para não marcar como coletados posts que nunca chegaram ao disco
+    dedup_index = SQLiteDedupIndex(args.index.resolve(), commit_every=None) if args.index else None
+
+    if dedup_index is not None:
+        logger.info("Índice de deduplicação %s carregado com %d conteúdo(s).", args.index, len(dedup_index))
+
+    watermarks = WatermarkStore(args.watermarks.resolve()) if args.watermarks else None
+
+    language_cache = LanguageCache(args.language_cache.resolve()) if args.language_cache else None
+
+    if language_cache is not None:
+        logger.info("Cache de idiomas %s carregado com %d detecção(ões).", args.language_cache, len(language_cache))
+
+    near_duplicates: NearDuplicateIndex[str] | None = None
+
+    if args.near_duplicates is not None:
+        try:
+            near_duplicates = NearDuplicateIndex(args.near_duplicates)
+        except ValueError as e:
+            fatal(str(e))
+
+        logger.info("Descartando quase duplicados com %r.", near_duplicates)
+
+    timer = StageTimer() if args.profile else None
+
+    subreddit_names = [MULTIREDDIT_SEPARATOR.join(args.subreddits)] if args.multireddit else args.subreddits
+
+    try:
+        scrapper = ConcurrentRedditCollector(
+            reddit_client=reddit_client,
+            subreddit_names=subreddit_names,
+            max_workers=args.workers,
+            logger_factory=create_reddit_logger,
+            dedup_index=dedup_index,
+            journal=journal,
+            watermarks=watermarks,
+            keywords_per_query=args.keywords_per_query,
+            timer=timer,
+            language_detector=args.language_detector,
+            language_cache=language_cache,
+            near_duplicates=near_duplicates,
+        )
+    except ValueError as e:
+        fatal(str(e))
+
+    logger.info("Coletando %s com %d worker(s)...", ", ".join(f"r/{name}" for name in subreddit_names), args.workers)
+
+    if scheduler:
+        searches = len(subreddit_names) * sum(math.ceil(len(words) / args.keywords_per_query) for words in DEFAULT_KEYWORDS.values())
+        requests = estimate_search_requests(args.total, searches)
+
+        logger.info(
+            "Orçamento de %.0f requisições/min: até %d requisição(ões) em %d busca(s), término estimado em %s.",
+            scheduler.requests_per_minute,
+            requests,
+            searches,
+            timedelta(seconds=round(scheduler.estimate_seconds(requests))),
+        )
+
+    scorer: SentimentScorer | None = None
+
+    if args.score or args.lexicon:
+        try:
+            lexicon = Lexicon.from_file(args.lexicon.resolve()) if args.lexicon else Lexicon.default()
+        except (OSError, ValueError) as e:
+            fatal(f"erro ao carregar o léxico {str(args.lexicon)!r}: {e}")
+
+        scorer = SentimentScorer(lexicon)
+
+        logger.info("Pontuando o sentimento dos posts exportados com %r.", lexicon)
+
+    partial_path = args.output.with_name(args.output.name + PARTIAL_SUFFIX).resolve()
+    writer = create_writer(partial_path, args.format, timer, scorer)
+
+    # Só uma exceção ou Ctrl-C deixa a coleta incompleta; terminar sem posts novos é normal em execuções incrementais
+    completed = False
+    started_at = perf_counter()
+
+    try:
+        # Os posts seguem do gerador direto para o escritor em blocos, sem acumular a coleta em memória
+        with writer:
+            try:
+                for post in scrapper.collect(
+                    ckw=DEFAULT_KEYWORDS,
+                    lang=Language(args.language),
+                    total_per_word=args.total,
+                ):
+                    writer.write(post)
+            except KeyError as e:
+                # Com --replay, uma busca fora do cassete significa parâmetros diferentes dos da gravação
+                if not args.replay:
+                    raise
+
+                fatal(f"o cassete {str(args.replay)!r} não cobre esta coleta ({e.args[0]}); use os mesmos parâmetros da gravação")
+
+        completed = True
+
+        logger.info("Coleta finalizada. Total de posts: %d", writer.written)
+
+        if scheduler:
+            logger.info("Requisições de busca realizadas: %d", scheduler.requests_made)
+
+        logger.info(
+            "Posts recebidos: %d | normalizados: %d | descartados antes do NLP: %d (índice: %d, id repetido: %d, texto repetido: %d)",
+            scrapper.stats.fetched,
+            scrapper.stats.normalized,
+            scrapper.stats.skipped,
+            scrapper.stats.skipped_indexed,
+            scrapper.stats.skipped_seen,
+            scrapper.stats.skipped_raw_duplicate,
+        )
+
+        if near_duplicates is not None:
+            logger.info(
+                "Quase duplicados descartados: %d (%d post(s) no índice).",
+                scrapper.stats.rejected_near_duplicate,
+                len(near_duplicates),
+            )
+
+        if language_cache is not None:
+            logger.info(
+                "Cache de idiomas: %d texto(s) reaproveitado(s) e %d detectado(s) (%.1f%% de acerto).",
+                language_cache.hits,
+                language_cache.misses,
+                language_cache.hit_rate * 100,
+            )
+
+        if timer:
+            elapsed = perf_counter() - started_at
+
+            logger.info("Tempo por etapa (somado entre workers):\n%s", timer.summary())
+            logger.info("Tempo total: %.3f s | vazão: %.1f posts/s", elapsed, writer.written / elapsed if elapsed > 0 else 0.0)
+
+        if writer.written:
+            partial_path.replace(args.output.resolve())
+
+            logger.info("Dados exportados com sucesso em %s", args.output.resolve())
+        else:
+            logger.warning("Nenhum post novo para exportar.")
+
+        if watermarks:
+            watermarks.save()
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+        if recorder is not None:
+            logger.info("%d busca(s) gravada(s) no cassete %s.", recorder.recorded, args.record)
+
+        if dedup_index is not None:
+            dedup_index.close(commit=completed)
+
+        if language_cache is not None:
+            language_cache.close()
+
+        if completed:
+            journal.remove()
+        else:
+            journal.close()
+            logger.warning("Progresso preservado em %s. Use --resume para retomar a coleta.", journal_path)
+
+
+def connect() -> RedditClient:
+    """
+    Cria o cliente autenticado da API do Reddit com as credenciais do `.env`.
+
+    Returns:
+        RedditClient: Cliente PRAW autenticado.
 
     Raises:
         - KeyError: Irá fatalizar se token dotEnv ausente.
@@ -54,57 +300,43 @@ def main() -> None:
     except KeyError as e:
         fatal(f"erro ao carregar a variável de ambiente {e}")
 
-    args = parse_reddit_args(argv[1:])
-
-    if args.output.exists():
-        fatal(f"O arquivo de saída {str(args.output)!r} já existe. Por favor, escolha um caminho diferente ou remova o arquivo existente.")
-
-    reddit_client = create_reddit_client(
+    return create_reddit_client(
         reddit_client_id,
         reddit_client_secret,
         reddit_client_user_agent,
     )
 
-    all_posts: list[PostRecord] = []
 
-    for subreddit in args.subreddits:
-        subreddit_logger = create_reddit_logger(subreddit)
-
-        scrapper = RedditCollector(
-            reddit_client=reddit_client,
-            subreddit_name=subreddit,
-            logger=subreddit_logger,
-        )
-
-        subreddit_logger.info("Iniciando a coleta de posts  do subredit %s...", subreddit)
-
-        subreddit_posts = list(
-            scrapper.collect(
-                ckw=DEFAULT_KEYWORDS,
-                lang=Language(args.language),
-                total_per_word=args.total,
-            )
-        )
-
-        subreddit_logger.info("Coleta do subredit %s finalizada. Total de posts: %d", subreddit, len(subreddit_posts))
+def create_writer(
+    output_filepath: Path,
+    file_format: FileFormat,
+    timer: StageTimer | None = None,
+    scorer: SentimentScorer | None = None,
+) -> ChunkedPostWriter:
+    """
+    Cria o escritor incremental correspondente ao formato solicitado.
 
-        all_posts.extend(subreddit_posts)
+    Args:
+        output_filepath (Path): Caminho resolvido do arquivo a ser escrito.
+        file_format (FileFormat): Formato do arquivo de saída.
+        timer (StageTimer | None, optional): Temporizador da etapa ``export``, se a instrumentação estiver ativa.
+        scorer (SentimentScorer | None, optional): Pontuador que acrescenta a coluna de sentimento a cada bloco.
 
-    output_filepath = args.output.resolve()
+    Returns:
+        ChunkedPostWriter: Escritor que grava os posts em blocos de `DEFAULT_CHUNK_SIZE`.
+    """
 
-    match args.format:
+    match file_format:
         case FileFormat.CSV:
-            logger.info("Exportando dados para CSV...")
+            logger.info("Exportando dados para CSV em blocos de %d posts...", DEFAULT_CHUNK_SIZE)
 
-            CSVPostSaver(output_filepath).save(all_posts)
+            return CSVPostWriter(output_filepath, timer=timer, scorer=scorer)
         case FileFormat.XLSX:
-            logger.info("Exportando dados para XLSX...")
+            logger.info("Exportando dados para XLSX em blocos de %d posts...", DEFAULT_CHUNK_SIZE)
 
-            XLSXPostSaver(output_filepath).save(all_posts)
+            return XLSXPostWriter(output_filepath, timer=timer, scorer=scorer)
         case _:
-            logger.error("Formato de armazenamento desconhecido: %s", args.format)
-
-    logger.info("Dados exportados com sucesso em %s", output_filepath)
+            fatal(f"Formato de armazenamento desconhecido: {file_format}")
 
 
 def fatal(message: str) -> NoReturn:
@@ -0,0 +1,181 @@
+"""Script CLI de treino e avaliação do classificador de polaridade sobre um corpus rotulado."""
+
+from __future__ import annotations
+
+from sys import argv, exit
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterator, NoReturn
+
+import numpy as np
+import pandas as pd
+
+from sa.logger import create_logger
+from sa.parser import parse_train_args
+from sa.sentiment import NaiveBayesClassifier, PolarityClassifier
+
+if TYPE_CHECKING:
+    from sa.parser import TrainParserNamespace
+
+logger = create_logger(__name__)
+
+
+def main() -> None:
+    """
+    Treina o classificador de polaridade e o avalia em uma fração reservada do corpus.
+
+    Passos:
+    - Lê o CSV rotulado em blocos de `--chunk-size` linhas, sem carregar o corpus inteiro.
+    - Sorteia (com `--seed`) a fração `--holdout` de cada bloco para avaliação e acumula o restante
+      ao modelo com `partial_fit` (Naive Bayes multinomial sobre bag-of-words).
+    - Grava o modelo em `--output-dir` (matrizes `.npy` carregáveis com memory-map).
+    - Relê o corpus, prediz os posts reservados em lote e reporta acurácia, precisão, revocação e F1 por classe.
+    """
+
+    args = parse_train_args(argv[1:])
+
+    input_path = args.input_path.resolve()
+
+    if not input_path.exists():
+        fatal(f"O corpus {str(input_path)!r} não existe.")
+
+    if not 0 <= args.holdout < 1:
+        fatal("A fração de avaliação (--holdout) deve estar entre 0 (inclusive) e 1.")
+
+    try:
+        model = NaiveBayesClassifier(alpha=args.alpha)
+    except ValueError as e:
+        fatal(str(e))
+
+    classifier = PolarityClassifier(model=model)
+
+    logger.info("Treinando sobre %s (coluna %r, rótulos em %r)...", input_path.name, args.text_column, args.label_column)
+
+    started_at = perf_counter()
+    trained = 0
+
+    for documents, labels, holdout in read_corpus(args):
+        train = ~holdout
+
+        classifier.partial_fit([documents[i] for i in np.flatnonzero(train)], labels[train].tolist())
+        trained += int(train.sum())
+
+    train_seconds = perf_counter() - started_at
+
+    if not trained:
+        fatal("Nenhum post rotulado disponível para o treino.")
+
+    logger.info(
+        "Treino concluído em %.2f s: %d post(s), %d termo(s), classes %s (%.0f posts/s).",
+        train_seconds,
+        trained,
+        len(classifier.vocabulary),
+        ", ".join(classifier.classes),
+        trained / train_seconds if train_seconds > 0 else 0.0,
+    )
+
+    output_dir = args.output_dir.resolve()
+    classifier.save(output_dir)
+
+    started_at = perf_counter()
+    classifier = PolarityClassifier.load(output_dir)
+
+    logger.info("Modelo gravado em %s (recarregado com memory-map em %.1f ms).", output_dir, (perf_counter() - started_at) * 1000)
+
+    if args.holdout > 0:
+        evaluate(classifier, args)
+
+
+def read_corpus(args: TrainParserNamespace) -> Iterator[tuple[list[list[str]], np.ndarray, np.ndarray]]:
+    """
+    Lê o corpus rotulado em blocos, sorteando os posts reservados para avaliação.
+
+    O sorteio usa um gerador com semente fixa consumido bloco a bloco, de modo que duas leituras
+    com os mesmos argumentos reservam exatamente os mesmos posts (treino e avaliação não se misturam).
+
+    Args:
+        args (TrainParserNamespace): Argumentos do treino.
+
+    Yields:
+        tuple[list[list[str]], np.ndarray, np.ndarray]: Tokens de cada post, rótulos e a máscara dos reservados.
+    """
+
+    rng = np.random.default_rng(args.seed)
+
+    try:
+        chunks = pd.read_csv(args.input_path, usecols=[args.text_column, args.label_column], dtype=str, chunksize=args.chunk_size)
+
+        for chunk in chunks:
+            chunk = chunk.dropna(subset=[args.label_column])
+            documents = chunk[args.text_column].fillna("").str.split().tolist()
+            labels = chunk[args.label_column].to_numpy(dtype=object)
+
+            yield documents, labels, rng.random(len(chunk)) < args.holdout
+    except ValueError as e:
+        fatal(f"erro ao ler o corpus {str(args.input_path)!r}: {e}")
+
+
+def evaluate(classifier: PolarityClassifier, args: TrainParserNamespace) -> None:
+    """
+    Prediz os posts reservados e reporta as métricas de classificação.
+
+    Args:
+        classifier (PolarityClassifier): Classificador treinado.
+        args (TrainParserNamespace): Argumentos do treino (os mesmos da leitura de treino).
+    """
+
+    classes = classifier.classes
+    confusion = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    index = {label: i for i, label in enumerate(classes)}
+
+    started_at = perf_counter()
+
+    for documents, labels, holdout in read_corpus(args):
+        selected = np.flatnonzero(holdout)
+
+        if selected.size == 0:
+            continue
+
+        predicted = classifier.predict([documents[i] for i in selected])
+
+        for expected, label in zip(labels[selected], predicted):
+            if expected in index:
+                confusion[index[expected], index[label]] += 1
+
+    evaluated = int(confusion.sum())
+    seconds = perf_counter() - started_at
+
+    if not evaluated:
+        logger.warning("Nenhum post reservado para avaliação; aumente --holdout.")
+        return
+
+    logger.info("Avaliação: %d post(s) em %.2f s, acurácia %.1f%%.", evaluated, seconds, np.trace(confusion) / evaluated * 100)
+    logger.info("%-12s %9s %9s %9s %8s", "classe", "precisão", "revocação", "f1", "posts")
+
+    for i, label in enumerate(classes):
+        predicted_total = confusion[:, i].sum()
+        actual_total = confusion[i].sum()
+
+        precision = confusion[i, i] / predicted_total if predicted_total else 0.0
+        recall = confusion[i, i] / actual_total if actual_total else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+        logger.info("%-12s %8.1f%% %8.1f%% %8.1f%% %8d", label, precision * 100, recall * 100, f1 * 100, actual_total)
+
+
+def fatal(message: str) -> NoReturn:
+    """
+    Aborta o treino registrando o motivo.
+
+    Args:
+        message (str): Mensagem descritiva do erro irrecuperável.
+    """
+
+    logger.fatal(message)
+    exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nTreino interrompido pelo usuário.")
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
-from collections import Counter
+from contextlib import nullcontext
 from sys import argv, exit
-from typing import NoReturn
-
-import spacy
+from typing import TYPE_CHECKING, NoReturn
 
 from sa.file import XLSXColumnReader
 from sa.logger import create_logger
-from sa.nlp import build_stopwords, preprocess_text
+from sa.nlp import (
+    DEFAULT_SPACY_MODEL,
+    NGramCounter,
+    PipelineProfile,
+    PreprocessCache,
+    PreprocessPool,
+    TokenCorpusCache,
+    load_pipeline,
+    load_stopwords,
+    pipeline_info,
+    preprocess_texts,
+    token_cache_fingerprint,
+)
 from sa.parser import parse_wordcloud_args
 from sa.visualization import generate_frequency_chart, generate_wordcloud
 
+if TYPE_CHECKING:
+    from spacy.language import Language as SpacyLanguage
+
 COLORMAPS: dict[str, str] = {
     "positivo": "viridis",
     "negativo": "plasma",
@@ -36,10 +49,11 @@ def main() -> None:
     """
     Rotina construtora central iterável produtora do motor final visual da pipeline (View Script CLI).
 
-    Atribui primeiramente restrições estruturais CLI. Aciona motor pesada de redes neurais carregando o SpaCy LG core em memoria principal. Fabrica Set de stopwords, então itera ciclicamente as abas lidas, pre-processando via Lematização tokenizada com filtragem `visual_pos (NOUN e ADJ)` o Corpus textual massivo agrupando os outputs estáticos via counter para extração iteradora dos utilitários `generate_frequency_chart` e `generate_wordcloud`.
+    Atribui primeiramente restrições estruturais CLI. Aciona motor pesada de redes neurais carregando o SpaCy LG core em memoria principal. Fabrica Set de stopwords, então itera ciclicamente as abas lidas, pre-processando em lotes (`nlp.pipe`, com `--batch-size`, distribuídos entre `--processes` processos com um modelo cada, reaproveitando textos repetidos via `--cache-size`) via Lematização tokenizada com filtragem `visual_pos (NOUN e ADJ)` o Corpus textual massivo contando os n-gramas de ordem `--ngram` texto a texto (`NGramCounter`, sem concatenar o corpus) para extração iteradora dos utilitários `generate_frequency_chart` e `generate_wordcloud`.
 
     Observações:
-        - Carrega dependência "pt_core_news_lg" estática consumindo memória no build.
+        - Carrega dependência "pt_core_news_lg" no perfil `LEMMA_POS` (sem parser e NER), reduzindo CPU e memória.
+        - Com `--processes` diferente de 1, o modelo é carregado apenas nos processos de trabalho; o cache de tokens usa os metadados dele (`pipeline_info`).
         - Filtra apenas por Substantivos e Adjetivos, para aprimorar o contexto visual dos sentimentos gerados em plot.
     """
 
@@ -53,55 +67,140 @@ def main() -> None:
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    logger.info("Carregando modelo spaCy...")
-
-    nlp = spacy.load("pt_core_news_lg")
-
-    logger.info("Construindo stopwords...")
+    logger.info("Carregando stopwords...")
 
-    stopwords = build_stopwords(lang="portuguese", extras_path=args.extras)
+    # Compiladas uma única vez por composição (idioma, checksum dos extras); depois, apenas lidas do disco
+    stopwords = load_stopwords(lang="portuguese", extras_path=args.extras, cache_dir=None if args.rebuild_stopwords else args.stopwords_cache)
 
     visual_pos = {"NOUN", "ADJ"}
 
-    for sheet in args.sheets:
-        logger.info("Processando aba '%s'...", sheet)
-
-        reader = XLSXColumnReader(input_path, sheet_name=sheet, column="texto")
-
-        try:
-            texts = reader.read()
-        except KeyError:
-            logger.warning("Aba '%s' não possui coluna 'texto'. Pulando.", sheet)
-            continue
-
-        cleaned_texts = [preprocess_text(t, stopwords, nlp, allowed_pos=visual_pos) for t in texts]
-        combined = " ".join(" ".join(t) for t in cleaned_texts)
-
-        if not combined.strip():
-            logger.warning("Nenhum texto restante após limpeza na aba '%s'. Pulando.", sheet)
-
-            continue
-
-        word_counts = Counter(combined.split()).most_common(args.top_n)
-
-        colormap = COLORMAPS.get(sheet, "viridis")
-        bar_color = BAR_COLORS.get(sheet, "steelblue")
-
-        wc_path = output_dir / f"nuvem_{sheet}.png"
-
-        generate_wordcloud(combined, wc_path, colormap=colormap)
-
-        logger.info("Nuvem de palavras salva em %s", wc_path)
-
-        chart_path = output_dir / f"frequencia_{sheet}.png"
+    # Um modelo por processo, carregado uma única vez e reaproveitado por todas as abas
+    pool: PreprocessPool | None = None
+
+    if args.processes != 1:
+        pool = PreprocessPool(
+            stopwords,
+            DEFAULT_SPACY_MODEL,
+            PipelineProfile.LEMMA_POS,
+            allowed_pos=visual_pos,
+            workers=args.processes,
+            batch_size=args.batch_size,
+            cache_size=args.cache_size,
+        )
 
-        generate_frequency_chart(word_counts, chart_path, color=bar_color)
+        logger.info("Pré-processamento distribuído entre %d processo(s).", pool.workers)
 
-        logger.info("Gráfico de frequência salvo em %s", chart_path)
-        logger.info("Top %d palavras para '%s':", args.top_n, sheet)
+    # Com o pool, apenas os processos de trabalho carregam o modelo: o principal não guarda uma cópia ociosa
+    nlp: SpacyLanguage | None = None
+
+    if pool is None:
+        logger.info("Carregando modelo spaCy...")
 
-        for word, freq in word_counts:
-            logger.info("  %-15s | %d", word, freq)
+        # Apenas lemma_ e pos_ são lidos: parser e NER ficam fora da carga
+        nlp = load_pipeline(DEFAULT_SPACY_MODEL, PipelineProfile.LEMMA_POS)
+
+    # Compartilhado entre abas: o mesmo post costuma aparecer em mais de uma (com o pool, cada processo tem o seu)
+    cache = PreprocessCache(maxsize=args.cache_size) if args.cache_size > 0 and pool is None else None
+
+    # Persistente entre execuções: apenas linhas novas ou alteradas passam pelo spaCy
+    token_cache: TokenCorpusCache | None = None
+
+    if args.token_cache is not None:
+        # Sem o modelo no processo principal, a identidade dele vem apenas do meta.json
+        model = nlp if nlp is not None else pipeline_info(DEFAULT_SPACY_MODEL, PipelineProfile.LEMMA_POS)
+        fingerprint = token_cache_fingerprint(stopwords, model, visual_pos)
+        token_cache = TokenCorpusCache(args.token_cache, fingerprint, load=not args.rebuild_tokens)
+
+        logger.info("Cache de tokens %s carregado com %d texto(s).", token_cache.path, len(token_cache))
+
+    # Encerrado ao sair do bloco, inclusive por erro ou Ctrl-C (que cancela os blocos pendentes)
+    with pool if pool is not None else nullcontext():
+        for sheet in args.sheets:
+            logger.info("Processando aba '%s'...", sheet)
+
+            reader = XLSXColumnReader(input_path, sheet_name=sheet, column="texto")
+
+            try:
+                texts = reader.read()
+            except KeyError:
+                logger.warning("Aba '%s' não possui coluna 'texto'. Pulando.", sheet)
+                continue
+
+            ngrams = NGramCounter([args.ngram])
+
+            if token_cache is not None:
+                ngrams.update_many(
+                    token_cache.preprocess(
+                        texts,
+                        stopwords,
+                        nlp,
+                        allowed_pos=visual_pos,
+                        batch_size=args.batch_size,
+                        cache=cache,
+                        pool=pool,
+                    )
+                )
+
+                # Gravado a cada aba: uma execução interrompida não refaz as abas já processadas
+                token_cache.save()
+            elif pool is not None:
+                # Cada processo conta os n-gramas do seu bloco; apenas as contagens parciais voltam
+                ngrams = pool.count_ngrams(texts, ngrams.orders)
+            else:
+                assert nlp is not None
+
+                ngrams.update_many(
+                    preprocess_texts(
+                        texts,
+                        stopwords,
+                        nlp,
+                        allowed_pos=visual_pos,
+                        batch_size=args.batch_size,
+                        cache=cache,
+                    )
+                )
+
+            if not ngrams.total(args.ngram):
+                logger.warning("Nenhum texto restante após limpeza na aba '%s'. Pulando.", sheet)
+
+                continue
+
+            word_counts = ngrams.most_common(args.top_n, order=args.ngram)
+
+            colormap = COLORMAPS.get(sheet, "viridis")
+            bar_color = BAR_COLORS.get(sheet, "steelblue")
+
+            wc_path = output_dir / f"nuvem_{sheet}.png"
+
+            generate_wordcloud(ngrams.frequencies(args.ngram), wc_path, colormap=colormap)
+
+            logger.info("Nuvem de palavras salva em %s", wc_path)
+
+            chart_path = output_dir / f"frequencia_{sheet}.png"
+
+            generate_frequency_chart(word_counts, chart_path, color=bar_color)
+
+            logger.info("Gráfico de frequência salvo em %s", chart_path)
+            logger.info("Top %d palavras para '%s':", args.top_n, sheet)
+
+            for word, freq in word_counts:
+                logger.info("  %-15s | %d", word, freq)
+
+    if token_cache is not None:
+        logger.info(
+            "Cache de tokens: %d texto(s) reaproveitado(s) e %d processado(s) pelo spaCy (%.1f%% de acerto).",
+            token_cache.hits,
+            token_cache.misses,
+            token_cache.hit_rate * 100,
+        )
+
+    if cache:
+        logger.info(
+            "Cache de pré-processamento: %d/%d texto(s) reaproveitado(s) (%.1f%%).",
+            cache.documents.hits,
+            cache.documents.hits + cache.documents.misses,
+            cache.documents.hit_rate * 100,
+        )
 
     logger.info("Processo finalizado com sucesso.")
 
@@ -1,4 +1,4 @@
-from . import client, collector, common, file, logger, model, nlp, parser, visualization
+from . import client, collector, common, file, logger, model, nlp, parser, sentiment, visualization
 
 __all__ = [
     "nlp",
@@ -9,6 +9,7 @@ __all__ = [
     "logger",
     "nlp",
     "parser",
+    "sentiment",
     "visualization",
     "model",
 ]
@@ -3,12 +3,26 @@ Módulo de interface com a API de redes sociais.
 
 Fornece a abstração de cliente HTTP autenticado para comunicação com a
 API pública de uma plataforma de rede social, encapsulando a biblioteca
-cliente utilizada para integração com essa API.
+cliente utilizada para integração com essa API, além do agendamento das
+requisições dentro de um orçamento global.
 """
 
+from .cassette import CassetteSubmission, RecordingRedditClient, ReplayRedditClient
+from .protocol import RedditClientProtocol, SubredditSearchProtocol
 from .reddit import RedditClient, create_reddit_client
+from .scheduler import DEFAULT_REQUESTS_PER_MINUTE, SEARCH_PAGE_SIZE, RequestScheduler, ScheduledRedditClient, estimate_search_requests
 
 __all__ = [
+    "CassetteSubmission",
     "create_reddit_client",
+    "estimate_search_requests",
+    "DEFAULT_REQUESTS_PER_MINUTE",
     "RedditClient",
+    "RedditClientProtocol",
+    "RecordingRedditClient",
+    "ReplayRedditClient",
+    "RequestScheduler",
+    "ScheduledRedditClient",
+    "SEARCH_PAGE_SIZE",
+    "SubredditSearchProtocol",
 ]
@@ -0,0 +1,358 @@
+import json
+import time
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from .scheduler import SEARCH_PAGE_SIZE
+
+if TYPE_CHECKING:
+    from .protocol import RedditClientProtocol, SubredditSearchProtocol
+
+DEFAULT_SEARCH_SORT = "relevance"
+"""Ordenação aplicada pelo PRAW quando a busca não informa ``sort``."""
+
+CassetteKey = tuple[str, str, str]
+"""Alias de tipo para a chave de uma busca gravada: ``(subreddit, consulta, ordenação)``."""
+
+
+class CassetteSubreddit:
+    """
+    Subreddit de uma submissão reproduzida, com a mesma representação textual do PRAW.
+
+    Attributes:
+        display_name (str): Nome do subreddit, sem o prefixo ``r/``.
+    """
+
+    def __init__(self, display_name: str):
+        self.display_name = display_name
+
+    def __str__(self) -> str:
+        return self.display_name
+
+
+class CassetteSubmission:
+    """
+    Submissão reproduzida a partir de um cassete, com os atributos de `praw.models.Submission` lidos pelo coletor.
+
+    Attributes:
+        id (str): Identificador do post.
+        title (str): Título bruto.
+        selftext (str): Corpo bruto.
+        author (Optional[str]): Nome do autor, ou `None` se deletado.
+        created_utc (float): Timestamp UTC (epoch) de criação.
+        subreddit (CassetteSubreddit): Subreddit de origem.
+    """
+
+    def __init__(self, post_id: str, title: str, selftext: str, author: Optional[str], created_utc: float, subreddit: str):
+        self.id = post_id
+        self.title = title
+        self.selftext = selftext
+        self.author = author
+        self.created_utc = created_utc
+        self.subreddit = CassetteSubreddit(subreddit)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CassetteSubmission":
+        """
+        Reconstrói a submissão a partir de sua forma serializada no cassete.
+
+        Args:
+            data (dict[str, Any]): Campos gravados por `dump_submission`.
+
+        Returns:
+            CassetteSubmission: Submissão pronta para ser entregue ao coletor.
+        """
+
+        return cls(data["id"], data["title"], data["selftext"], data["author"], data["created_utc"], data["subreddit"])
+
+
+def dump_submission(submission: Any) -> dict[str, Any]:
+    """
+    Extrai de uma submissão os campos consumidos pelo coletor, em forma serializável em JSON.
+
+    Args:
+        submission (Any): Submissão do PRAW (ou equivalente com os mesmos atributos).
+
+    Returns:
+        dict[str, Any]: Campos ``id``, ``title``, ``selftext``, ``author``, ``created_utc`` e ``subreddit``.
+    """
+
+    return {
+        "id": str(submission.id),
+        "title": submission.title,
+        "selftext": submission.selftext,
+        "author": str(submission.author) if submission.author else None,
+        "created_utc": float(submission.created_utc),
+        "subreddit": str(submission.subreddit),
+    }
+
+
+class _RecordingSubreddit:
+    """Subreddit que grava no cassete as submissões entregues por cada busca."""
+
+    def __init__(self, subreddit: "SubredditSearchProtocol", display_name: str, client: "RecordingRedditClient"):
+        self._subreddit = subreddit
+        self._display_name = display_name
+        self._client = client
+
+    def search(self, query: str, **generator_kwargs: Any) -> Iterator[Any]:
+        """
+        Pesquisa no subreddit real, gravando as submissões à medida que são consumidas.
+
+        Args:
+            query (str): Consulta de busca.
+            **generator_kwargs (Any): Parâmetros repassados à paginação (ex.: ``sort``, ``limit``).
+
+        Returns:
+            Iterator[Any]: Submissões do subreddit real, inalteradas.
+        """
+
+        submissions: list[dict[str, Any]] = []
+        exhausted = False
+
+        try:
+            for submission in self._subreddit.search(query, **generator_kwargs):
+                submissions.append(dump_submission(submission))
+                yield submission
+
+            exhausted = True
+        finally:
+            # Buscas interrompidas pelo coletor (marca d'água, cota atingida) são gravadas até onde foram consumidas
+            self._client.record(self._display_name, query, generator_kwargs, submissions, exhausted)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._subreddit, name)
+
+
+class RecordingRedditClient:
+    """
+    Invólucro de cliente Reddit que grava em um cassete as buscas realizadas.
+
+    Cada busca concluída (ou interrompida pelo coletor) gera uma linha JSON no cassete
+    com o subreddit, a consulta, os parâmetros da paginação e os campos das submissões
+    entregues. O cassete pode então ser servido pelo `ReplayRedditClient`, permitindo
+    executar o coletor de ponta a ponta sem credenciais nem acesso à rede.
+
+    Attributes:
+        _path (Path): Caminho do cassete (JSONL).
+
+    Observações:
+        - Apenas os campos lidos pelo coletor são gravados (ver `dump_submission`).
+        - Gravações repetidas da mesma busca são acrescentadas; na reprodução, prevalece a mais completa.
+        - O cassete é aberto em modo append apenas durante cada gravação, então não há nada a fechar.
+        - É seguro para uso entre threads.
+    """
+
+    def __init__(self, client: "RedditClientProtocol", path: str | Path):
+        """
+        Envolve o cliente, acrescentando as buscas ao cassete informado.
+
+        Args:
+            client (RedditClientProtocol): Cliente Reddit real (ou outro invólucro) a ser gravado.
+            path (str | Path): Caminho do cassete; criado se não existir.
+        """
+
+        self._client = client
+        """Cliente Reddit envolvido."""
+
+        self._path = Path(path)
+
+        self._lock = Lock()
+        """Lock que serializa as escritas no cassete."""
+
+        self.recorded = 0
+        """Quantidade de buscas gravadas."""
+
+    def subreddit(self, display_name: str) -> "SubredditSearchProtocol":
+        """
+        Obtém o subreddit do cliente envolvido, com as buscas gravadas no cassete.
+
+        Args:
+            display_name (str): Nome do subreddit, sem o prefixo ``r/``.
+
+        Returns:
+            SubredditSearchProtocol: Subreddit pesquisável que grava cada busca.
+        """
+
+        return _RecordingSubreddit(self._client.subreddit(display_name), display_name, self)
+
+    def record(self, display_name: str, query: str, params: dict[str, Any], submissions: list[dict[str, Any]], exhausted: bool) -> None:
+        """
+        Acrescenta uma busca ao cassete.
+
+        Args:
+            display_name (str): Subreddit pesquisado.
+            query (str): Consulta de busca.
+            params (dict[str, Any]): Parâmetros da paginação (``sort``, ``limit``...).
+            submissions (list[dict[str, Any]]): Submissões entregues, já serializadas.
+            exhausted (bool): Se a paginação chegou ao fim (em vez de ser interrompida).
+        """
+
+        entry = {
+            "subreddit": display_name,
+            "query": query,
+            "params": params,
+            "exhausted": exhausted,
+            "submissions": submissions,
+        }
+
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+            with self._path.open("a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+            self.recorded += 1
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+class _ReplaySubreddit:
+    """Subreddit que serve as buscas gravadas no cassete."""
+
+    def __init__(self, display_name: str, client: "ReplayRedditClient"):
+        self.display_name = display_name
+        self._client = client
+
+    def search(self, query: str, **generator_kwargs: Any) -> Iterator[CassetteSubmission]:
+        """
+        Reproduz uma busca gravada, com a latência simulada do cliente.
+
+        Args:
+            query (str): Consulta de busca.
+            **generator_kwargs (Any): Parâmetros da paginação (ex.: ``sort``, ``limit``).
+
+        Returns:
+            Iterator[CassetteSubmission]: Submissões gravadas, na ordem original.
+
+        Raises:
+            KeyError: Se a busca não foi gravada ou se for consumida além do trecho gravado
+                de uma busca interrompida.
+        """
+
+        submissions, complete = self._client.lookup(self.display_name, query, generator_kwargs)
+        latency = self._client.latency
+
+        for index, submission in enumerate(submissions):
+            # A latência simulada incide por página, como as requisições reais do PRAW
+            if latency and index % SEARCH_PAGE_SIZE == 0:
+                time.sleep(latency)
+
+            yield submission
+
+        # Uma coleta que para no mesmo ponto da gravação (ex.: marca d'água) nunca chega aqui
+        if not complete:
+            raise KeyError(f"Busca gravada apenas em parte no cassete: r/{self.display_name} {query!r} {generator_kwargs}")
+
+    def __str__(self) -> str:
+        return self.display_name
+
+
+class ReplayRedditClient:
+    """
+    Cliente Reddit local que reproduz as buscas gravadas por um `RecordingRedditClient`.
+
+    Implementa a mesma superfície consumida pelo coletor (`RedditClientProtocol`), de modo
+    que o pipeline de coleta, normalização e exportação roda de forma determinística e
+    offline, sem credenciais. Uma latência opcional por página simula o tempo de rede,
+    tornando o cliente adequado para medir a vazão do coletor.
+
+    Observações:
+        - Uma busca é encontrada pela chave ``(subreddit, consulta, ordenação)``. Ela é servida por completo se a
+          gravação cobre o ``limit`` pedido: gravou ao menos essa quantidade ou esgotou a paginação.
+        - Buscas interrompidas pelo coletor na gravação (ex.: marca d'água alcançada em uma coleta incremental)
+          servem o trecho gravado; só consumir além dele levanta `KeyError`.
+        - Buscas ausentes do cassete levantam `KeyError`, evitando resultados silenciosamente vazios.
+    """
+
+    def __init__(self, path: str | Path, latency: float = 0.0):
+        """
+        Carrega o cassete em memória.
+
+        Args:
+            path (str | Path): Caminho do cassete (JSONL) gravado anteriormente.
+            latency (float, optional): Segundos de espera simulados por página de `SEARCH_PAGE_SIZE` resultados.
+
+        Raises:
+            FileNotFoundError: Se o cassete não existir.
+            ValueError: Se `latency` for negativa.
+        """
+
+        if latency < 0:
+            raise ValueError("A latência simulada não pode ser negativa.")
+
+        self.latency = latency
+        """Segundos de espera simulados por página de resultados."""
+
+        self._searches: dict[CassetteKey, tuple[bool, list[CassetteSubmission]]] = {}
+        """Buscas gravadas por chave, com o indicador de paginação esgotada."""
+
+        with Path(path).open("r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                entry = json.loads(line)
+                key = self._key(entry["subreddit"], entry["query"], entry["params"])
+                submissions = [CassetteSubmission.from_dict(data) for data in entry["submissions"]]
+
+                previous = self._searches.get(key)
+
+                # Regravações parciais da mesma busca não substituem uma gravação mais completa
+                if previous is None or entry["exhausted"] or (not previous[0] and len(submissions) >= len(previous[1])):
+                    self._searches[key] = (entry["exhausted"], submissions)
+
+    def __len__(self) -> int:
+        return len(self._searches)
+
+    def subreddit(self, display_name: str) -> "SubredditSearchProtocol":
+        """
+        Obtém um subreddit que serve as buscas gravadas no cassete.
+
+        Args:
+            display_name (str): Nome do subreddit, sem o prefixo ``r/``.
+
+        Returns:
+            SubredditSearchProtocol: Subreddit pesquisável reproduzido.
+        """
+
+        return _ReplaySubreddit(display_name, self)
+
+    def lookup(self, display_name: str, query: str, params: dict[str, Any]) -> tuple[list[CassetteSubmission], bool]:
+        """
+        Obtém as submissões gravadas para uma busca.
+
+        Args:
+            display_name (str): Subreddit pesquisado.
+            query (str): Consulta de busca.
+            params (dict[str, Any]): Parâmetros da paginação (``sort``, ``limit``...).
+
+        Returns:
+            tuple[list[CassetteSubmission], bool]: Até ``limit`` submissões, na ordem gravada, e se
+                a gravação cobre o ``limit`` pedido (`False` para o trecho de uma busca interrompida).
+
+        Raises:
+            KeyError: Se a busca não foi gravada.
+        """
+
+        found = self._searches.get(self._key(display_name, query, params))
+
+        if found is None:
+            raise KeyError(f"Busca não gravada no cassete: r/{display_name} {query!r} {params}")
+
+        exhausted, submissions = found
+        limit: Optional[int] = params.get("limit")
+
+        if limit is None:
+            return submissions, exhausted
+
+        return submissions[:limit], exhausted or len(submissions) >= limit
+
+    def _key(self, display_name: str, query: str, params: dict[str, Any]) -> CassetteKey:
+        """Compõe a chave de uma busca a partir do subreddit, da consulta e da ordenação."""
+
+        return (display_name, query, str(params.get("sort", DEFAULT_SEARCH_SORT)))
@@ -0,0 +1,46 @@
+from typing import Any, Iterator, Protocol
+
+
+class SubredditSearchProtocol(Protocol):
+    """
+    Superfície mínima de um subreddit utilizada pelo pipeline de coleta.
+
+    Corresponde ao subconjunto de `praw.models.Subreddit` efetivamente consumido pelo
+    `RedditCollector`, permitindo substituí-lo por implementações locais (agendadas,
+    gravadas ou falsas) sem depender da API real.
+    """
+
+    def search(self, query: str, **generator_kwargs: Any) -> Iterator[Any]:
+        """
+        Pesquisa submissões no subreddit.
+
+        Args:
+            query (str): Consulta de busca (palavra-chave ou combinação com ``OR``).
+            **generator_kwargs (Any): Parâmetros repassados à paginação (ex.: ``sort``, ``limit``).
+
+        Returns:
+            Iterator[Any]: Submissões encontradas, com os atributos de `praw.models.Submission`
+                lidos pelo coletor (``id``, ``title``, ``selftext``, ``author``, ``created_utc``, ``subreddit``).
+        """
+        ...
+
+
+class RedditClientProtocol(Protocol):
+    """
+    Superfície mínima de cliente Reddit utilizada pelo pipeline de coleta.
+
+    Satisfeita pelo `RedditClient` (PRAW) e pelos invólucros locais do pacote,
+    como o `ScheduledRedditClient`.
+    """
+
+    def subreddit(self, display_name: str) -> SubredditSearchProtocol:
+        """
+        Obtém o subreddit (ou multireddit ``a+b``) pelo nome.
+
+        Args:
+            display_name (str): Nome do subreddit, sem o prefixo ``r/``.
+
+        Returns:
+            SubredditSearchProtocol: Subreddit pesquisável.
+        """
+        ...
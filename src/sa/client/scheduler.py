@@ -0,0 +1,257 @@
+import itertools
+import math
+import time
+from threading import Condition
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .protocol import RedditClientProtocol, SubredditSearchProtocol
+
+DEFAULT_REQUESTS_PER_MINUTE = 60
+"""Orçamento padrão de requisições por minuto, compatível com o limite de apps OAuth do Reddit (100/min) com folga."""
+
+SEARCH_PAGE_SIZE = 100
+"""Quantidade de submissões que o PRAW obtém por requisição ao paginar uma busca."""
+
+
+class RequestScheduler:
+    """
+    Agendador de requisições por token bucket, com orçamento global e fila justa.
+
+    O balde recebe `requests_per_minute / 60` fichas por segundo, até o limite `burst`.
+    Cada requisição consome uma ficha; na falta dela, o chamador aguarda. Como uma única
+    instância é compartilhada por todos os coletores concorrentes, o orçamento vale para
+    o processo inteiro, tornando o tempo de execução previsível.
+
+    Quando várias unidades de trabalho ``(subreddit, palavra-chave)`` disputam fichas, a
+    próxima ficha vai para a unidade menos atendida até então (empates resolvidos por ordem
+    de chegada), evitando que uma busca longa monopolize o orçamento.
+
+    Observações:
+        - O relógio é injetável (`clock`) para permitir simulações determinísticas.
+        - É seguro para uso entre threads.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o agendador com o balde cheio.
+
+        Args:
+            requests_per_minute (float, optional): Orçamento sustentado de requisições por minuto.
+            burst (Optional[int], optional): Capacidade do balde (rajada máxima). Se `None`, uma ficha,
+                o que espaça as requisições uniformemente.
+            clock (Callable[[], float], optional): Fonte de tempo monotônica, em segundos.
+
+        Raises:
+            ValueError: Se `requests_per_minute` não for positivo ou `burst` for menor que 1.
+        """
+
+        if requests_per_minute <= 0:
+            raise ValueError("O orçamento de requisições por minuto deve ser positivo.")
+
+        if burst is not None and burst < 1:
+            raise ValueError("A capacidade de rajada deve ser maior ou igual a 1.")
+
+        self._rate = requests_per_minute / 60.0
+        """Fichas repostas por segundo."""
+
+        self._capacity = float(burst if burst is not None else 1)
+        """Quantidade máxima de fichas acumuladas."""
+
+        self._clock = clock
+        """Fonte de tempo monotônica."""
+
+        self._tokens = self._capacity
+        """Fichas disponíveis no momento da última reposição."""
+
+        self._updated_at = clock()
+        """Instante da última reposição de fichas."""
+
+        self._condition = Condition()
+        """Condição que coordena as threads à espera de fichas."""
+
+        self._tickets = itertools.count()
+        """Gerador de senhas que registra a ordem de chegada."""
+
+        self._waiting: dict[int, Hashable] = {}
+        """Senhas em espera e a unidade de trabalho de cada uma."""
+
+        self._granted: dict[Hashable, int] = {}
+        """Requisições já concedidas por unidade de trabalho."""
+
+        self.requests_made = 0
+        """Total de requisições concedidas."""
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Orçamento sustentado de requisições por minuto."""
+
+        return self._rate * 60.0
+
+    def acquire(self, unit: Hashable = None) -> None:
+        """
+        Bloqueia até que uma requisição da unidade informada possa ser feita.
+
+        Args:
+            unit (Hashable, optional): Unidade de trabalho solicitante (ex.: ``(subreddit, palavra-chave)``),
+                usada para repartir o orçamento de forma justa.
+        """
+
+        with self._condition:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = unit
+
+            try:
+                while True:
+                    self._refill()
+
+                    if self._tokens >= 1 and self._next_ticket() == ticket:
+                        self._tokens -= 1
+                        self._granted[unit] = self._granted.get(unit, 0) + 1
+                        self.requests_made += 1
+
+                        return
+
+                    timeout = (1 - self._tokens) / self._rate if self._tokens < 1 else None
+                    self._condition.wait(timeout)
+            finally:
+                del self._waiting[ticket]
+                self._condition.notify_all()
+
+    def estimate_seconds(self, remaining_requests: int) -> float:
+        """
+        Estima o tempo necessário para executar as requisições restantes dentro do orçamento.
+
+        Args:
+            remaining_requests (int): Quantidade de requisições ainda não realizadas.
+
+        Returns:
+            float: Segundos previstos até a conclusão, descontadas as fichas já disponíveis.
+        """
+
+        with self._condition:
+            self._refill()
+            pending = max(0.0, remaining_requests - self._tokens)
+
+        return pending / self._rate
+
+    def _refill(self) -> None:
+        """Repõe as fichas proporcionalmente ao tempo decorrido desde a última reposição."""
+
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def _next_ticket(self) -> int:
+        """Senha da vez: a da unidade menos atendida, com desempate por ordem de chegada."""
+
+        return min(self._waiting, key=lambda ticket: (self._granted.get(self._waiting[ticket], 0), ticket))
+
+
+def estimate_search_requests(total_per_word: int, searches: int) -> int:
+    """
+    Calcula o número máximo de requisições de uma coleta.
+
+    Args:
+        total_per_word (int): Limite de resultados por busca (``limit`` da paginação).
+        searches (int): Quantidade de buscas (unidades ``subreddit x consulta``).
+
+    Returns:
+        int: Requisições necessárias no pior caso, considerando páginas de `SEARCH_PAGE_SIZE` itens.
+    """
+
+    return searches * max(1, math.ceil(total_per_word / SEARCH_PAGE_SIZE))
+
+
+class _ScheduledSubreddit:
+    """Subreddit cuja paginação de busca consome fichas do `RequestScheduler` a cada página."""
+
+    def __init__(self, subreddit: "SubredditSearchProtocol", display_name: str, scheduler: RequestScheduler, page_size: int):
+        self._subreddit = subreddit
+        self._display_name = display_name
+        self._scheduler = scheduler
+        self._page_size = page_size
+
+    def search(self, query: str, **generator_kwargs: Any) -> Iterator[Any]:
+        """
+        Pesquisa no subreddit envolvido, consumindo uma ficha do agendador antes de cada página.
+
+        Args:
+            query (str): Consulta de busca.
+            **generator_kwargs (Any): Parâmetros repassados à paginação (ex.: ``sort``, ``limit``).
+
+        Returns:
+            Iterator[Any]: Submissões do subreddit envolvido, inalteradas.
+        """
+
+        unit = (self._display_name, query)
+        results = iter(self._subreddit.search(query, **generator_kwargs))
+
+        for index in itertools.count():
+            # Cada página do PRAW corresponde a uma requisição feita ao pedir seu primeiro item
+            if index % self._page_size == 0:
+                self._scheduler.acquire(unit)
+
+            try:
+                yield next(results)
+            except StopIteration:
+                return
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._subreddit, name)
+
+
+class ScheduledRedditClient:
+    """
+    Invólucro de cliente Reddit que submete as buscas ao orçamento de um `RequestScheduler`.
+
+    Implementa a mesma superfície consumida pelo coletor (`RedditClientProtocol`) e
+    delega os demais atributos ao cliente original, podendo envolver tanto o
+    `RedditClient` real quanto clientes locais de teste.
+
+    Observações:
+        - Uma ficha é consumida antes de cada página de `page_size` resultados, que é
+          quando o PRAW efetivamente dispara a requisição HTTP.
+        - O limitador interno do PRAW continua ativo; o agendador apenas impõe um teto
+          global, previsível e compartilhado.
+    """
+
+    def __init__(self, client: "RedditClientProtocol", scheduler: RequestScheduler, page_size: int = SEARCH_PAGE_SIZE):
+        """
+        Envolve o cliente com o agendador informado.
+
+        Args:
+            client (RedditClientProtocol): Cliente Reddit (real ou local) a ser agendado.
+            scheduler (RequestScheduler): Agendador compartilhado que detém o orçamento global.
+            page_size (int, optional): Resultados obtidos por requisição durante a paginação.
+        """
+
+        self._client = client
+        """Cliente Reddit envolvido."""
+
+        self.scheduler = scheduler
+        """Agendador que detém o orçamento global de requisições."""
+
+        self._page_size = page_size
+        """Resultados por página de busca."""
+
+    def subreddit(self, display_name: str) -> "SubredditSearchProtocol":
+        """
+        Obtém o subreddit do cliente envolvido, com as buscas submetidas ao agendador.
+
+        Args:
+            display_name (str): Nome do subreddit, sem o prefixo ``r/``.
+
+        Returns:
+            SubredditSearchProtocol: Subreddit pesquisável cuja paginação respeita o orçamento global.
+        """
+
+        return _ScheduledSubreddit(self._client.subreddit(display_name), display_name, self.scheduler, self._page_size)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
@@ -6,8 +6,22 @@ pré-processamento de publicações a partir de palavras-chave categorizadas
 por polaridade.
 """
 
-from .reddit import RedditCollector
+from .checkpoint import CollectionJournal, CollectionUnit
+from .concurrent import ConcurrentRedditCollector
+from .dedup import DedupIndexABC, MemoryDedupIndex, SQLiteDedupIndex
+from .reddit import MULTIREDDIT_SEPARATOR, RedditCollector
+from .stats import CollectionStats
+from .watermark import WatermarkStore
 
 __all__ = [
+    "MULTIREDDIT_SEPARATOR",
+    "CollectionJournal",
+    "CollectionStats",
+    "CollectionUnit",
+    "ConcurrentRedditCollector",
+    "DedupIndexABC",
+    "MemoryDedupIndex",
     "RedditCollector",
+    "SQLiteDedupIndex",
+    "WatermarkStore",
 ]
@@ -0,0 +1,204 @@
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+from typing import TYPE_CHECKING, Iterator, Optional, TextIO
+
+if TYPE_CHECKING:
+    from sa.model import PostRecord
+
+CollectionUnit = tuple[str, str, str]
+"""
+Alias de tipo para a unidade de trabalho de uma coleta: ``(subreddit, polaridade, palavra-chave)``.
+
+É a granularidade em que o progresso é registrado no journal e em que uma coleta
+interrompida é retomada.
+"""
+
+_POST_EVENT = "post"
+"""Tipo de evento do journal que registra um post aceito."""
+
+_DONE_EVENT = "done"
+"""Tipo de evento do journal que registra uma unidade concluída."""
+
+
+class CollectionJournal:
+    """
+    Journal durável (append-only) de uma execução de coleta.
+
+    Registra, linha a linha em JSON, cada post aceito e cada unidade de trabalho
+    concluída. Caso a coleta seja interrompida (falha ou Ctrl-C), uma nova execução
+    aberta com ``resume=True`` reaproveita os posts já registrados e pula as unidades
+    concluídas, em vez de recomeçar do zero.
+
+    Attributes:
+        _path (Path): Caminho do arquivo de journal.
+
+    Observações:
+        - Cada linha é descarregada para o sistema operacional assim que escrita, e o
+          arquivo é sincronizado (`fsync`) a cada unidade concluída.
+        - Uma linha final truncada (escrita interrompida) é ignorada na retomada.
+        - Unidades parcialmente coletadas são refeitas na retomada; seus posts já
+          registrados são descartados pela deduplicação.
+        - É seguro para uso entre threads (escritas protegidas por `Lock`).
+    """
+
+    def __init__(self, path: str | Path, resume: bool = False):
+        """
+        Abre o journal, carregando o progresso anterior quando `resume` for verdadeiro.
+
+        Args:
+            path (str | Path): Caminho do arquivo de journal.
+            resume (bool, optional): Se `True`, lê o journal existente e continua a partir dele;
+                caso contrário, o journal é iniciado vazio.
+
+        Raises:
+            FileExistsError: Se o journal já existir e `resume` for `False`, evitando que
+                o progresso de uma execução interrompida seja descartado por engano.
+        """
+
+        self._path = Path(path)
+
+        if self._path.exists() and not resume:
+            raise FileExistsError(f"O journal {str(self._path)!r} já existe. Use a retomada ou remova o arquivo.")
+
+        self._posts: list["PostRecord"] = []
+        """Posts aceitos em execuções anteriores, lidos do journal."""
+
+        self._completed: set[CollectionUnit] = set()
+        """Unidades de trabalho concluídas."""
+
+        if resume and self._path.exists():
+            self._load()
+
+        self._lock = Lock()
+        """Lock que serializa as escritas no arquivo."""
+
+        self._file: Optional[TextIO] = None
+        """Arquivo de journal aberto em modo append, criado apenas na primeira escrita."""
+
+    def _load(self) -> None:
+        """Lê os eventos do journal existente, ignorando uma eventual linha final truncada."""
+
+        with self._path.open("r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                unit: CollectionUnit = tuple(event["unit"])
+
+                if event["event"] == _POST_EVENT:
+                    self._posts.append(event["post"])
+                elif event["event"] == _DONE_EVENT:
+                    self._completed.add(unit)
+
+    def replay(self) -> Iterator["PostRecord"]:
+        """
+        Percorre os posts aceitos registrados por execuções anteriores.
+
+        Yields:
+            PostRecord: Posts lidos do journal, na ordem em que foram aceitos.
+        """
+
+        yield from self._posts
+
+    def accepted_count(self, subreddit_name: str) -> int:
+        """
+        Quantidade de posts de um subreddit já registrados por execuções anteriores.
+
+        Args:
+            subreddit_name (str): Nome do subreddit, ou multireddit ``a+b`` (soma os subreddits que o compõem).
+
+        Returns:
+            int: Total de posts do journal pertencentes ao subreddit.
+        """
+
+        counts = Counter(post["subreddit"] for post in self._posts)
+
+        return sum(counts[name] for name in set(subreddit_name.split("+")))
+
+    def is_completed(self, unit: CollectionUnit) -> bool:
+        """
+        Verifica se uma unidade de trabalho já foi concluída.
+
+        Args:
+            unit (CollectionUnit): Unidade ``(subreddit, polaridade, palavra-chave)``.
+
+        Returns:
+            bool: `True` se a unidade foi concluída em uma execução anterior ou na atual.
+        """
+
+        return unit in self._completed
+
+    def record_post(self, unit: CollectionUnit, post: "PostRecord") -> None:
+        """
+        Registra um post aceito dentro de uma unidade de trabalho.
+
+        Args:
+            unit (CollectionUnit): Unidade que originou o post.
+            post (PostRecord): Post aceito.
+        """
+
+        self._write({"event": _POST_EVENT, "unit": list(unit), "post": post}, sync=False)
+
+    def complete_unit(self, unit: CollectionUnit) -> None:
+        """
+        Marca uma unidade de trabalho como concluída, sincronizando o journal em disco.
+
+        Args:
+            unit (CollectionUnit): Unidade concluída.
+        """
+
+        self._write({"event": _DONE_EVENT, "unit": list(unit)}, sync=True)
+
+        with self._lock:
+            self._completed.add(unit)
+
+    def _write(self, event: dict[str, object], sync: bool) -> None:
+        """
+        Acrescenta um evento ao journal.
+
+        Args:
+            event (dict[str, object]): Evento serializável em JSON.
+            sync (bool): Se `True`, força a gravação física (`fsync`) após a escrita.
+        """
+
+        line = json.dumps(event, ensure_ascii=False, default=str)
+
+        with self._lock:
+            if self._file is None:
+                self._file = self._path.open("a", encoding="utf-8")
+
+            self._file.write(line + "\n")
+            self._file.flush()
+
+            if sync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Fecha o arquivo de journal, preservando-o em disco."""
+
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
+
+    def remove(self) -> None:
+        """Fecha e apaga o journal; usado quando a execução termina com sucesso."""
+
+        self.close()
+        self._path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "CollectionJournal":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,262 @@
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from threading import Event
+from typing import TYPE_CHECKING, Callable, Generator, Optional, Union
+
+from sa.nlp import LanguageDetector
+
+from .dedup import MemoryDedupIndex
+from .reddit import RedditCollector
+from .stats import CollectionStats
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from sa.client import RedditClientProtocol
+    from sa.logger import StageTimer
+    from sa.model import KeywordsByPolarity, Language, PostRecord
+    from sa.nlp import LanguageCache, NearDuplicateIndex
+
+    from .checkpoint import CollectionJournal
+    from .dedup import DedupIndexABC
+    from .watermark import WatermarkStore
+
+DEFAULT_MAX_WORKERS = 4
+"""Quantidade padrão de subreddits coletados simultaneamente."""
+
+DEFAULT_QUEUE_SIZE = 1000
+"""Capacidade da fila de mesclagem; limita quantos posts os workers adiantam ao consumidor."""
+
+_POLL_INTERVAL = 0.1
+"""Intervalo (em segundos) com que workers bloqueados verificam o sinal de parada."""
+
+
+class _WorkerDone:
+    """Sentinela enviada à fila quando o worker de um subreddit termina (com ou sem erro)."""
+
+    def __init__(self, subreddit_name: str, error: Optional[BaseException] = None):
+        self.subreddit_name = subreddit_name
+        self.error = error
+
+
+class ConcurrentRedditCollector:
+    """
+    Coletor que executa um `RedditCollector` por subreddit em paralelo.
+
+    A coleta é dominada pela espera de rede, portanto cada subreddit roda em uma
+    thread de um pool limitado, compartilhando o mesmo cliente Reddit. Os posts
+    produzidos pelos workers são mesclados em uma única fila e entregues ao
+    consumidor via generator, na ordem em que chegam.
+
+    Observações:
+        - Todos os workers compartilham um único `DedupIndexABC`, de modo que um
+          mesmo conteúdo encontrado em subreddits diferentes é aceito uma única vez.
+        - A fila de mesclagem é limitada (`queue_size`), aplicando backpressure aos
+          workers quando o consumidor é mais lento que a coleta.
+        - Com ``max_workers=1`` o comportamento equivale à coleta sequencial.
+    """
+
+    def __init__(
+        self,
+        reddit_client: "RedditClientProtocol",
+        subreddit_names: list[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        logger_factory: Optional[Callable[[str], "Logger"]] = None,
+        dedup_index: Optional["DedupIndexABC"] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        journal: Optional["CollectionJournal"] = None,
+        watermarks: Optional["WatermarkStore"] = None,
+        keywords_per_query: int = 1,
+        timer: Optional["StageTimer"] = None,
+        language_detector: LanguageDetector = LanguageDetector.NGRAM,
+        language_cache: Optional["LanguageCache"] = None,
+        near_duplicates: Optional["NearDuplicateIndex[str]"] = None,
+    ):
+        """
+        Inicializa o coletor concorrente.
+
+        Args:
+            reddit_client (RedditClientProtocol): Cliente Reddit (PRAW ou invólucro), compartilhado por todos os workers.
+            subreddit_names (list[str]): Nomes dos subreddits a coletar (sem o prefixo ``r/``).
+            max_workers (int): Quantidade máxima de subreddits coletados ao mesmo tempo.
+            logger_factory (Optional[Callable[[str], Logger]]): Fábrica que cria um logger por subreddit
+                (ex.: `create_reddit_logger`). Se `None`, os logs são silenciados.
+            dedup_index (Optional[DedupIndexABC]): Índice de deduplicação compartilhado. Se `None`,
+                cada chamada a `collect` utiliza um `MemoryDedupIndex` novo.
+            queue_size (int): Capacidade da fila de mesclagem entre workers e consumidor.
+            journal (Optional[CollectionJournal]): Journal de checkpoint compartilhado pelos workers.
+                Os posts já registrados nele são emitidos primeiro e semeiam a deduplicação.
+            watermarks (Optional[WatermarkStore]): Marcas d'água compartilhadas para coleta incremental.
+            keywords_per_query (int): Quantidade de palavras-chave combinadas em cada busca.
+            timer (Optional[StageTimer]): Temporizador compartilhado pelos workers para medir as etapas do pipeline.
+            language_detector (LanguageDetector): Motor de detecção de idioma usado pelos workers.
+            language_cache (Optional[LanguageCache]): Cache persistente de idiomas compartilhado pelos workers.
+            near_duplicates (Optional[NearDuplicateIndex[str]]): Índice de quase duplicados compartilhado pelos workers,
+                de modo que crossposts entre subreddits também sejam descartados. Se `None`, a verificação fica desativada.
+
+        Raises:
+            ValueError: Se `max_workers`, `queue_size` ou `keywords_per_query` forem menores que 1.
+        """
+
+        if max_workers < 1:
+            raise ValueError("O número de workers deve ser maior ou igual a 1.")
+
+        if queue_size < 1:
+            raise ValueError("O tamanho da fila deve ser maior ou igual a 1.")
+
+        if keywords_per_query < 1:
+            raise ValueError("A quantidade de palavras-chave por busca deve ser maior ou igual a 1.")
+
+        self._client = reddit_client
+        """Instância autenticada do cliente PRAW compartilhada entre os workers."""
+
+        self._subreddit_names = subreddit_names
+        """Subreddits alvo da coleta."""
+
+        self._max_workers = max_workers
+        """Tamanho do pool de threads."""
+
+        self._logger_factory = logger_factory
+        """Fábrica opcional de loggers por subreddit."""
+
+        self._dedup_index = dedup_index
+        """Índice de deduplicação compartilhado entre execuções de `collect`, se houver."""
+
+        self._queue_size = queue_size
+        """Capacidade da fila de mesclagem."""
+
+        self._journal = journal
+        """Journal de checkpoint da execução, se houver."""
+
+        self._watermarks = watermarks
+        """Marcas d'água da coleta incremental, se houver."""
+
+        self._keywords_per_query = keywords_per_query
+        """Quantidade de palavras-chave combinadas em cada busca."""
+
+        self._timer = timer
+        """Temporizador das etapas do pipeline, compartilhado pelos workers."""
+
+        self._language_detector = language_detector
+        """Motor de detecção de idioma dos workers."""
+
+        self._language_cache = language_cache
+        """Cache persistente de idiomas compartilhado pelos workers, se houver."""
+
+        self._near_duplicates = near_duplicates
+        """Índice de quase duplicados compartilhado pelos workers, se houver."""
+
+        self.stats = CollectionStats()
+        """Contadores consolidados de todos os workers da última chamada a `collect`."""
+
+    def collect(self, ckw: "KeywordsByPolarity", lang: "Language", total_per_word: int) -> Generator["PostRecord", None, None]:
+        """
+        Coleta os subreddits configurados em paralelo e mescla os posts aceitos.
+
+        Args:
+            ckw (KeywordsByPolarity): Palavras-chave de busca agrupadas por polaridade.
+            lang (Language): Idioma esperado dos posts.
+            total_per_word (int): Limite de posts por palavra-chave, repassado a cada `RedditCollector`.
+
+        Yields:
+            PostRecord: Posts aceitos por qualquer um dos workers, sem duplicatas entre subreddits.
+
+        Raises:
+            Exception: Relança a primeira exceção ocorrida em um worker, após sinalizar
+                a parada dos demais.
+
+        Observações:
+            - Com journal, os posts de execuções anteriores são emitidos antes da coleta,
+              e as unidades já concluídas não são buscadas novamente.
+            - Encerrar o generator antecipadamente (``close()`` ou ``break`` no consumidor)
+              sinaliza a parada dos workers, que terminam na próxima verificação.
+        """
+
+        dedup_index = self._dedup_index if self._dedup_index is not None else MemoryDedupIndex()
+        stats = self.stats = CollectionStats()
+
+        if self._journal:
+            for post in self._journal.replay():
+                dedup_index.add(post["post_id"], post["content_hash"])
+
+                if self._near_duplicates is not None:
+                    self._near_duplicates.add(post["post_id"], f"{post['title']} {post['content']}")
+
+                yield post
+
+        queue: "Queue[Union[PostRecord, _WorkerDone]]" = Queue(maxsize=self._queue_size)
+        stop = Event()
+
+        def put(item: "Union[PostRecord, _WorkerDone]") -> bool:
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=_POLL_INTERVAL)
+                    return True
+                except Full:
+                    continue
+
+            return False
+
+        def run(subreddit_name: str) -> None:
+            logger = self._logger_factory(subreddit_name) if self._logger_factory else None
+            collector = RedditCollector(
+                self._client,
+                subreddit_name,
+                logger=logger,
+                dedup_index=dedup_index,
+                journal=self._journal,
+                watermarks=self._watermarks,
+                keywords_per_query=self._keywords_per_query,
+                timer=self._timer,
+                language_detector=self._language_detector,
+                language_cache=self._language_cache,
+                near_duplicates=self._near_duplicates,
+            )
+            error: Optional[BaseException] = None
+            total = 0
+
+            try:
+                if logger:
+                    logger.info("Iniciando a coleta de posts do subreddit %s...", subreddit_name)
+
+                for post in collector.collect(ckw=ckw, lang=lang, total_per_word=total_per_word):
+                    if not put(post):
+                        break
+
+                    total += 1
+                else:
+                    if logger:
+                        logger.info("Coleta do subreddit %s finalizada. Total de posts: %d", subreddit_name, total)
+            except BaseException as e:
+                error = e
+
+            # Consolidado antes da sentinela, para que o consumidor nunca leia contadores incompletos
+            stats.merge(collector.stats)
+            put(_WorkerDone(subreddit_name, error))
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="reddit-collector")
+
+        try:
+            for subreddit_name in self._subreddit_names:
+                executor.submit(run, subreddit_name)
+
+            pending = len(self._subreddit_names)
+
+            while pending:
+                try:
+                    item = queue.get(timeout=_POLL_INTERVAL)
+                except Empty:
+                    continue
+
+                if isinstance(item, _WorkerDone):
+                    pending -= 1
+
+                    if item.error is not None:
+                        raise item.error
+
+                    continue
+
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
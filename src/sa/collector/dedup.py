@@ -0,0 +1,208 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+from typing import Optional
+
+DEFAULT_COMMIT_EVERY = 1000
+"""Quantidade de inserções acumuladas antes de cada commit no índice SQLite."""
+
+
+class DedupIndexABC(ABC):
+    """
+    Interface abstrata para índices de deduplicação de posts coletados.
+
+    Define o contrato consultado pelo `RedditCollector` para decidir se um post
+    já foi aceito anteriormente. Permite que várias instâncias de coletor
+    compartilhem o mesmo índice (ex.: coleta concorrente de vários subreddits),
+    mantendo a deduplicação correta entre elas.
+
+    Observações:
+        - Padrão utilizado: Strategy (via ABC).
+        - Implementações concretas devem garantir que `add` seja atômico, pois
+          pode ser invocado simultaneamente por múltiplas threads.
+    """
+
+    @abstractmethod
+    def contains_post(self, post_id: str) -> bool:
+        """
+        Verifica se o identificador de post já foi registrado no índice.
+
+        Consulta barata, feita antes de qualquer normalização ou detecção de idioma,
+        permitindo descartar imediatamente posts já conhecidos.
+
+        Args:
+            post_id (str): Identificador nativo do post na plataforma de origem.
+
+        Returns:
+            bool: `True` se o post já foi visto anteriormente.
+        """
+
+    @abstractmethod
+    def add(self, post_id: str, content_hash: str) -> bool:
+        """
+        Registra um post aceito no índice, caso seu conteúdo ainda não exista.
+
+        O `post_id` é registrado mesmo quando o conteúdo é duplicado, para que
+        consultas futuras via `contains_post` o descartem sem reprocessamento.
+
+        Args:
+            post_id (str): Identificador nativo do post na plataforma de origem.
+            content_hash (str): Hash do conteúdo normalizado calculado em `pack_post`.
+
+        Returns:
+            bool: `True` se o post foi registrado agora; `False` se o `content_hash`
+                já constava no índice (post duplicado).
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Quantidade de conteúdos únicos registrados no índice."""
+
+
+class MemoryDedupIndex(DedupIndexABC):
+    """
+    Índice de deduplicação em memória, seguro para uso entre threads.
+
+    Mantém os identificadores vistos e os hashes de conteúdo aceitos em `set`s protegidos por `Lock`,
+    reproduzindo o comportamento original da coleta (deduplicação restrita
+    à sessão, sem persistência entre execuções).
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o índice vazio e o lock de exclusão mútua."""
+
+        self._post_ids: set[str] = set()
+        """Identificadores de posts já vistos na sessão."""
+
+        self._content_hashes: set[str] = set()
+        """Hashes de conteúdo já aceitos na sessão."""
+
+        self._lock = Lock()
+        """Lock que torna a operação de verificação e inserção atômica."""
+
+    def contains_post(self, post_id: str) -> bool:
+        with self._lock:
+            return post_id in self._post_ids
+
+    def add(self, post_id: str, content_hash: str) -> bool:
+        with self._lock:
+            self._post_ids.add(post_id)
+
+            if content_hash in self._content_hashes:
+                return False
+
+            self._content_hashes.add(content_hash)
+
+            return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._content_hashes)
+
+
+class SQLiteDedupIndex(DedupIndexABC):
+    """
+    Índice de deduplicação persistente em disco, baseado em SQLite.
+
+    Mantém duas tabelas `WITHOUT ROWID` (uma por `post_id` e outra por `content_hash`),
+    cujas chaves primárias são a própria árvore B de busca. Assim, cada consulta é
+    resolvida por índice sem carregar o conjunto em memória, e o consumo residente
+    fica limitado ao cache de páginas do SQLite, mesmo com dezenas de milhões de hashes.
+
+    Attributes:
+        _path (Path): Caminho do arquivo SQLite do índice.
+
+    Observações:
+        - O `content_hash` (hexadecimal MD5) é armazenado como BLOB de 16 bytes,
+          metade do espaço da representação textual.
+        - As inserções são confirmadas em lotes (`commit_every`) e no `close()`.
+          Com ``commit_every=None`` nada é confirmado antes do `close()`, o que permite
+          descartar a sessão inteira (``close(commit=False)``) caso os posts coletados
+          não cheguem a ser persistidos.
+        - É seguro para uso entre threads (conexão única protegida por `Lock`).
+    """
+
+    def __init__(self, path: str | Path, commit_every: Optional[int] = DEFAULT_COMMIT_EVERY):
+        """
+        Abre (ou cria) o índice no caminho informado.
+
+        Args:
+            path (str | Path): Caminho do arquivo SQLite. Diretórios pais são criados se necessário.
+            commit_every (Optional[int], optional): Quantidade de inserções acumuladas antes de cada commit.
+                Se `None`, as inserções só são confirmadas no `close()`.
+        """
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._commit_every = commit_every
+        """Tamanho do lote de inserções entre commits."""
+
+        self._pending = 0
+        """Inserções ainda não confirmadas."""
+
+        self._lock = Lock()
+        """Lock que serializa o acesso à conexão compartilhada."""
+
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        """Conexão única com o banco do índice."""
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS posts (post_id TEXT PRIMARY KEY) WITHOUT ROWID")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS contents (content_hash BLOB PRIMARY KEY) WITHOUT ROWID")
+        self._conn.commit()
+
+    def contains_post(self, post_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+
+        return row is not None
+
+    def add(self, post_id: str, content_hash: str) -> bool:
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO posts (post_id) VALUES (?)", (post_id,))
+            cursor = self._conn.execute("INSERT OR IGNORE INTO contents (content_hash) VALUES (?)", (bytes.fromhex(content_hash),))
+
+            self._pending += 1
+
+            if self._commit_every is not None and self._pending >= self._commit_every:
+                self._conn.commit()
+                self._pending = 0
+
+            return cursor.rowcount == 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM contents").fetchone()
+
+        return int(row[0])
+
+    def close(self, commit: bool = True) -> None:
+        """
+        Fecha a conexão com o banco, confirmando ou descartando as inserções pendentes.
+
+        Args:
+            commit (bool, optional): Se `True`, confirma as inserções pendentes; caso contrário, as descarta.
+        """
+
+        with self._lock:
+            if commit:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+
+            self._conn.close()
+
+    def __enter__(self) -> "SQLiteDedupIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close(commit=exc_type is None)
@@ -1,15 +1,31 @@
 from typing import TYPE_CHECKING, Generator, Optional
 
+from sa.logger import NULL_TIMER
 from sa.model import UNKNOWN_AUTHOR_PLACEHOLDER, pack_post
-from sa.nlp import matches_language, normalize_text
+from sa.nlp import KeywordMatcher, LanguageDetector, get_language_identifier, matches_language, normalize_text, text_hash
+
+from .dedup import MemoryDedupIndex
+from .stats import CollectionStats
 
 if TYPE_CHECKING:
     from logging import Logger
 
-    from praw import Reddit  # type: ignore[import-untyped]
     from praw.models import Submission  # type: ignore[import-untyped]
 
+    from sa.client import RedditClientProtocol
+    from sa.logger import StageTimer
     from sa.model import KeywordsByPolarity, Language, Polarity, PostRecord
+    from sa.nlp import LanguageCache, NearDuplicateIndex
+
+    from .checkpoint import CollectionJournal
+    from .dedup import DedupIndexABC
+    from .watermark import WatermarkStore
+
+MULTIREDDIT_SEPARATOR = "+"
+"""Separador da sintaxe de multireddit do Reddit (ex.: ``conversas+brasil``), que busca vários subreddits em uma só requisição."""
+
+_QUERY_OPERATOR = " OR "
+"""Operador da busca do Reddit usado para combinar várias palavras-chave em uma única consulta."""
 
 
 class RedditCollector:
@@ -24,30 +40,69 @@ class RedditCollector:
     Integração no pipeline de NLP:
         - Recebe as palavras-chave categorizadas por polaridade (`KeywordsByPolarity`).
         - Utiliza `normalize_text` (subpacote `nlp`) para limpar título e corpo do post.
-        - Utiliza `matches_language` (subpacote `nlp`) para filtrar posts no idioma desejado.
+        - Utiliza `LanguageIdentifier` ou `matches_language` (subpacote `nlp`) para filtrar posts no idioma desejado.
         - Empacota cada post no formato `PostRecord` via `pack_post` (subpacote `model`).
         - Entrega os registros prontos para ingestão pelo pipeline de análise de sentimentos.
 
     Observações:
         - Padrão utilizado: Iterator (implementado via generator com `yield`).
-        - A deduplicação é feita por hash de conteúdo (`content_hash`) dentro de cada sessão
-          de coleta, sem persistência entre execuções.
+        - A deduplicação é feita por `post_id` e por hash de conteúdo (`content_hash`) dentro
+          de cada sessão de coleta. Um `DedupIndexABC` pode ser injetado para deduplicar entre
+          vários coletores (ex.: coleta concorrente) ou entre execuções (`SQLiteDedupIndex`).
         - Posts cujo autor foi deletado recebem o placeholder `UNKNOWN_AUTHOR_PLACEHOLDER`.
     """
 
-    def __init__(self, reddit_client: "Reddit", subreddit_name: str, logger: Optional["Logger"] = None):
+    def __init__(
+        self,
+        reddit_client: "RedditClientProtocol",
+        subreddit_name: str,
+        logger: Optional["Logger"] = None,
+        dedup_index: Optional["DedupIndexABC"] = None,
+        journal: Optional["CollectionJournal"] = None,
+        watermarks: Optional["WatermarkStore"] = None,
+        keywords_per_query: int = 1,
+        timer: Optional["StageTimer"] = None,
+        language_detector: LanguageDetector = LanguageDetector.NGRAM,
+        language_cache: Optional["LanguageCache"] = None,
+        near_duplicates: Optional["NearDuplicateIndex[str]"] = None,
+    ):
         """
         Inicializa o coletor com o cliente Reddit, o subreddit alvo e o logger opcional.
 
         Args:
-            reddit_client (Reddit): Instância autenticada do cliente PRAW, responsável
-                pela comunicação com a API do Reddit.
+            reddit_client (RedditClientProtocol): Cliente Reddit responsável pela comunicação com a API
+                (instância PRAW autenticada ou invólucro, como o `ScheduledRedditClient`).
             subreddit_name (str): Nome do subreddit de onde os posts serão coletados
-                (sem o prefixo ``r/``).
+                (sem o prefixo ``r/``). Aceita a sintaxe de multireddit ``a+b`` para buscar
+                vários subreddits em cada requisição.
             logger (Optional[Logger]): Instância de logger para registrar eventos e
                 diagnósticos durante a coleta. Se `None`, os logs são silenciados.
+            dedup_index (Optional[DedupIndexABC]): Índice de deduplicação compartilhado.
+                Se `None`, cada chamada a `collect` utiliza um `MemoryDedupIndex` novo.
+            journal (Optional[CollectionJournal]): Journal de checkpoint onde o progresso por
+                unidade ``(subreddit, polaridade, palavra-chave)`` é registrado. Unidades já
+                concluídas no journal são puladas. Se `None`, nenhum progresso é registrado.
+            watermarks (Optional[WatermarkStore]): Marcas d'água por ``(subreddit, palavra-chave)``
+                que habilitam a coleta incremental. Se `None`, cada busca percorre até `total_per_word`.
+            keywords_per_query (int, optional): Quantidade de palavras-chave de uma mesma polaridade
+                combinadas (via ``OR``) em cada busca. Com 1, cada palavra-chave tem sua própria busca.
+            timer (Optional[StageTimer]): Temporizador que mede as etapas ``search``, ``normalize``,
+                ``demojize``, ``language`` e ``near_dup``. Se `None`, a instrumentação fica desativada (`NULL_TIMER`).
+            language_detector (LanguageDetector, optional): Motor de detecção de idioma. ``NGRAM`` (padrão)
+                usa o `LanguageIdentifier` compartilhado do processo, determinístico; ``LANGDETECT`` usa `matches_language`.
+            language_cache (Optional[LanguageCache]): Cache persistente dos idiomas detectados, por hash do texto
+                normalizado. Se `None`, cada post é detectado novamente.
+            near_duplicates (Optional[NearDuplicateIndex[str]]): Índice MinHash/LSH, por `post_id`, que descarta
+                posts quase duplicados (repostagens editadas, crossposts, spam copiado) de posts já aceitos.
+                Se `None`, apenas duplicatas exatas são descartadas.
+
+        Raises:
+            ValueError: Se `keywords_per_query` for menor que 1.
         """
 
+        if keywords_per_query < 1:
+            raise ValueError("A quantidade de palavras-chave por busca deve ser maior ou igual a 1.")
+
         self._client = reddit_client
         """Instância autenticada do cliente PRAW para comunicação com a API."""
 
@@ -57,6 +112,36 @@ class RedditCollector:
         self._logger = logger
         """Logger opcional para registro de eventos durante a coleta."""
 
+        self._dedup_index = dedup_index
+        """Índice de deduplicação compartilhado entre coletores, se houver."""
+
+        self._journal = journal
+        """Journal de checkpoint da execução, se houver."""
+
+        self._watermarks = watermarks
+        """Marcas d'água da coleta incremental, se houver."""
+
+        self._keywords_per_query = keywords_per_query
+        """Quantidade de palavras-chave combinadas em cada busca."""
+
+        self._timer = timer if timer is not None else NULL_TIMER
+        """Temporizador das etapas do pipeline."""
+
+        self._language_identifier = get_language_identifier() if language_detector is LanguageDetector.NGRAM else None
+        """Identificador de idioma em lote; `None` quando a detecção usa o langdetect."""
+
+        self._language_detector = language_detector
+        """Motor de detecção de idioma."""
+
+        self._language_cache = language_cache
+        """Cache persistente dos idiomas detectados, se houver."""
+
+        self._near_duplicates = near_duplicates
+        """Índice de quase duplicados compartilhado entre coletores, se houver."""
+
+        self.stats = CollectionStats()
+        """Contadores da última chamada a `collect` (trabalho executado e evitado)."""
+
     def collect(self, ckw: "KeywordsByPolarity", lang: "Language", total_per_word: int) -> Generator["PostRecord", None, None]:
         """
         Coleta posts de um subreddit baseando-se nas categorias e palavras-chave.
@@ -64,8 +149,9 @@ class RedditCollector:
 
         Itera sobre cada categoria de polaridade e suas respectivas palavras-chave,
         realizando buscas no subreddit via API do Reddit. Para cada resultado, aplica
-        um pipeline de filtragem sequencial: pré-processamento de texto, verificação
-        de idioma e deduplicação por hash de conteúdo. Posts aprovados em todas as
+        um pipeline de filtragem sequencial: descarte de identificadores e textos brutos
+        já avaliados (nesta coleta ou pelo índice de deduplicação), pré-processamento de
+        texto, verificação de idioma e deduplicação por hash de conteúdo. Posts aprovados em todas as
         etapas são emitidos via ``yield``.
 
         Args:
@@ -73,7 +159,7 @@ class RedditCollector:
                 (ex.: positivo, negativo, neutro) a uma lista de palavras-chave
                 de busca associadas.
             lang (Language): Idioma esperado dos posts. Posts em outros idiomas
-                são descartados com base na detecção feita por `matches_language`.
+                são descartados com base na detecção do motor escolhido em `language_detector`.
             total_per_word (int): Limite máximo de posts a recuperar por palavra-chave
                 na chamada à API do Reddit. Também é usado como critério de parada
                 antecipada do loop de palavras quando o total de hashes únicos
@@ -89,38 +175,145 @@ class RedditCollector:
             - A deduplicação é baseada no campo ``content_hash`` do `PostRecord`,
               calculado durante o pré-processamento em `_preprocess_post`.
             - O loop de palavras-chave encerra antecipadamente quando o número de
-              posts únicos acumulados atingir `total_per_word`.
+              posts únicos aceitos (incluindo os já registrados no journal) atingir `total_per_word`.
+            - Com journal, cada post aceito é registrado antes de ser emitido e cada
+              palavra-chave esgotada é marcada como unidade concluída.
+            - Com marcas d'água, a paginação de uma palavra-chave é interrompida no primeiro
+              post com ``created_utc`` igual ou anterior à marca, que é então avançada para o
+              post mais recente visto. A marca só avança quando a busca termina por completo:
+              ao alcançar a marca anterior ou ao esgotar a listagem antes de `total_per_word`.
+              Se o limite for atingido antes da marca anterior, ela é mantida e a lacuna é registrada no log.
+            - Normalização e detecção de idioma rodam apenas na primeira vez que um post é
+              visto: um mesmo `post_id` (ou título e corpo brutos idênticos) retornado por outra
+              palavra-chave é descartado antes de qualquer processamento de NLP, inclusive quando
+              foi rejeitado por idioma. Os contadores ficam disponíveis em `stats`.
+            - Com ``keywords_per_query > 1``, as palavras-chave de cada polaridade são combinadas
+              em buscas ``kw1 OR kw2 ...``; journal e marcas d'água passam a usar a consulta
+              combinada como unidade. Cada post é atribuído localmente à primeira palavra-chave
+              do lote presente no título ou no corpo (sem acentos e sem diferenciar caixa); posts
+              sem nenhuma palavra-chave do lote são descartados antes do NLP.
         """
 
-        content_hashes: set[str] = set()
+        dedup_index = self._dedup_index if self._dedup_index is not None else MemoryDedupIndex()
+        accepted = self._journal.accepted_count(self._subreddit_name) if self._journal else 0
+        seen_ids: set[str] = set()
+        seen_raw: set[int] = set()
+        stats = self.stats = CollectionStats()
+        subreddit = self._client.subreddit(self._subreddit_name)
 
         for category, words in ckw.items():
             self._log(f"Categoria: {category.value.upper()} | Limite por palavra: {total_per_word}")
 
-            for keyword in words:
-                self._log(f"Buscando palavra-chave: '{keyword}'")
+            # Compilado uma única vez por polaridade e reaproveitado por todos os lotes dela
+            matcher = KeywordMatcher(words) if self._keywords_per_query > 1 else None
+
+            for start in range(0, len(words), self._keywords_per_query):
+                batch = words[start : start + self._keywords_per_query]
+                query = self._build_query(batch)
+                unit = (self._subreddit_name, category.value, query)
 
-                subreddit = self._client.subreddit(self._subreddit_name)
+                if self._journal and self._journal.is_completed(unit):
+                    self._log(f"Palavra-chave '{query}' já concluída em execução anterior")
+                    continue
+
+                self._log(f"Buscando palavra-chave: '{query}'")
+
+                watermark = self._watermarks.get(self._subreddit_name, query) if self._watermarks else None
+                newest = watermark
+                listed = 0
+                reached_watermark = False
 
                 # Pesquisa por palavra-chave no título ou texto
-                for post in subreddit.search(keyword, sort="new", limit=total_per_word):
-                    clean_post = self._normalize_post(post, category, keyword)
+                for post in self._timer.iterate("search", subreddit.search(query, sort="new", limit=total_per_word)):
+                    listed += 1
+                    created_at = float(post.created_utc)
+
+                    if watermark is not None and created_at <= watermark:
+                        self._log(f"Palavra-chave '{query}' alcançou os posts da coleta anterior")
+                        reached_watermark = True
+                        break
+
+                    if newest is None or created_at > newest:
+                        newest = created_at
+
+                    stats.fetched += 1
+                    post_id = str(post.id)
+
+                    if post_id in seen_ids:
+                        stats.skipped_seen += 1
+                        self._log(f"Post {post_id} ignorado (já avaliado nesta coleta)")
+                        continue
+
+                    if dedup_index.contains_post(post_id):
+                        stats.skipped_indexed += 1
+                        self._log(f"Post {post_id} ignorado (já coletado)")
+                        continue
+
+                    keyword = self._attribute_keyword(post, batch, matcher) if matcher and len(batch) > 1 else batch[0]
+
+                    # Não é marcado como visto: pode conter palavras-chave de outro lote
+                    if keyword is None:
+                        stats.unattributed += 1
+                        self._log(f"Post {post_id} ignorado (nenhuma palavra-chave do lote no texto)")
+                        continue
+
+                    seen_ids.add(post_id)
+
+                    # Hash barato do texto bruto: mesmo título e corpo implicam mesma normalização e mesmo idioma
+                    raw_key = hash((post.title, post.selftext))
+
+                    if raw_key in seen_raw:
+                        stats.skipped_raw_duplicate += 1
+                        self._log(f"Post {post_id} ignorado (texto idêntico a post já avaliado)")
+                        continue
+
+                    seen_raw.add(raw_key)
+
+                    stats.normalized += 1
+
+                    with self._timer.stage("normalize"):
+                        clean_post = self._normalize_post(post, category, keyword)
 
                     if not self._check_post_language(clean_post, lang):
+                        stats.rejected_language += 1
                         self._log(f"Post {clean_post['post_id']} ignorado (não é {lang.value.upper()})")
                         continue
 
-                    if clean_post["content_hash"] in content_hashes:
+                    if not dedup_index.add(clean_post["post_id"], clean_post["content_hash"]):
+                        stats.rejected_duplicate += 1
                         self._log(f"Post {clean_post['post_id']} ignorado (duplicado)")
                         continue
 
-                    content_hashes.add(clean_post["content_hash"])
+                    if self._near_duplicates is not None:
+                        with self._timer.stage("near_dup"):
+                            original = self._near_duplicates.add(clean_post["post_id"], f"{clean_post['title']} {clean_post['content']}")
+
+                        if original is not None:
+                            stats.rejected_near_duplicate += 1
+                            self._log(f"Post {clean_post['post_id']} ignorado (quase duplicado de {original})")
+                            continue
+
+                    accepted += 1
+                    stats.accepted += 1
 
                     self._log(f"Post {clean_post['post_id']} aceito!")
 
+                    if self._journal:
+                        self._journal.record_post(unit, clean_post)
+
                     yield clean_post
 
-                if len(content_hashes) >= total_per_word:
+                if self._watermarks and newest is not None:
+                    # Busca cortada pelo limite antes da marca: os posts entre ela e a marca antiga não foram vistos
+                    if watermark is None or reached_watermark or listed < total_per_word:
+                        self._watermarks.update(self._subreddit_name, query, newest)
+                    else:
+                        self._log(f"Palavra-chave '{query}' atingiu o limite antes da coleta anterior; marca d'água mantida (lacuna pendente)")
+
+                if self._journal:
+                    self._journal.complete_unit(unit)
+
+                if accepted >= total_per_word:
                     break
 
     def _normalize_post(self, post: "Submission", category: "Polarity", keyword: str) -> "PostRecord":
@@ -150,8 +343,8 @@ class RedditCollector:
               `UNKNOWN_AUTHOR_PLACEHOLDER` definido no subpacote `model`.
         """
 
-        preprocess_title = normalize_text(post.title) or ""
-        preprocess_content = normalize_text(post.selftext) or ""
+        preprocess_title = normalize_text(post.title, timer=self._timer) or ""
+        preprocess_content = normalize_text(post.selftext, timer=self._timer) or ""
 
         return pack_post(
             post_id=str(post.id),
@@ -160,31 +353,85 @@ class RedditCollector:
             author=str(post.author) if post.author else UNKNOWN_AUTHOR_PLACEHOLDER,
             category=category,
             keyword=keyword,
-            subreddit=self._subreddit_name,
+            subreddit=str(post.subreddit) if MULTIREDDIT_SEPARATOR in self._subreddit_name else self._subreddit_name,
             created_at=post.created_utc,
         )
 
+    @staticmethod
+    def _build_query(batch: list[str]) -> str:
+        """
+        Combina um lote de palavras-chave em uma única consulta de busca do Reddit.
+
+        Args:
+            batch (list[str]): Palavras-chave do lote.
+
+        Returns:
+            str: A própria palavra-chave, para lotes unitários; caso contrário, as palavras
+                unidas por ``OR`` (expressões com espaço ficam entre aspas).
+        """
+
+        if len(batch) == 1:
+            return batch[0]
+
+        return _QUERY_OPERATOR.join(f'"{keyword}"' if " " in keyword else keyword for keyword in batch)
+
+    @staticmethod
+    def _attribute_keyword(post: "Submission", batch: list[str], matcher: KeywordMatcher) -> Optional[str]:
+        """
+        Atribui um post retornado por uma busca combinada à palavra-chave do lote que ele contém.
+
+        Args:
+            post (Submission): Submissão bruta retornada pela API.
+            batch (list[str]): Palavras-chave do lote, em ordem de prioridade.
+            matcher (KeywordMatcher): Matcher compilado com as palavras-chave da polaridade (o lote inclusive).
+
+        Returns:
+            Optional[str]: A primeira palavra-chave do lote presente no título ou no corpo,
+                ou `None` se nenhuma estiver presente.
+        """
+
+        found = set(matcher.matched_keywords(f"{post.title} {post.selftext}"))
+
+        for keyword in batch:
+            if keyword in found:
+                return keyword
+
+        return None
+
     def _check_post_language(self, post: "PostRecord", lang: "Language") -> bool:
         """
         Verifica se o conteúdo ou título de um post corresponde ao idioma esperado.
 
-        Delega a detecção de idioma à função `matches_language` do subpacote `nlp`,
-        aplicando-a separadamente ao conteúdo e ao título do post. O critério é
-        inclusivo: basta que um dos dois campos corresponda ao idioma alvo para
-        que o post seja aceito.
+        Delega a detecção de idioma ao `LanguageIdentifier` do subpacote `nlp`, que classifica
+        conteúdo e título em um único lote, ou à função `matches_language` (langdetect),
+        aplicada separadamente a cada campo. O critério é inclusivo: basta que um dos
+        dois campos corresponda ao idioma alvo para que o post seja aceito.
+
+        Com `language_cache`, os idiomas de conteúdo (chave `content_hash`) e título são
+        consultados no cache e o detector só é executado para os campos ainda ausentes.
 
         Args:
             post (PostRecord): Dicionário estruturado do post contendo os campos
                 ``"content"`` e ``"title"`` já normalizados.
             lang (Language): Idioma esperado para o post, utilizado como critério
-                de filtragem pela função `matches_language`.
+                de filtragem.
 
         Returns:
             bool: `True` se o conteúdo **ou** o título do post corresponderem
                 ao idioma `lang`; `False` caso contrário.
         """
 
-        return matches_language(post["content"], lang) or matches_language(post["title"], lang)
+        with self._timer.stage("language"):
+            if self._language_cache is not None:
+                texts = [post["content"], post["title"]]
+                hashes = [post["content_hash"], text_hash(post["title"])]
+
+                return lang.value in self._language_cache.detect_batch(texts, self._language_detector, hashes)
+
+            if self._language_identifier:
+                return lang in self._language_identifier.detect_batch([post["content"], post["title"]])
+
+            return matches_language(post["content"], lang) or matches_language(post["title"], lang)
 
     def _log(self, message: str) -> None:
         """
@@ -0,0 +1,88 @@
+from threading import Lock
+
+
+class CollectionStats:
+    """
+    Contadores de trabalho executado e evitado durante uma coleta.
+
+    Permite verificar, em execuções reais, quanto do pipeline caro (normalização de
+    texto e detecção de idioma) foi poupado pelos atalhos de deduplicação.
+
+    Attributes:
+        fetched (int): Submissões recebidas da API.
+        skipped_indexed (int): Posts descartados porque o índice de deduplicação já os conhecia.
+        skipped_seen (int): Posts descartados porque o mesmo `post_id` já foi avaliado nesta coleta
+            (ex.: retornado por outra palavra-chave).
+        skipped_raw_duplicate (int): Posts descartados porque título e corpo brutos são idênticos
+            aos de um post já avaliado nesta coleta.
+        unattributed (int): Posts de buscas combinadas que não contêm nenhuma palavra-chave do lote.
+        normalized (int): Posts que passaram pela normalização e detecção de idioma.
+        rejected_language (int): Posts descartados por não estarem no idioma esperado.
+        rejected_duplicate (int): Posts descartados por conteúdo normalizado duplicado.
+        rejected_near_duplicate (int): Posts descartados por serem quase duplicados (MinHash/LSH) de um post aceito.
+        accepted (int): Posts aceitos e emitidos.
+    """
+
+    _FIELDS = (
+        "fetched",
+        "skipped_indexed",
+        "skipped_seen",
+        "skipped_raw_duplicate",
+        "unattributed",
+        "normalized",
+        "rejected_language",
+        "rejected_duplicate",
+        "rejected_near_duplicate",
+        "accepted",
+    )
+    """Nomes dos contadores, na ordem de apresentação."""
+
+    def __init__(self) -> None:
+        """Inicializa todos os contadores com zero."""
+
+        self.fetched = 0
+        self.skipped_indexed = 0
+        self.skipped_seen = 0
+        self.skipped_raw_duplicate = 0
+        self.unattributed = 0
+        self.normalized = 0
+        self.rejected_language = 0
+        self.rejected_duplicate = 0
+        self.rejected_near_duplicate = 0
+        self.accepted = 0
+
+        self._lock = Lock()
+        """Lock que protege `merge` quando vários workers consolidam seus contadores."""
+
+    @property
+    def skipped(self) -> int:
+        """Total de posts descartados sem normalização nem detecção de idioma."""
+
+        return self.skipped_indexed + self.skipped_seen + self.skipped_raw_duplicate
+
+    def merge(self, other: "CollectionStats") -> None:
+        """
+        Soma os contadores de outra instância a esta.
+
+        Args:
+            other (CollectionStats): Contadores a acumular (ex.: de um worker concorrente).
+        """
+
+        with self._lock:
+            for field in self._FIELDS:
+                setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def as_dict(self) -> dict[str, int]:
+        """
+        Exporta os contadores como dicionário.
+
+        Returns:
+            dict[str, int]: Mapeamento ``nome -> valor`` de cada contador.
+        """
+
+        return {field: getattr(self, field) for field in self._FIELDS}
+
+    def __repr__(self) -> str:
+        counters = ", ".join(f"{field}={value}" for field, value in self.as_dict().items())
+
+        return f"CollectionStats({counters})"
@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+
+class WatermarkStore:
+    """
+    Armazena a marca d'água (`created_at` mais recente) de cada par ``(subreddit, palavra-chave)``.
+
+    Habilita a coleta incremental: como a busca no Reddit é ordenada do post mais
+    novo para o mais antigo (``sort="new"``), a paginação pode ser interrompida assim
+    que um post igual ou anterior à marca da última execução é encontrado.
+
+    Attributes:
+        _path (Path): Arquivo JSON onde as marcas são persistidas.
+
+    Observações:
+        - As marcas atualizadas ficam em memória até `save()`, de modo que uma execução
+          cujos posts não chegaram ao disco não avança as marcas da próxima.
+        - A escrita é atômica (arquivo temporário + `replace`).
+        - É seguro para uso entre threads.
+    """
+
+    _SEPARATOR = "\t"
+    """Separador usado para compor a chave textual ``subreddit<TAB>palavra-chave`` no JSON."""
+
+    def __init__(self, path: str | Path):
+        """
+        Carrega as marcas existentes no arquivo, se houver.
+
+        Args:
+            path (str | Path): Caminho do arquivo JSON de marcas d'água.
+        """
+
+        self._path = Path(path)
+
+        self._marks: dict[str, float] = {}
+        """Marcas por chave ``subreddit<TAB>palavra-chave``."""
+
+        self._lock = Lock()
+        """Lock que protege o dicionário de marcas."""
+
+        if self._path.exists():
+            self._marks = {key: float(value) for key, value in json.loads(self._path.read_text(encoding="utf-8")).items()}
+
+    def get(self, subreddit_name: str, keyword: str) -> Optional[float]:
+        """
+        Retorna a marca d'água de um par ``(subreddit, palavra-chave)``.
+
+        Args:
+            subreddit_name (str): Nome do subreddit.
+            keyword (str): Palavra-chave de busca.
+
+        Returns:
+            Optional[float]: Timestamp UTC (epoch) do post mais recente já coletado, ou `None`
+                se o par nunca foi coletado.
+        """
+
+        with self._lock:
+            return self._marks.get(self._key(subreddit_name, keyword))
+
+    def update(self, subreddit_name: str, keyword: str, created_at: float) -> None:
+        """
+        Avança a marca d'água de um par, nunca a retrocedendo.
+
+        Args:
+            subreddit_name (str): Nome do subreddit.
+            keyword (str): Palavra-chave de busca.
+            created_at (float): Timestamp UTC (epoch) do post mais recente visto na busca.
+        """
+
+        key = self._key(subreddit_name, keyword)
+
+        with self._lock:
+            current = self._marks.get(key)
+
+            if current is None or created_at > current:
+                self._marks[key] = created_at
+
+    def save(self) -> None:
+        """Persiste as marcas no arquivo JSON de forma atômica."""
+
+        with self._lock:
+            payload = json.dumps(self._marks, ensure_ascii=False, indent=2, sort_keys=True)
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        tmp_path.replace(self._path)
+
+    def _key(self, subreddit_name: str, keyword: str) -> str:
+        """Compõe a chave textual do par ``(subreddit, palavra-chave)``."""
+
+        return f"{subreddit_name}{self._SEPARATOR}{keyword}"
@@ -4,17 +4,23 @@ Módulo de manipulação de dados e arquivos.
 Fornece as implementações concretas das interfaces comuns para ler, salvar
 e converter dados. Encapsula o uso de bibliotecas (como `pandas`) para
 manipulação de dados e operações de I/O em formatos tabulares
-(CSV, XLSX, etc.).
+(CSV, XLSX, etc.), inclusive escrita incremental em blocos.
 """
 
+from .chunked import DEFAULT_CHUNK_SIZE, ChunkedPostWriter
 from .conveter import ConverterFactory, FileFormat
-from .csv import CSVPostSaver
-from .xlsx import XLSXColumnReader, XLSXPostSaver
+from .csv import CSVColumnReader, CSVPostSaver, CSVPostWriter
+from .xlsx import XLSXColumnReader, XLSXPostSaver, XLSXPostWriter
 
 __all__ = [
+    "ChunkedPostWriter",
     "ConverterFactory",
+    "CSVColumnReader",
     "CSVPostSaver",
+    "CSVPostWriter",
+    "DEFAULT_CHUNK_SIZE",
     "XLSXColumnReader",
     "XLSXPostSaver",
+    "XLSXPostWriter",
     "FileFormat",
 ]
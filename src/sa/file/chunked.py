@@ -0,0 +1,147 @@
+from abc import abstractmethod
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from sa.common import FileWriterABC
+from sa.logger import NULL_TIMER
+from sa.sentiment import SENTIMENT_COLUMN
+
+if TYPE_CHECKING:
+    from sa.logger import StageTimer
+    from sa.model import PostRecord
+    from sa.sentiment import SentimentScorer
+
+DEFAULT_CHUNK_SIZE = 1000
+"""Quantidade padrão de posts acumulados em memória antes de cada descarga para o arquivo."""
+
+
+class ChunkedPostWriter(FileWriterABC["PostRecord"]):
+    """
+    Escritor incremental de posts que descarrega o arquivo em blocos de tamanho fixo.
+
+    Implementa `FileWriterABC` recebendo um post por vez: os registros são acumulados
+    até `chunk_size` e então convertidos em um `DataFrame` pequeno e anexados ao arquivo.
+    Assim, o pico de memória depende apenas do tamanho do bloco, e não do volume total
+    da coleta, permitindo encadear o gerador do coletor diretamente à escrita.
+
+    Attributes:
+        _path (Path): Caminho final do arquivo de saída.
+        _chunk_size (int): Quantidade de posts por bloco descarregado.
+        written (int): Total de posts já recebidos pelo escritor.
+
+    Observações:
+        - As colunas são fixadas pelo primeiro bloco; os seguintes são alinhados a elas.
+        - A coluna `created_at` é convertida com `pd.to_datetime` bloco a bloco, como nos salvadores.
+        - O arquivo só é criado na primeira descarga; sem posts, nada é gravado.
+        - Com um `scorer`, cada bloco é pontuado de uma só vez e ganha a coluna `SENTIMENT_COLUMN`.
+        - Subclasses implementam `_write_chunk` e, se necessário, `_finish`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timer: Optional["StageTimer"] = None,
+        scorer: Optional["SentimentScorer"] = None,
+    ):
+        """
+        Prepara o escritor para o arquivo de destino.
+
+        Args:
+            path (str | Path): Caminho do arquivo de saída.
+            chunk_size (int, optional): Quantidade de posts acumulados antes de cada descarga.
+            timer (Optional[StageTimer], optional): Temporizador onde cada descarga é medida como etapa ``export``.
+            scorer (Optional[SentimentScorer], optional): Pontuador que acrescenta a coluna de sentimento a cada bloco.
+
+        Raises:
+            ValueError: Se `chunk_size` for menor que 1.
+        """
+
+        if chunk_size < 1:
+            raise ValueError("O tamanho do bloco de escrita deve ser maior ou igual a 1.")
+
+        self._path = Path(path)
+        self._chunk_size = chunk_size
+        self._timer = timer if timer is not None else NULL_TIMER
+        self._scorer = scorer
+
+        self._buffer: list["PostRecord"] = []
+        """Posts recebidos desde a última descarga."""
+
+        self._columns: Optional[list[str]] = None
+        """Colunas do arquivo, definidas pelo primeiro bloco descarregado."""
+
+        self.written = 0
+        """Total de posts recebidos pelo escritor."""
+
+    def write(self, value: "PostRecord") -> None:
+        """
+        Acrescenta um post ao bloco corrente, descarregando-o ao atingir `chunk_size`.
+
+        Args:
+            value (PostRecord): Post a ser gravado.
+        """
+
+        self._buffer.append(value)
+        self.written += 1
+
+        if len(self._buffer) >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Descarrega no arquivo os posts acumulados no bloco corrente."""
+
+        if not self._buffer:
+            return
+
+        df = pd.DataFrame(self._buffer)
+        self._buffer = []
+
+        if self._scorer is not None:
+            df[SENTIMENT_COLUMN] = self._scorer.score_frame(df, timer=self._timer)
+
+        with self._timer.stage("export", items=len(df)):
+            if self._columns is None:
+                self._columns = list(df.columns)
+            else:
+                df = df.reindex(columns=self._columns)
+
+            if "created_at" in df.columns:
+                df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
+
+            self._write_chunk(df)
+
+    def close(self) -> None:
+        """Descarrega o bloco pendente e finaliza o arquivo."""
+
+        self.flush()
+
+        if self._columns is not None:
+            with self._timer.stage("export", items=0):
+                self._finish()
+
+    @abstractmethod
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        """
+        Grava um bloco de posts no arquivo.
+
+        Args:
+            df (pd.DataFrame): Bloco já alinhado às colunas do arquivo.
+        """
+
+    def _finish(self) -> None:
+        """Finaliza o arquivo após o último bloco; por padrão, não faz nada."""
+
+    def __enter__(self) -> "ChunkedPostWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -1,12 +1,16 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import pandas as pd
 
-from sa.common import FileSaverABC
+from sa.common import FileReaderABC, FileSaverABC
+
+from .chunked import DEFAULT_CHUNK_SIZE, ChunkedPostWriter
 
 if TYPE_CHECKING:
+    from sa.logger import StageTimer
     from sa.model import PostRecord
+    from sa.sentiment import SentimentScorer
 
 
 class CSVPostSaver(FileSaverABC["PostRecord"]):
@@ -22,28 +26,30 @@ class CSVPostSaver(FileSaverABC["PostRecord"]):
         _path (Path): Caminho resolvido de gravação do arquivo .csv no disco.
 
     Observações:
-        - Delega ao Pandas a conversão dos Dicionários brutos listados através do DataFrame.
+        - Delega ao `CSVPostWriter` a escrita em blocos, convertidos via DataFrame do Pandas.
         - Converte automaticamente datas em texto para tipos temporais `pd.to_datetime`.
     """
 
-    def __init__(self, path: str | Path):
+    def __init__(self, path: str | Path, timer: Optional["StageTimer"] = None):
         """
         Prepara a intância do salvador fornecendo o local de armazenamento persistente do CSV.
 
         Args:
             path (str | Path): Diretório somado ao nome do arquivo (eg "posts_coletados.csv").
                 Será avaliado com `Path` interno garantindo suporte multiplataforma.
+            timer (Optional[StageTimer], optional): Temporizador onde a escrita é medida como etapa ``export``.
         """
 
         self._path = Path(path)
+        self._timer = timer
 
     def save(self, values: Iterable["PostRecord"]) -> None:
         """
         Efetua a execução em massa da iteração de posts transformando-as em arquivo.
 
-        Converte a sequência ou gerador que foi fornecida em listas explícitas para garantir
-        tamanho e a inferência automatizada do layout do Dataframe. Caso hajam dados na coluna
-        `created_at`, é aplicado parsing de correção temporal ignorando campos de coerção duvidosa.
+        Consome a sequência ou gerador fornecido em blocos através do `CSVPostWriter`, sem
+        materializar a coleção inteira em memória. Caso hajam dados na coluna `created_at`, é
+        aplicado parsing de correção temporal ignorando campos de coerção duvidosa.
         Finalmente, escreve os dados persistindo codificação global em UTF-8.
 
         Args:
@@ -53,14 +59,92 @@ class CSVPostSaver(FileSaverABC["PostRecord"]):
             ValueError: Se o conjunto avaliado for iterável porém retorne lista vazia ou for null.
         """
 
-        posts_list = list(values)
+        with CSVPostWriter(self._path, timer=self._timer) as writer:
+            for post in values:
+                writer.write(post)
 
-        if not posts_list:
+        if not writer.written:
             raise ValueError("Nenhum post para exportar.")
 
-        df: pd.DataFrame = pd.DataFrame(posts_list)
 
-        if "created_at" in df.columns:
-            df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
+class CSVPostWriter(ChunkedPostWriter):
+    """
+    Escritor incremental de posts em formato CSV.
+
+    Anexa cada bloco ao arquivo com `DataFrame.to_csv`: o primeiro bloco cria o arquivo
+    com o cabeçalho e os seguintes são acrescentados em modo append, sem cabeçalho.
+
+    Observações:
+        - A codificação é UTF-8 e o índice do DataFrame é omitido, como em `CSVPostSaver`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timer: Optional["StageTimer"] = None,
+        scorer: Optional["SentimentScorer"] = None,
+    ):
+        """
+        Prepara o escritor para o arquivo CSV de destino.
+
+        Args:
+            path (str | Path): Caminho do arquivo `.csv` de saída.
+            chunk_size (int, optional): Quantidade de posts acumulados antes de cada descarga.
+            timer (Optional[StageTimer], optional): Temporizador onde cada descarga é medida como etapa ``export``.
+            scorer (Optional[SentimentScorer], optional): Pontuador que acrescenta a coluna de sentimento a cada bloco.
+        """
+
+        super().__init__(path, chunk_size, timer, scorer)
+
+        self._started = False
+        """Indica se o cabeçalho já foi gravado."""
+
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._path, mode="a" if self._started else "w", header=not self._started, index=False, encoding="utf-8")
+        self._started = True
+
+
+class CSVColumnReader(FileReaderABC[list[str]]):
+    """
+    Leitor concreto que extrai os valores textuais de uma coluna de um arquivo CSV.
+
+    Contraparte em CSV do `XLSXColumnReader`: lê via Pandas apenas a coluna requerida,
+    descarta valores nulos e devolve os demais convertidos para string.
+
+    Attributes:
+        _path (Path): Caminho do arquivo .csv lido.
+        _column (str): Título da coluna cujos valores serão extraídos.
+    """
+
+    def __init__(self, path: str | Path, column: str) -> None:
+        """
+        Prepara o leitor para a coluna do arquivo CSV informado.
+
+        Args:
+            path (str | Path): Caminho do arquivo CSV.
+            column (str): Título da coluna no cabeçalho.
+        """
+
+        self._path = Path(path)
+        self._column = column
+
+    def read(self) -> list[str]:
+        """
+        Lê a coluna configurada, ignorando valores ausentes.
+
+        Returns:
+            list[str]: Valores da coluna convertidos para string, na ordem do arquivo.
+
+        Raises:
+            KeyError: Se a coluna não existir no cabeçalho do arquivo.
+        """
+
+        df: pd.DataFrame = pd.read_csv(self._path)
+
+        if self._column not in df.columns:
+            raise KeyError(f"Coluna '{self._column}' não encontrada em '{self._path.name}'.")
+
+        df = df.dropna(subset=[self._column])
 
-        df.to_csv(self._path, index=False, encoding="utf-8")
+        return [str(v) for v in df[self._column]]
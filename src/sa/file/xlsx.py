@@ -1,12 +1,19 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import pandas as pd
+from openpyxl import Workbook  # type: ignore[import-untyped]
 
 from sa.common import FileReaderABC, FileSaverABC
 
+from .chunked import DEFAULT_CHUNK_SIZE, ChunkedPostWriter
+
 if TYPE_CHECKING:
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet  # type: ignore[import-untyped]
+
+    from sa.logger import StageTimer
     from sa.model import PostRecord
+    from sa.sentiment import SentimentScorer
 
 
 class XLSXPostSaver(FileSaverABC["PostRecord"]):
@@ -24,11 +31,11 @@ class XLSXPostSaver(FileSaverABC["PostRecord"]):
 
     Observações:
         - Dependências exclusas: É obrigatória a instalação do módulo externo de extração (openpyxl).
-        - Os metadados criados podem consumir processamento temporário acentuado (to_excel) se a base de dados
-         ultrapassar tamanhos gigantescos por usar serialização do office XML.
+        - A escrita é delegada ao `XLSXPostWriter`, que serializa o office XML em blocos (openpyxl `write_only`),
+         mantendo o consumo de memória estável mesmo em bases gigantescas.
     """
 
-    def __init__(self, path: str | Path, sheet_name: str = "posts"):
+    def __init__(self, path: str | Path, sheet_name: str = "posts", timer: Optional["StageTimer"] = None):
         """
         Instancia parâmetros locais para a geração do XLSX exportado definindo comportamentos.
 
@@ -36,16 +43,18 @@ class XLSXPostSaver(FileSaverABC["PostRecord"]):
             path (str | Path): O caminho para arquivo final `.xlsx` a ser redigido.
             sheet_name (str, optional): Indica a guia de trabalho que será reescrita para aceitar o dataset.
                 Por default assume "posts" para não poluir ou sobreescrever guias antigas "Sheet1".
+            timer (Optional[StageTimer], optional): Temporizador onde a escrita é medida como etapa ``export``.
         """
 
         self._path = Path(path)
         self._sheet_name = sheet_name
+        self._timer = timer
 
     def save(self, values: Iterable["PostRecord"]) -> None:
         """
         Consolida iterador de Posts dentro do workbook do arquivo selecionado de escrita em disco.
 
-        Esgota o array passado construindo primeiramente a dimensão analítica sobre as colunas. Processa a
+        Consome o iterador em blocos através do `XLSXPostWriter`, sem materializar a coleção inteira. Processa a
         coluna com tags temporárias e garante o dump efetivando transação segura com o índice zerado para não
         produzir formatações estranhas e índices perdidos que prejudiquem visões dos usuários finais em programas
         como o Office ou Libre Office.
@@ -57,17 +66,75 @@ class XLSXPostSaver(FileSaverABC["PostRecord"]):
             ValueError: Interrompe a transação a disco em casos onde são passadas coleções de tamanho zero (listas vazias).
         """
 
-        posts_list = list(values)
+        with XLSXPostWriter(self._path, sheet_name=self._sheet_name, timer=self._timer) as writer:
+            for post in values:
+                writer.write(post)
 
-        if not posts_list:
+        if not writer.written:
             raise ValueError("Nenhum post para exportar.")
 
-        df = pd.DataFrame(posts_list)
 
-        if "created_at" in df.columns:
-            df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
+class XLSXPostWriter(ChunkedPostWriter):
+    """
+    Escritor incremental de posts em formato Excel (XLSX).
+
+    Utiliza o modo `write_only` do openpyxl, no qual cada linha anexada é serializada
+    imediatamente em um arquivo temporário, em vez de manter a planilha inteira em memória
+    como faz `DataFrame.to_excel`. O workbook é consolidado no destino ao fechar o escritor.
+
+    Attributes:
+        _sheet_name (str): Planilha destino onde ficam os registros.
+
+    Observações:
+        - Dependências exclusas: É obrigatória a instalação do módulo externo openpyxl.
+        - Valores ausentes (`NaN`/`NaT`) são gravados como células vazias.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        sheet_name: str = "posts",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timer: Optional["StageTimer"] = None,
+        scorer: Optional["SentimentScorer"] = None,
+    ):
+        """
+        Prepara o escritor para o arquivo XLSX de destino.
+
+        Args:
+            path (str | Path): Caminho do arquivo `.xlsx` de saída.
+            sheet_name (str, optional): Nome da planilha que recebe os registros.
+            chunk_size (int, optional): Quantidade de posts acumulados antes de cada descarga.
+            timer (Optional[StageTimer], optional): Temporizador onde cada descarga é medida como etapa ``export``.
+            scorer (Optional[SentimentScorer], optional): Pontuador que acrescenta a coluna de sentimento a cada bloco.
+        """
+
+        super().__init__(path, chunk_size, timer, scorer)
+
+        self._sheet_name = sheet_name
+
+        self._workbook: Optional[Workbook] = None
+        """Workbook em modo `write_only`, criado na primeira descarga."""
+
+        self._sheet: Optional["WriteOnlyWorksheet"] = None
+        """Planilha que recebe as linhas."""
+
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        if self._sheet is None:
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet(self._sheet_name)
+            self._sheet.append(list(df.columns))
+
+        rows = df.astype(object).where(df.notna(), None)
+
+        for row in rows.itertuples(index=False, name=None):
+            self._sheet.append(list(row))
 
-        df.to_excel(self._path, index=False, sheet_name=self._sheet_name)
+    def _finish(self) -> None:
+        if self._workbook is not None:
+            self._workbook.save(self._path)
+            self._workbook = None
+            self._sheet = None
 
 
 class XLSXColumnReader(FileReaderABC[list[str]]):
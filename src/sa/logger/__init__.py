@@ -4,15 +4,18 @@ Módulo de registro de eventos (logging).
 Fornece infraestrutura centralizada e configurável para registro de eventos
 (logs) do sistema. Contém loggers genéricos e especializados para diferentes
 componentes do pipeline de NLP, padronizando os formatos de saída e os níveis
-de severidade.
+de severidade, além da instrumentação de tempo por etapa do pipeline.
 """
 
 from .reddit import RedditLogger, create_reddit_logger
+from .timing import NULL_TIMER, StageTimer
 from .utils import Logger, create_logger
 
 __all__ = [
     "create_logger",
     "create_reddit_logger",
     "Logger",
+    "NULL_TIMER",
     "RedditLogger",
+    "StageTimer",
 ]
@@ -0,0 +1,201 @@
+from contextlib import AbstractContextManager, nullcontext
+from threading import Lock
+from time import perf_counter
+from types import TracebackType
+from typing import Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """
+    Instrumentação de tempo por etapa do pipeline (tempo de parede, chamadas e itens).
+
+    Cada etapa nomeada (ex.: ``search``, ``normalize``, ``language``, ``export``) acumula o
+    tempo gasto, a quantidade de chamadas e a quantidade de itens processados, permitindo
+    identificar onde uma coleta lenta gasta seu tempo e qual a vazão (itens/s) de cada etapa.
+
+    Observações:
+        - Com vários workers, o tempo de uma etapa é a soma do tempo gasto em cada thread.
+        - Etapas podem ser aninhadas (ex.: ``demojize`` dentro de ``normalize``); o tempo da
+          etapa interna também é contado na externa.
+        - Quando a instrumentação está desativada, use `NULL_TIMER`, cujo custo é praticamente nulo.
+        - É seguro para uso entre threads.
+    """
+
+    enabled = True
+    """Indica se o temporizador registra medições."""
+
+    def __init__(self) -> None:
+        """Inicializa o temporizador sem nenhuma etapa registrada."""
+
+        self._stages: dict[str, list[float]] = {}
+        """Acumuladores ``[segundos, chamadas, itens]`` por etapa, na ordem da primeira medição."""
+
+        self._lock = Lock()
+        """Lock que protege os acumuladores."""
+
+    def stage(self, name: str, items: int = 1) -> AbstractContextManager[object]:
+        """
+        Mede o tempo de um bloco como uma chamada da etapa informada.
+
+        Args:
+            name (str): Nome da etapa.
+            items (int, optional): Itens processados pelo bloco (ex.: linhas de um bloco exportado).
+
+        Returns:
+            AbstractContextManager[object]: Gerenciador de contexto que registra a medição ao sair do bloco.
+        """
+
+        return _Stage(self, name, items)
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Mede o tempo gasto para obter cada item de um iterável (ex.: paginação de uma busca).
+
+        Args:
+            name (str): Nome da etapa.
+            iterable (Iterable[T]): Iterável cujo avanço será medido.
+
+        Yields:
+            T: Os itens do iterável, inalterados.
+        """
+
+        iterator = iter(iterable)
+
+        while True:
+            start = perf_counter()
+
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.record(name, perf_counter() - start, items=0)
+                return
+
+            self.record(name, perf_counter() - start)
+
+            yield item
+
+    def record(self, name: str, seconds: float, items: int = 1) -> None:
+        """
+        Registra uma medição da etapa.
+
+        Args:
+            name (str): Nome da etapa.
+            seconds (float): Tempo de parede gasto.
+            items (int, optional): Itens processados na medição.
+        """
+
+        with self._lock:
+            totals = self._stages.setdefault(name, [0.0, 0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+            totals[2] += items
+
+    def merge(self, other: "StageTimer") -> None:
+        """
+        Soma as medições de outro temporizador a este.
+
+        Args:
+            other (StageTimer): Temporizador cujas etapas serão acumuladas.
+        """
+
+        for name, (seconds, calls, items) in other.as_dict().items():
+            with self._lock:
+                totals = self._stages.setdefault(name, [0.0, 0, 0])
+                totals[0] += seconds
+                totals[1] += calls
+                totals[2] += items
+
+    def as_dict(self) -> dict[str, tuple[float, int, int]]:
+        """
+        Exporta as medições acumuladas.
+
+        Returns:
+            dict[str, tuple[float, int, int]]: Mapeamento ``etapa -> (segundos, chamadas, itens)``.
+        """
+
+        with self._lock:
+            return {name: (seconds, int(calls), int(items)) for name, (seconds, calls, items) in self._stages.items()}
+
+    def throughput(self, name: str) -> float:
+        """
+        Vazão da etapa, em itens por segundo.
+
+        Args:
+            name (str): Nome da etapa.
+
+        Returns:
+            float: Itens processados por segundo de etapa, ou ``0.0`` se a etapa não foi medida.
+        """
+
+        seconds, _, items = self.as_dict().get(name, (0.0, 0, 0))
+
+        return items / seconds if seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """
+        Formata as medições como tabela de texto, uma etapa por linha.
+
+        Returns:
+            str: Tabela com tempo total, chamadas, itens, tempo médio por chamada e vazão de cada etapa.
+        """
+
+        lines = [f"{'etapa':<12} {'tempo (s)':>10} {'chamadas':>10} {'itens':>10} {'média (ms)':>11} {'itens/s':>10}"]
+
+        for name, (seconds, calls, items) in self.as_dict().items():
+            mean_ms = seconds / calls * 1000 if calls else 0.0
+            rate = items / seconds if seconds > 0 else 0.0
+
+            lines.append(f"{name:<12} {seconds:>10.3f} {calls:>10d} {items:>10d} {mean_ms:>11.3f} {rate:>10.1f}")
+
+        return "\n".join(lines)
+
+
+class _Stage:
+    """Gerenciador de contexto que mede um bloco e o registra em um `StageTimer`."""
+
+    __slots__ = ("_timer", "_name", "_items", "_start")
+
+    def __init__(self, timer: StageTimer, name: str, items: int):
+        self._timer = timer
+        self._name = name
+        self._items = items
+        self._start = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self._start = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self._timer.record(self._name, perf_counter() - self._start, self._items)
+
+
+class _NullStageTimer(StageTimer):
+    """Temporizador desativado: não mede nem registra nada."""
+
+    enabled = False
+
+    _NULL_STAGE = nullcontext()
+    """Contexto vazio e reutilizável devolvido por `stage`."""
+
+    def stage(self, name: str, items: int = 1) -> AbstractContextManager[object]:
+        return self._NULL_STAGE
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        return iter(iterable)
+
+    def record(self, name: str, seconds: float, items: int = 1) -> None:
+        return None
+
+    def merge(self, other: StageTimer) -> None:
+        return None
+
+
+NULL_TIMER: StageTimer = _NullStageTimer()
+"""Temporizador desativado compartilhado, usado por padrão quando a instrumentação não é solicitada."""
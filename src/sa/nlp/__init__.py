@@ -5,14 +5,75 @@ Providencia as bibliotecas, funções analíticas e utilitários que tratam do
 text mining (limpeza, lematização, filtragem e análise de sentimentos lexical).
 """
 
-from .language import matches_language, normalize_text, preprocess_text
-from .stopwords import build_stopwords, load_base_stopwords, load_extra_stopwords
+from .bow import CSRMatrix, Vocabulary
+from .cache import DEFAULT_DOCUMENT_CACHE_SIZE, LRUCache, PreprocessCache
+from .hashing import DEFAULT_HASH_FEATURES, HashingVectorizer
+from .keywords import KeywordMatch, KeywordMatcher, load_keywords
+from .langcache import LanguageCache, text_hash
+from .langid import LanguageDetector, LanguageIdentifier, detect_languages, get_language_identifier
+from .language import (
+    DEFAULT_ALLOWED_POS,
+    DEFAULT_BATCH_SIZE,
+    langdetect_language,
+    matches_language,
+    normalize_text,
+    normalize_texts,
+    preprocess_text,
+    preprocess_texts,
+)
+from .minhash import DEFAULT_NEAR_DUPLICATE_THRESHOLD, MinHasher, NearDuplicateIndex, find_near_duplicates
+from .ngrams import MAX_NGRAM_ORDER, NGramCounter
+from .parallel import DEFAULT_CHUNK_SIZE, PreprocessPool
+from .pipeline import DEFAULT_SPACY_MODEL, PipelineInfo, PipelineProfile, clear_pipeline_cache, load_pipeline, pipeline_info
+from .stopwords import DEFAULT_STOPWORDS_CACHE_DIR, build_stopwords, load_base_stopwords, load_extra_stopwords, load_stopwords, stopwords_fingerprint
+from .tokencache import DEFAULT_TOKEN_CACHE_DIR, TokenCorpusCache, token_cache_fingerprint
 
 __all__ = [
     "build_stopwords",
+    "clear_pipeline_cache",
+    "CSRMatrix",
+    "DEFAULT_ALLOWED_POS",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_DOCUMENT_CACHE_SIZE",
+    "DEFAULT_HASH_FEATURES",
+    "DEFAULT_NEAR_DUPLICATE_THRESHOLD",
+    "DEFAULT_SPACY_MODEL",
+    "DEFAULT_STOPWORDS_CACHE_DIR",
+    "DEFAULT_TOKEN_CACHE_DIR",
+    "detect_languages",
+    "find_near_duplicates",
+    "get_language_identifier",
     "preprocess_text",
+    "preprocess_texts",
+    "langdetect_language",
+    "HashingVectorizer",
+    "KeywordMatch",
+    "KeywordMatcher",
+    "LanguageCache",
+    "LanguageDetector",
+    "LanguageIdentifier",
     "load_base_stopwords",
     "load_extra_stopwords",
+    "load_keywords",
+    "load_pipeline",
+    "load_stopwords",
+    "LRUCache",
     "matches_language",
+    "MAX_NGRAM_ORDER",
+    "MinHasher",
+    "NearDuplicateIndex",
+    "NGramCounter",
     "normalize_text",
+    "normalize_texts",
+    "pipeline_info",
+    "PipelineInfo",
+    "PipelineProfile",
+    "PreprocessCache",
+    "PreprocessPool",
+    "stopwords_fingerprint",
+    "text_hash",
+    "token_cache_fingerprint",
+    "TokenCorpusCache",
+    "Vocabulary",
 ]
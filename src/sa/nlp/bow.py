@@ -0,0 +1,194 @@
+"""Matrizes esparsas CSR em NumPy puro e vocabulário incremental para bag-of-words."""
+
+from __future__ import annotations
+
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+UNKNOWN_TERM = -1
+"""Id devolvido para termos ausentes de um vocabulário congelado (descartados das matrizes)."""
+
+
+class CSRMatrix(NamedTuple):
+    """
+    Matriz esparsa no formato CSR (Compressed Sparse Row), um documento por linha.
+
+    Os valores da linha ``i`` ficam em ``data[indptr[i]:indptr[i + 1]]`` e suas colunas em
+    ``indices[indptr[i]:indptr[i + 1]]``, ordenadas. É o mesmo layout de `scipy.sparse.csr_matrix`,
+    que pode ser construída diretamente a partir destes campos, mas sem exigir o SciPy.
+
+    Attributes:
+        data (np.ndarray): Valores não nulos (`float32`), ex.: contagem de cada termo no documento.
+        indices (np.ndarray): Coluna (`int32`) de cada valor.
+        indptr (np.ndarray): Início (`int64`) de cada linha em `data`, com ``n_rows + 1`` posições.
+        shape (tuple[int, int]): Quantidade de linhas (documentos) e colunas (termos).
+    """
+
+    data: np.ndarray
+    indices: np.ndarray
+    indptr: np.ndarray
+    shape: tuple[int, int]
+
+    @classmethod
+    def from_coordinates(cls, rows: np.ndarray, columns: np.ndarray, n_rows: int, n_features: int) -> "CSRMatrix":
+        """
+        Monta a matriz de contagens a partir das coordenadas ``(linha, coluna)`` de cada ocorrência.
+
+        Os pares são combinados em uma única chave inteira e contados com `np.unique`, que já os
+        devolve ordenados por linha e coluna; ocorrências repetidas viram uma contagem.
+
+        Args:
+            rows (np.ndarray): Linha (documento) de cada ocorrência.
+            columns (np.ndarray): Coluna (termo) de cada ocorrência, em ``[0, n_features)``.
+            n_rows (int): Quantidade de linhas da matriz.
+            n_features (int): Quantidade de colunas da matriz.
+
+        Returns:
+            CSRMatrix: Quantidade de ocorrências de cada coluna em cada linha.
+        """
+
+        width = max(n_features, 1)
+        keys, counts = np.unique(rows.astype(np.int64) * width + columns, return_counts=True)
+
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // width, minlength=n_rows), out=indptr[1:])
+
+        return cls(counts.astype(np.float32), (keys % width).astype(np.int32), indptr, (n_rows, n_features))
+
+    @classmethod
+    def from_ids(cls, ids: np.ndarray, lengths: np.ndarray, n_features: int) -> "CSRMatrix":
+        """
+        Monta a matriz de contagens a partir dos ids de termos de um lote de documentos.
+
+        Args:
+            ids (np.ndarray): Id de cada token do lote, documento após documento; ids negativos são descartados.
+            lengths (np.ndarray): Quantidade de tokens de cada documento.
+            n_features (int): Quantidade de colunas da matriz.
+
+        Returns:
+            CSRMatrix: Contagem de cada termo em cada documento.
+        """
+
+        rows = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+        kept = ids >= 0
+
+        return cls.from_coordinates(rows[kept], ids[kept], len(lengths), n_features)
+
+    @property
+    def nnz(self) -> int:
+        """Quantidade de valores não nulos armazenados."""
+
+        return len(self.data)
+
+    def row_indices(self) -> np.ndarray:
+        """
+        Expande `indptr` na linha de cada valor armazenado.
+
+        Returns:
+            np.ndarray: Linha (`int64`) de cada posição de `data`.
+        """
+
+        return np.repeat(np.arange(self.shape[0], dtype=np.int64), np.diff(self.indptr))
+
+    def __repr__(self) -> str:
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+class Vocabulary:
+    """
+    Mapeamento incremental de termos para colunas de uma matriz bag-of-words.
+
+    Com ``grow=True``, termos novos recebem a próxima coluna livre, de modo que o vocabulário
+    pode ser construído lote a lote enquanto o corpus é lido do disco; com ``grow=False``,
+    termos desconhecidos são descartados (uso em predição).
+
+    Attributes:
+        terms (dict[str, int]): Coluna de cada termo.
+
+    Observações:
+        - As colunas já atribuídas nunca mudam: matrizes de lotes anteriores continuam válidas,
+          apenas com menos colunas que as seguintes.
+    """
+
+    def __init__(self, terms: Iterable[str] = ()):
+        """
+        Cria o vocabulário.
+
+        Args:
+            terms (Iterable[str], optional): Termos iniciais, na ordem das colunas.
+        """
+
+        self.terms: dict[str, int] = {}
+
+        for term in terms:
+            self.terms.setdefault(term, len(self.terms))
+
+    def transform(self, documents: Iterable[Sequence[str]], grow: bool = False) -> CSRMatrix:
+        """
+        Converte documentos tokenizados na matriz de contagens de termos.
+
+        Os tokens do lote são fatorados com `pd.factorize` e apenas os termos distintos são
+        consultados (ou inseridos) no dicionário.
+
+        Args:
+            documents (Iterable[Sequence[str]]): Tokens de cada documento (ex.: saída de `preprocess_texts`).
+            grow (bool, optional): Insere no vocabulário os termos ainda desconhecidos.
+
+        Returns:
+            CSRMatrix: Matriz com ``len(self)`` colunas (após o crescimento).
+        """
+
+        batch = documents if isinstance(documents, list) else list(documents)
+        lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+        tokens = list(chain.from_iterable(batch))
+
+        if not tokens:
+            return CSRMatrix.from_ids(np.zeros(0, dtype=np.int64), lengths, len(self))
+
+        codes, uniques = pd.factorize(np.asarray(tokens, dtype=object))
+
+        if grow:
+            for term in uniques:
+                self.terms.setdefault(term, len(self.terms))
+
+        lookup = np.fromiter((self.terms.get(term, UNKNOWN_TERM) for term in uniques), dtype=np.int64, count=len(uniques))
+
+        return CSRMatrix.from_ids(lookup[codes], lengths, len(self))
+
+    def save(self, path: str | Path) -> None:
+        """
+        Grava o vocabulário como texto, um termo por linha, na ordem das colunas.
+
+        Args:
+            path (str | Path): Caminho do arquivo.
+        """
+
+        ordered = sorted(self.terms, key=self.terms.__getitem__)
+        Path(path).write_text("".join(f"{term}\n" for term in ordered), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Vocabulary":
+        """
+        Carrega um vocabulário gravado com `save`.
+
+        Args:
+            path (str | Path): Caminho do arquivo.
+
+        Returns:
+            Vocabulary: Vocabulário com as mesmas colunas.
+        """
+
+        return cls(Path(path).read_text(encoding="utf-8").splitlines())
+
+    def __contains__(self, term: object) -> bool:
+        return term in self.terms
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __repr__(self) -> str:
+        return f"Vocabulary(terms={len(self)})"
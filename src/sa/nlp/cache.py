@@ -0,0 +1,186 @@
+"""Caches LRU limitados para reaproveitar análises linguísticas de textos e lemas repetidos."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from hashlib import md5
+from threading import Lock
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_DOCUMENT_CACHE_SIZE = 100_000
+"""Quantidade padrão de documentos analisados mantidos em cache."""
+
+TokenAnalysis = tuple[tuple[str, str], ...]
+"""Alias de tipo para a análise de um documento: pares ``(lema normalizado, classe gramatical)`` de cada token."""
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Cache limitado com política de descarte do item menos recentemente usado (LRU).
+
+    Attributes:
+        maxsize (int): Quantidade máxima de itens mantidos.
+        hits (int): Consultas atendidas pelo cache.
+        misses (int): Consultas que não encontraram o item.
+
+    Observações:
+        - É seguro para uso entre threads.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Inicializa o cache vazio.
+
+        Args:
+            maxsize (int): Quantidade máxima de itens mantidos.
+
+        Raises:
+            ValueError: Se `maxsize` for menor que 1.
+        """
+
+        if maxsize < 1:
+            raise ValueError("O tamanho do cache deve ser maior ou igual a 1.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._items: OrderedDict[K, V] = OrderedDict()
+        """Itens do cache, do menos para o mais recentemente usado."""
+
+        self._lock = Lock()
+        """Lock que protege os itens e os contadores."""
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Consulta um item, marcando-o como recentemente usado.
+
+        Args:
+            key (K): Chave do item.
+
+        Returns:
+            Optional[V]: O valor em cache, ou `None` se ausente.
+        """
+
+        with self._lock:
+            value = self._items.get(key)
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Armazena um item, descartando o menos recentemente usado se o cache estiver cheio.
+
+        Args:
+            key (K): Chave do item.
+            value (V): Valor a armazenar (não pode ser `None`).
+        """
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas atendidas pelo cache (``0.0`` sem consultas)."""
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Descarta todos os itens e zera os contadores."""
+
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"LRUCache(size={len(self)}/{self.maxsize}, hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.1%})"
+
+
+class PreprocessCache:
+    """
+    Memoização do pré-processamento linguístico para textos repetidos.
+
+    Posts do Reddit são muito repetitivos: o mesmo texto reaparece em várias palavras-chave
+    e abas. Este cache evita executar o modelo spaCy novamente sobre textos já analisados.
+
+    Attributes:
+        documents (LRUCache[bytes, TokenAnalysis]): Análise de cada documento, indexada pelo hash
+            MD5 do texto pré-filtrado (sem acentos, pontuação e stopwords). Textos que diferem apenas
+            nesses aspectos (quase duplicados) compartilham a mesma entrada.
+
+    Observações:
+        - A análise guardada independe de `allowed_pos`, `min_token_len` e das stopwords: esses
+          filtros são reaplicados a cada consulta, então o mesmo cache serve chamadas com filtros diferentes.
+        - A análise depende do modelo: use um cache por modelo/perfil de pipeline.
+        - A normalização de cada lema (``lower``, ``strip`` e o descarte das risadas) não é memoizada:
+          recalculá-la custa menos que uma consulta ao `LRUCache`, protegida por lock.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_DOCUMENT_CACHE_SIZE):
+        """
+        Cria o cache de documentos.
+
+        Args:
+            maxsize (int, optional): Quantidade máxima de documentos analisados mantidos.
+        """
+
+        self.documents: LRUCache[bytes, TokenAnalysis] = LRUCache(maxsize)
+
+    @staticmethod
+    def key(prefiltered: str) -> bytes:
+        """
+        Calcula a chave de um documento a partir do texto pré-filtrado enviado ao modelo.
+
+        Args:
+            prefiltered (str): Texto já sem acentos, pontuação e stopwords.
+
+        Returns:
+            bytes: Digest MD5 do texto.
+        """
+
+        return md5(prefiltered.encode()).digest()
+
+    def stats(self) -> dict[str, float]:
+        """
+        Exporta as estatísticas de acerto do cache de documentos.
+
+        Returns:
+            dict[str, float]: Acertos, falhas, taxa de acerto e tamanho de ``documents``.
+        """
+
+        documents = self.documents
+
+        return {
+            "documents_hits": documents.hits,
+            "documents_misses": documents.misses,
+            "documents_hit_rate": documents.hit_rate,
+            "documents_size": len(documents),
+        }
+
+    def clear(self) -> None:
+        """Descarta todos os itens e zera as estatísticas."""
+
+        self.documents.clear()
+
+    def __repr__(self) -> str:
+        return f"PreprocessCache(documents={self.documents!r})"
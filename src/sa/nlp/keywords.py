@@ -0,0 +1,253 @@
+"""Localização de várias palavras-chave em uma única passada por texto (autômato de Aho-Corasick)."""
+
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Mapping, NamedTuple, Optional
+
+from unidecode import unidecode
+
+from sa.model import Polarity
+
+if TYPE_CHECKING:
+    from sa.model import KeywordsByPolarity
+
+
+class KeywordMatch(NamedTuple):
+    """
+    Ocorrência de uma palavra-chave em um texto.
+
+    Attributes:
+        keyword (str): Palavra-chave encontrada, como informada ao `KeywordMatcher`.
+        polarity (Optional[Polarity]): Polaridade da palavra-chave, ou `None` se o matcher não tiver polaridades.
+        start (int): Início da ocorrência no texto dobrado (`KeywordMatcher.fold`).
+        end (int): Fim (exclusivo) da ocorrência no texto dobrado.
+    """
+
+    keyword: str
+    polarity: Optional[Polarity]
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    """Indica se o caractere faz parte de uma palavra, como no ``\\w`` das expressões regulares."""
+
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Localiza todas as ocorrências de um conjunto de palavras-chave em uma única passada por texto.
+
+    As palavras-chave são dobradas (`fold`: sem acentos, em minúsculas e com espaços colapsados) e
+    compiladas em um autômato de Aho-Corasick; cada texto, dobrado da mesma forma, é percorrido
+    caractere a caractere uma única vez, independentemente da quantidade de palavras-chave. Apenas
+    ocorrências delimitadas por fronteira de palavra são aceitas (``amo`` não ocorre em ``amor``),
+    como na expressão ``\\b(?:kw1|kw2|...)\\b`` que o matcher substitui.
+
+    Attributes:
+        keywords (list[str]): Palavras-chave compiladas, na ordem informada.
+
+    Observações:
+        - Palavras-chave que se dobram na mesma forma (ex.: ``ódio`` e ``odio``) são todas
+          devolvidas a cada ocorrência dessa forma.
+        - Expressões com várias palavras (ex.: ``muito bom``) são aceitas.
+        - Após a construção o matcher é somente leitura e pode ser compartilhado entre threads.
+    """
+
+    def __init__(self, keywords: Iterable[str] | "KeywordsByPolarity"):
+        """
+        Compila o autômato das palavras-chave.
+
+        Args:
+            keywords (Iterable[str] | KeywordsByPolarity): Palavras-chave, ou palavras-chave agrupadas por
+                polaridade; neste caso, cada ocorrência informa a polaridade de sua palavra-chave.
+        """
+
+        entries: list[tuple[str, Optional[Polarity]]]
+
+        if isinstance(keywords, Mapping):
+            entries = [(keyword, polarity) for polarity, words in keywords.items() for keyword in words]
+        else:
+            entries = [(keyword, None) for keyword in keywords]
+
+        self.keywords = [keyword for keyword, _ in entries]
+
+        self._goto: list[dict[str, int]] = [{}]
+        """Transições de cada estado do autômato; o estado 0 é a raiz."""
+
+        self._fail: list[int] = [0]
+        """Estado de falha de cada estado: o maior sufixo próprio que também é prefixo de alguma palavra-chave."""
+
+        self._output: list[tuple[int, ...]] = [()]
+        """Padrões reconhecidos ao alcançar cada estado, incluindo os herdados pelos estados de falha."""
+
+        self._lengths: list[int] = []
+        """Comprimento de cada padrão dobrado."""
+
+        self._owners: list[list[tuple[str, Optional[Polarity]]]] = []
+        """Palavras-chave (e polaridades) de cada padrão dobrado."""
+
+        patterns: dict[str, int] = {}
+
+        for keyword, polarity in entries:
+            pattern = self.fold(keyword)
+
+            if not pattern:
+                continue
+
+            if pattern not in patterns:
+                patterns[pattern] = len(self._lengths)
+                self._lengths.append(len(pattern))
+                self._owners.append([])
+                self._insert(pattern, patterns[pattern])
+
+            self._owners[patterns[pattern]].append((keyword, polarity))
+
+        self._link()
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """
+        Dobra um texto para a comparação: sem acentos, em minúsculas e com espaços colapsados.
+
+        Args:
+            text (str): Texto bruto ou normalizado.
+
+        Returns:
+            str: Texto dobrado; as posições de `KeywordMatch` referem-se a ele.
+        """
+
+        return " ".join(unidecode(str(text)).lower().split())
+
+    def _insert(self, pattern: str, pattern_id: int) -> None:
+        """Acrescenta um padrão dobrado à trie do autômato."""
+
+        state = 0
+
+        for char in pattern:
+            following = self._goto[state].get(char)
+
+            if following is None:
+                following = self._goto[state][char] = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+
+            state = following
+
+        self._output[state] += (pattern_id,)
+
+    def _link(self) -> None:
+        """Calcula os estados de falha em largura e propaga as saídas por eles."""
+
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for char, following in self._goto[state].items():
+                fallback = self._fail[state]
+
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+
+                target = self._goto[fallback].get(char, 0)
+                self._fail[following] = target if target != following else 0
+                self._output[following] += self._output[self._fail[following]]
+
+                queue.append(following)
+
+    def find(self, text: str) -> list[KeywordMatch]:
+        """
+        Localiza todas as ocorrências das palavras-chave em um texto.
+
+        Args:
+            text (str): Texto bruto ou normalizado.
+
+        Returns:
+            list[KeywordMatch]: Ocorrências, ordenadas pelo fim no texto dobrado.
+        """
+
+        folded = self.fold(text)
+        size = len(folded)
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        matches: list[KeywordMatch] = []
+        state = 0
+
+        for end, char in enumerate(folded, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                start = end - lengths[pattern_id]
+
+                if (start and _is_word_char(folded[start - 1])) or (end < size and _is_word_char(folded[end])):
+                    continue
+
+                matches.extend(KeywordMatch(keyword, polarity, start, end) for keyword, polarity in self._owners[pattern_id])
+
+        return matches
+
+    def matched_keywords(self, text: str) -> list[str]:
+        """
+        Lista as palavras-chave presentes em um texto.
+
+        Args:
+            text (str): Texto bruto ou normalizado.
+
+        Returns:
+            list[str]: Palavras-chave distintas, na ordem da primeira ocorrência.
+        """
+
+        return list(dict.fromkeys(match.keyword for match in self.find(text)))
+
+    def matched_polarities(self, text: str) -> list[Polarity]:
+        """
+        Lista as polaridades das palavras-chave presentes em um texto.
+
+        Args:
+            text (str): Texto bruto ou normalizado.
+
+        Returns:
+            list[Polarity]: Polaridades distintas, na ordem da primeira ocorrência (vazia se o
+                matcher não tiver polaridades).
+        """
+
+        return list(dict.fromkeys(match.polarity for match in self.find(text) if match.polarity is not None))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher(keywords={len(self.keywords)}, states={len(self._goto)})"
+
+
+def load_keywords(path: Path) -> "KeywordsByPolarity":
+    """
+    Lê palavras-chave agrupadas por polaridade de um CSV com as colunas ``palavra`` e ``polaridade``.
+
+    Args:
+        path (Path): Caminho do CSV; ``polaridade`` aceita os valores de `Polarity` (``positive``, ``negative``, ``neutral``).
+
+    Returns:
+        KeywordsByPolarity: Palavras-chave de cada polaridade, na ordem do arquivo.
+
+    Raises:
+        KeyError: Se uma das colunas estiver ausente.
+        ValueError: Se uma polaridade não for reconhecida.
+    """
+
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str).dropna(subset=["palavra", "polaridade"])
+    keywords: "KeywordsByPolarity" = {}
+
+    for word, polarity in zip(df["palavra"].str.strip(), df["polaridade"].str.strip().str.lower()):
+        keywords.setdefault(Polarity(polarity), []).append(word)
+
+    return keywords
@@ -0,0 +1,214 @@
+"""Cache persistente, em SQLite, dos idiomas detectados por hash de conteúdo."""
+
+from __future__ import annotations
+
+import sqlite3
+from hashlib import md5
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+from typing import Optional, Sequence
+
+from .langid import LanguageDetector, detect_languages
+
+DEFAULT_LANGUAGE_COMMIT_EVERY = 1000
+"""Quantidade de detecções gravadas antes de cada commit no cache SQLite."""
+
+UNDETERMINED = ""
+"""Valor armazenado para textos cujo idioma não pôde ser determinado (distinto de uma ausência no cache)."""
+
+
+def text_hash(text: str) -> str:
+    """
+    Calcula a chave de um texto normalizado no cache, no mesmo formato do `content_hash` de `pack_post`.
+
+    Args:
+        text (str): Texto já normalizado (título ou conteúdo).
+
+    Returns:
+        str: Hash MD5 hexadecimal do texto.
+    """
+
+    return md5(text.encode()).hexdigest()
+
+
+class LanguageCache:
+    """
+    Cache persistente dos idiomas detectados, compartilhado entre execuções.
+
+    Cada texto normalizado é identificado pelo hash MD5 (o `content_hash` de `pack_post`, para o
+    conteúdo) e cada motor de detecção tem sua própria entrada. O cache guarda o idioma detectado,
+    e não a resposta para um idioma alvo: a mesma entrada atende coletas em ``pt``, ``en`` ou ``es``.
+    Recoletas e reprocessamentos de exportações pulam assim quase toda a detecção.
+
+    Attributes:
+        hits (int): Consultas atendidas pelo cache nesta sessão.
+        misses (int): Consultas que exigiram executar o detector nesta sessão.
+
+    Observações:
+        - Tabela `WITHOUT ROWID` com chave ``(hash, detector)``; o hash é armazenado como BLOB de 16 bytes.
+        - As gravações são confirmadas em lotes (`commit_every`) e no `close()`. Diferente do índice de
+          deduplicação, o resultado de uma detecção continua válido mesmo se a coleta não for exportada.
+        - É seguro para uso entre threads (conexão única protegida por `Lock`). A detecção roda fora do lock.
+    """
+
+    def __init__(self, path: str | Path, commit_every: Optional[int] = DEFAULT_LANGUAGE_COMMIT_EVERY):
+        """
+        Abre (ou cria) o cache no caminho informado.
+
+        Args:
+            path (str | Path): Caminho do arquivo SQLite. Diretórios pais são criados se necessário.
+            commit_every (Optional[int], optional): Quantidade de gravações acumuladas antes de cada commit.
+                Se `None`, as gravações só são confirmadas no `close()`.
+        """
+
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._commit_every = commit_every
+        """Tamanho do lote de gravações entre commits."""
+
+        self._pending = 0
+        """Gravações ainda não confirmadas."""
+
+        self._lock = Lock()
+        """Lock que serializa o acesso à conexão e aos contadores."""
+
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        """Conexão única com o banco do cache."""
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS languages ("
+            "text_hash BLOB NOT NULL, detector TEXT NOT NULL, language TEXT NOT NULL, "
+            "PRIMARY KEY (text_hash, detector)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content_hash: str, detector: LanguageDetector) -> Optional[str]:
+        """
+        Consulta o idioma já detectado para um texto.
+
+        Args:
+            content_hash (str): Hash MD5 hexadecimal do texto normalizado.
+            detector (LanguageDetector): Motor cuja detecção é consultada.
+
+        Returns:
+            Optional[str]: O código do idioma, `UNDETERMINED` se o detector não o determinou,
+                ou `None` se o texto ainda não consta no cache.
+        """
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT language FROM languages WHERE text_hash = ? AND detector = ?",
+                (bytes.fromhex(content_hash), detector.value),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+            return str(row[0])
+
+    def put(self, content_hash: str, detector: LanguageDetector, language: Optional[str]) -> None:
+        """
+        Registra o idioma detectado para um texto.
+
+        Args:
+            content_hash (str): Hash MD5 hexadecimal do texto normalizado.
+            detector (LanguageDetector): Motor que realizou a detecção.
+            language (Optional[str]): Código do idioma, ou `None` se indeterminado.
+        """
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO languages (text_hash, detector, language) VALUES (?, ?, ?)",
+                (bytes.fromhex(content_hash), detector.value, language or UNDETERMINED),
+            )
+
+            self._pending += 1
+
+            if self._commit_every is not None and self._pending >= self._commit_every:
+                self._conn.commit()
+                self._pending = 0
+
+    def detect(self, text: str, detector: LanguageDetector, content_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Devolve o idioma de um texto, executando o detector apenas se ele ainda não constar no cache.
+
+        Args:
+            text (str): Texto normalizado.
+            detector (LanguageDetector): Motor de detecção.
+            content_hash (Optional[str], optional): Hash já calculado do texto (ex.: `content_hash` do post).
+
+        Returns:
+            Optional[str]: Código do idioma, ou `None` se indeterminado.
+        """
+
+        return self.detect_batch([text], detector, [content_hash] if content_hash else None)[0]
+
+    def detect_batch(self, texts: Sequence[str], detector: LanguageDetector, hashes: Optional[Sequence[str]] = None) -> list[Optional[str]]:
+        """
+        Devolve o idioma de vários textos, detectando de uma só vez apenas os ausentes do cache.
+
+        Útil para reprocessar exportações inteiras: com o detector ``NGRAM``, todos os textos
+        ausentes são classificados em um único lote.
+
+        Args:
+            texts (Sequence[str]): Textos normalizados.
+            detector (LanguageDetector): Motor de detecção.
+            hashes (Optional[Sequence[str]], optional): Hashes já calculados dos textos, na mesma ordem;
+                se `None`, são calculados com `text_hash`.
+
+        Returns:
+            list[Optional[str]]: Código do idioma de cada texto, ou `None` quando indeterminado.
+        """
+
+        keys = list(hashes) if hashes is not None else [text_hash(text) for text in texts]
+        cached = [self.get(key, detector) for key in keys]
+        missing = [i for i, language in enumerate(cached) if language is None]
+
+        if missing:
+            for i, language in zip(missing, detect_languages([texts[i] for i in missing], detector)):
+                self.put(keys[i], detector, language)
+                cached[i] = language
+
+        return [language or None for language in cached]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas atendidas pelo cache nesta sessão (``0.0`` sem consultas)."""
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM languages").fetchone()
+
+        return int(row[0])
+
+    def close(self) -> None:
+        """Confirma as gravações pendentes e fecha a conexão com o banco."""
+
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def __enter__(self) -> "LanguageCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,434 @@
+"""Identificação de idioma determinística e em lote por perfis de n-gramas de caracteres."""
+
+from __future__ import annotations
+
+import json
+import re
+from enum import Enum
+from functools import cache
+from importlib.resources import files
+from threading import Lock
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from sa.model import Language
+
+from .language import langdetect_language
+
+MAX_NGRAM = 3
+"""Maior ordem de n-grama de caracteres considerada (unigramas, bigramas e trigramas, como nos perfis do langdetect)."""
+
+DEFAULT_DISTRACTORS = ("ca", "de", "fr", "it", "nl", "ro")
+"""Perfis do langdetect carregados apenas como alternativas: textos atribuídos a eles não pertencem a nenhum `Language`."""
+
+DEFAULT_MIN_STOPWORD_RATIO = 0.1
+"""Fração mínima de tokens que devem ser stopwords exclusivas de um idioma para decidi-lo sem o modelo de n-gramas."""
+
+DEFAULT_MIN_STOPWORD_HITS = 3
+"""Quantidade mínima de stopwords exclusivas do idioma vencedor para que a pré-checagem decida."""
+
+STOPWORD_DOMINANCE = 3
+"""Quantas vezes o idioma vencedor da pré-checagem deve superar o segundo colocado em stopwords exclusivas."""
+
+MAX_CODE_POINT = 0x24F
+"""Último code point dos n-gramas modelados (fim do bloco Latin Extended-B): idiomas e distratores usam o alfabeto latino."""
+
+MISSING_NGRAM_FACTOR = 0.5
+"""Fração da menor frequência de um perfil atribuída aos n-gramas ausentes dele (os perfis do langdetect são truncados)."""
+
+EMOJI_ALIAS_PATTERN = re.compile(r":[a-z0-9_&'-]+:")
+"""Expressão regular dos aliases produzidos por `emoji.demojize` (ex.: ``:red_heart:``), que são inglês e enviesariam a detecção."""
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+")
+"""Expressão regular das palavras (sequências de letras) consideradas pela detecção."""
+
+DISTINCTIVE_STOPWORDS: dict[Language, frozenset[str]] = {
+    Language.PT: frozenset(
+        "ao aos agora ainda até coisa com da das depois do dos ela elas ele eles em essa esse eu foi gente há isso isto já meu minha muito na nao nas não nós onde pra quando são seu só também tem tá tô uma vc você é".split()
+    ),
+    Language.EN: frozenset(
+        "about and are be but can dont for have i if is it just like my not of on that the they this to was were what will with would you".split()
+    ),
+    Language.ES: frozenset(
+        "ahora bien con cuando del después donde el eso esto hay las les lo los mi muy nosotros pero qué sin soy también tengo tiene una y ya yo él".split()
+    ),
+}
+"""Palavras funcionais frequentes e exclusivas de cada idioma (as comuns a dois deles, como ``de`` e ``que``, ficam de fora)."""
+
+
+class LanguageDetector(Enum):
+    """
+    Motores de detecção de idioma disponíveis para a coleta.
+
+    Attributes:
+        LANGDETECT: Detector bayesiano do langdetect, texto a texto (`matches_language`).
+        NGRAM: `LanguageIdentifier`, determinístico e vetorizado em lote.
+    """
+
+    LANGDETECT = "langdetect"
+    NGRAM = "ngram"
+
+
+class LanguageIdentifier:
+    """
+    Identificador de idioma determinístico que classifica lotes de textos com operações vetorizadas.
+
+    Os perfis de frequência de n-gramas de caracteres do langdetect são convertidos, na construção,
+    em uma matriz de log-probabilidades ``(idioma, n-grama)``. Cada lote é então pontuado de uma só
+    vez: os textos são concatenados em um vetor de caracteres, cada n-grama vira um código inteiro
+    consultado em uma tabela densa e as log-probabilidades são somadas por texto (`np.add.reduceat`),
+    sem laços Python por caractere. Não há amostragem aleatória: o mesmo texto sempre recebe o mesmo idioma.
+
+    Antes do modelo, uma pré-checagem barata conta as stopwords exclusivas de cada idioma
+    (`DISTINCTIVE_STOPWORDS`) e decide sozinha os textos em que um idioma domina com folga.
+
+    Attributes:
+        languages (tuple[Language, ...]): Idiomas que podem ser atribuídos aos textos.
+        precheck_decided (int): Textos decididos pela pré-checagem de stopwords.
+        model_decided (int): Textos decididos pelo modelo de n-gramas.
+
+    Observações:
+        - Textos sem nenhuma letra, ou atribuídos a um perfil distrator (`DEFAULT_DISTRACTORS`), resultam em `None`.
+        - Após a construção, a instância é somente leitura (exceto os contadores, protegidos por lock) e pode ser compartilhada entre threads.
+    """
+
+    def __init__(
+        self,
+        languages: Iterable[Language] = tuple(Language),
+        distractors: Iterable[str] = DEFAULT_DISTRACTORS,
+        min_stopword_ratio: float = DEFAULT_MIN_STOPWORD_RATIO,
+        min_stopword_hits: int = DEFAULT_MIN_STOPWORD_HITS,
+    ):
+        """
+        Carrega os perfis do langdetect e monta a matriz de log-probabilidades.
+
+        Args:
+            languages (Iterable[Language], optional): Idiomas identificáveis; por padrão, todos os de `Language`.
+            distractors (Iterable[str], optional): Códigos de perfis do langdetect usados apenas como alternativas
+                para que textos em outros idiomas não sejam forçados a um dos `languages`.
+            min_stopword_ratio (float, optional): Fração mínima de stopwords exclusivas para a pré-checagem decidir.
+                Use um valor acima de 1 para desativar a pré-checagem.
+            min_stopword_hits (int, optional): Quantidade mínima de stopwords exclusivas para a pré-checagem decidir.
+
+        Raises:
+            ValueError: Se nenhum idioma for informado.
+            FileNotFoundError: Se algum perfil não existir no pacote langdetect.
+        """
+
+        self.languages = tuple(dict.fromkeys(languages))
+
+        if not self.languages:
+            raise ValueError("Informe ao menos um idioma para a identificação.")
+
+        self._min_stopword_ratio = min_stopword_ratio
+        self._min_stopword_hits = min_stopword_hits
+
+        codes = [lang.value for lang in self.languages]
+        codes += [code for code in dict.fromkeys(distractors) if code not in codes]
+
+        self._profiles = codes
+        """Códigos dos perfis do langdetect, na ordem das colunas das matrizes (idiomas primeiro, distratores depois)."""
+
+        self._model = _build_ngram_model(codes)
+        """Tabelas de consulta e log-probabilidades de n-gramas, com uma linha de `log_probs` por perfil."""
+
+        self._stopwords = {lang: DISTINCTIVE_STOPWORDS[lang] for lang in self.languages if lang in DISTINCTIVE_STOPWORDS}
+        """Stopwords exclusivas usadas na pré-checagem, por idioma."""
+
+        self.precheck_decided = 0
+        self.model_decided = 0
+
+        self._counters_lock = Lock()
+        """Lock que protege `precheck_decided` e `model_decided` quando a instância é compartilhada entre threads."""
+
+    def detect(self, text: str) -> Optional[Language]:
+        """
+        Identifica o idioma de um único texto.
+
+        Args:
+            text (str): Texto a identificar.
+
+        Returns:
+            Optional[Language]: O idioma identificado, ou `None` se indeterminado ou fora de `languages`.
+        """
+
+        return self.detect_batch([text])[0]
+
+    def detect_batch(self, texts: Sequence[str]) -> list[Optional[Language]]:
+        """
+        Identifica o idioma de um lote de textos, na ordem de entrada.
+
+        Args:
+            texts (Sequence[str]): Textos a identificar.
+
+        Returns:
+            list[Optional[Language]]: Idioma de cada texto, ou `None` quando indeterminado ou fora de `languages`.
+        """
+
+        results: list[Optional[Language]] = [None] * len(texts)
+        prechecked = 0
+        pending: list[int] = []
+        words_by_text: list[str] = []
+
+        for i, text in enumerate(texts):
+            words = WORD_PATTERN.findall(EMOJI_ALIAS_PATTERN.sub(" ", text.lower()))
+
+            if not words:
+                continue
+
+            decided = self._precheck(words)
+
+            if decided is not None:
+                results[i] = decided
+                prechecked += 1
+            else:
+                pending.append(i)
+                words_by_text.append(" ".join(words))
+
+        if pending:
+            for i, profile in zip(pending, self._score(words_by_text)):
+                results[i] = self.languages[profile] if 0 <= profile < len(self.languages) else None
+
+        with self._counters_lock:
+            self.precheck_decided += prechecked
+            self.model_decided += len(pending)
+
+        return results
+
+    def matches(self, text: str, lang: Language = Language.PT) -> bool:
+        """
+        Verifica se o texto está no idioma `lang`, como `matches_language`, mas de forma determinística.
+
+        Args:
+            text (str): Texto a verificar.
+            lang (Language, optional): Idioma esperado.
+
+        Returns:
+            bool: `True` se o idioma identificado for `lang`.
+        """
+
+        return self.detect(text) is lang
+
+    def _precheck(self, words: list[str]) -> Optional[Language]:
+        """
+        Decide o idioma pela proporção de stopwords exclusivas, quando um idioma domina com folga.
+
+        Args:
+            words (list[str]): Palavras do texto, em minúsculas.
+
+        Returns:
+            Optional[Language]: O idioma dominante, ou `None` se a evidência for insuficiente (o modelo decide).
+        """
+
+        if not self._stopwords:
+            return None
+
+        hits = sorted(((sum(map(stopwords.__contains__, words)), lang) for lang, stopwords in self._stopwords.items()), reverse=True)
+        best, lang = hits[0]
+        runner_up = hits[1][0] if len(hits) > 1 else 0
+
+        if best >= self._min_stopword_hits and best >= self._min_stopword_ratio * len(words) and best >= STOPWORD_DOMINANCE * runner_up:
+            return lang
+
+        return None
+
+    def _score(self, texts: list[str]) -> np.ndarray:
+        """
+        Pontua um lote de textos já reduzidos a palavras contra todos os perfis.
+
+        Args:
+            texts (list[str]): Palavras de cada texto, separadas por espaço simples.
+
+        Returns:
+            np.ndarray: Índice (em `_profiles`) do perfil vencedor de cada texto, ou ``-1`` se nenhum n-grama for conhecido.
+        """
+
+        model = self._model
+
+        # Cada texto vira " palavras " e os textos são separados por NUL, que fica fora do alfabeto:
+        # n-gramas que atravessam a fronteira entre dois textos nunca são encontrados nas tabelas.
+        joined = "\0".join(f" {text} " for text in texts)
+        points = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        owner = np.repeat(np.arange(len(texts)), [len(text) + 3 for text in texts])[: len(points)]
+
+        chars = model.char_ids[np.minimum(points, len(model.char_ids) - 1)]
+        chars[points >= len(model.char_ids)] = 0
+
+        rows: list[np.ndarray] = []
+        docs: list[np.ndarray] = []
+
+        for n, table in enumerate(model.tables, start=1):
+            if len(chars) < n:
+                break
+
+            count = len(chars) - n + 1
+            codes = chars[:count].copy()
+
+            for offset in range(1, n):
+                codes = codes * model.base + chars[offset : offset + count]
+
+            found = table[codes]
+            known = found >= 0
+
+            rows.append(found[known])
+            docs.append(owner[:count][known])
+
+        all_rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int32)
+        all_docs = np.concatenate(docs) if docs else np.zeros(0, dtype=np.int64)
+
+        # Agrupa os n-gramas por texto para somar cada texto em uma fatia contígua (np.add.reduceat)
+        order = np.argsort(all_docs, kind="stable")
+        all_rows, all_docs = all_rows[order], all_docs[order]
+
+        winners = np.full(len(texts), -1)
+        scored = np.flatnonzero(np.bincount(all_docs, minlength=len(texts)))
+
+        if scored.size == 0:
+            return winners
+
+        # Apenas os textos com evidência: suas fatias são não vazias e a última termina no fim do vetor
+        starts = np.searchsorted(all_docs, scored)
+        scores = np.stack([np.add.reduceat(log_probs[all_rows], starts) for log_probs in model.log_probs])
+
+        winners[scored] = scores.argmax(axis=0)
+
+        return winners
+
+
+class _NGramModel(NamedTuple):
+    """
+    Tabelas densas do modelo de n-gramas, indexadas por códigos inteiros.
+
+    Cada caractere dos perfis recebe um identificador de 1 a ``base - 1`` (0 representa qualquer
+    caractere desconhecido); um n-grama ``c1 c2 c3`` tem o código ``(c1 * base + c2) * base + c3``.
+    Assim, a consulta de cada n-grama é um único acesso a vetor, sem dicionários nem buscas.
+
+    Attributes:
+        char_ids (np.ndarray): Identificador de cada code point (0 para os ausentes dos perfis).
+        base (int): Tamanho do alfabeto mais um (o identificador 0).
+        tables (list[np.ndarray]): Por ordem de n-grama, a linha de cada código em `log_probs` (``-1`` se ausente).
+        log_probs (np.ndarray): Matriz ``(perfil, n-grama)`` de log-probabilidades.
+    """
+
+    char_ids: np.ndarray
+    base: int
+    tables: list[np.ndarray]
+    log_probs: np.ndarray
+
+
+def _build_ngram_model(codes: list[str]) -> _NGramModel:
+    """
+    Converte os perfis do langdetect em tabelas densas de log-probabilidades.
+
+    As frequências são somadas sem diferenciar caixa e normalizadas pelo total de n-gramas
+    da mesma ordem em cada perfil. Como os perfis guardam apenas os n-gramas mais frequentes,
+    um n-grama ausente recebe `MISSING_NGRAM_FACTOR` vezes a menor frequência da mesma ordem
+    naquele perfil, e não zero: a penalidade fica proporcional ao corte de cada perfil.
+
+    Args:
+        codes (list[str]): Códigos dos perfis do langdetect (ex.: ``pt``), na ordem das linhas de `log_probs`.
+
+    Returns:
+        _NGramModel: Alfabeto, tabelas de consulta por ordem e matriz de log-probabilidades.
+    """
+
+    counts: list[dict[str, np.ndarray]] = [{} for _ in range(MAX_NGRAM)]
+
+    for column, code in enumerate(codes):
+        profile = json.loads(files("langdetect").joinpath("profiles", code).read_text(encoding="utf-8"))
+
+        for gram, freq in profile["freq"].items():
+            gram = gram.lower()
+
+            if len(gram) > MAX_NGRAM or not gram.strip() or max(map(ord, gram)) > MAX_CODE_POINT:
+                continue
+
+            table = counts[len(gram) - 1]
+
+            if gram not in table:
+                table[gram] = np.zeros(len(codes))
+
+            table[gram][column] += freq
+
+    alphabet = sorted({ch for table in counts for gram in table for ch in gram})
+    base = len(alphabet) + 1
+
+    char_ids = np.zeros(max(map(ord, alphabet), default=0) + 1, dtype=np.int64)
+    char_ids[[ord(ch) for ch in alphabet]] = np.arange(1, base)
+
+    tables: list[np.ndarray] = []
+    matrices: list[np.ndarray] = []
+    first_row = 0
+
+    for n, table in enumerate(counts, start=1):
+        lookup = np.full(base**n, -1, dtype=np.int32)
+        tables.append(lookup)
+
+        if not table:
+            continue
+
+        matrix = np.array(list(table.values()))
+        floor = MISSING_NGRAM_FACTOR * np.where(matrix > 0, matrix, np.inf).min(axis=0)
+        matrix = np.where(matrix > 0, matrix, floor)
+        matrices.append(np.log(matrix / matrix.sum(axis=0)))
+
+        for row, gram in enumerate(table, start=first_row):
+            gram_code = 0
+
+            for ch in gram:
+                gram_code = gram_code * base + int(char_ids[ord(ch)])
+
+            lookup[gram_code] = row
+
+        first_row += len(table)
+
+    # Transposta e contígua: cada perfil vira uma linha, lida de forma sequencial na pontuação
+    log_probs = np.ascontiguousarray(np.concatenate(matrices).T) if matrices else np.zeros((len(codes), 0))
+
+    return _NGramModel(char_ids, base, tables, log_probs)
+
+
+_DEFAULT_IDENTIFIER_LOCK = Lock()
+"""Lock que impede construções simultâneas do identificador padrão."""
+
+
+def get_language_identifier() -> LanguageIdentifier:
+    """
+    Devolve o identificador de idioma padrão do processo, construindo-o na primeira chamada.
+
+    Returns:
+        LanguageIdentifier: Instância compartilhada para todos os idiomas de `Language`.
+
+    Observações:
+        - É seguro para uso entre threads.
+    """
+
+    with _DEFAULT_IDENTIFIER_LOCK:
+        return _default_identifier()
+
+
+@cache
+def _default_identifier() -> LanguageIdentifier:
+    """Constrói o identificador padrão do processo; a memoização o mantém para as chamadas seguintes."""
+
+    return LanguageIdentifier()
+
+
+def detect_languages(texts: Sequence[str], detector: LanguageDetector = LanguageDetector.NGRAM) -> list[Optional[str]]:
+    """
+    Detecta o idioma de vários textos com o motor escolhido.
+
+    Args:
+        texts (Sequence[str]): Textos a identificar.
+        detector (LanguageDetector, optional): Motor de detecção; ``NGRAM`` classifica o lote de uma vez.
+
+    Returns:
+        list[Optional[str]]: Código do idioma de cada texto (ex.: ``pt``), ou `None` quando indeterminado.
+            Com ``NGRAM``, apenas os idiomas de `Language` são devolvidos.
+    """
+
+    if detector is LanguageDetector.NGRAM:
+        return [lang.value if lang else None for lang in get_language_identifier().detect_batch(texts)]
+
+    return [langdetect_language(text) for text in texts]
@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from collections import deque
+from threading import Event, Lock
+from typing import TYPE_CHECKING, AbstractSet, Generator, Iterable, Optional, overload
 
 import emoji
+import pandas as pd
 from langdetect import LangDetectException, detect  # type: ignore[import-untyped]
+from langdetect.detector_factory import init_factory  # type: ignore[import-untyped]
 from unidecode import unidecode
 
+from sa.logger import NULL_TIMER
 from sa.model import Language
 
 if TYPE_CHECKING:
     from spacy.language import Language as SpacyLanguage
+    from spacy.tokens import Doc
+
+    from sa.logger import StageTimer
+
+    from .cache import PreprocessCache, TokenAnalysis
 
 PUNCTUATION_PATTERN = re.compile(r"[.,!?();:/]")
 """Expressão regular para identificar e subistituir as principais pontuações lógicas do português."""
@@ -23,6 +33,40 @@ REPEATED_K_PATTERN = re.compile(r"k{2,}")
 BAD_CHARACTERS = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
 """Expressão regular focada em limpeza extrema de vetores mal formados do Windows/Linux escapando ao string parse."""
 
+EMOJI_CANDIDATE_PATTERN = re.compile("[\u00a9\u00ae\u203c-\U0010ffff]")
+"""Pré-filtro de emojis: todo emoji do pacote `emoji` contém ©, ® ou um caractere a partir de U+203C, então textos sem nenhum deles dispensam o `demojize`."""
+
+DEFAULT_ALLOWED_POS = frozenset({"NOUN", "ADJ", "VERB", "ADV"})
+"""Classes gramaticais preservadas por padrão no pré-processamento (Substantivo, Adjetivo, Verbo e Advérbio)."""
+
+DEFAULT_BATCH_SIZE = 256
+"""Quantidade padrão de textos enviados ao spaCy por lote em `preprocess_texts`."""
+
+_LANGDETECT_INIT_LOCK = Lock()
+"""Lock que serializa a carga preguiçosa (e não thread-safe) dos perfis do langdetect."""
+
+_LANGDETECT_READY = Event()
+"""Sinalizado quando os perfis do langdetect já foram carregados neste processo."""
+
+
+def _ensure_langdetect_profiles() -> None:
+    """
+    Carrega os perfis de idioma do langdetect uma única vez, de forma thread-safe.
+
+    O langdetect inicializa sua fábrica global na primeira chamada a `detect` sem qualquer
+    sincronização; threads concorrentes (ex.: coleta de vários subreddits em paralelo) podem
+    então detectar com perfis carregados pela metade e obter idiomas errados.
+    """
+
+    if _LANGDETECT_READY.is_set():
+        return
+
+    with _LANGDETECT_INIT_LOCK:
+        # Threads que aguardavam o lock encontram os perfis já carregados pela primeira
+        if not _LANGDETECT_READY.is_set():
+            init_factory()
+            _LANGDETECT_READY.set()
+
 
 def matches_language(text: str, lang: Language = Language.PT) -> bool:
     """
@@ -42,13 +86,30 @@ def matches_language(text: str, lang: Language = Language.PT) -> bool:
         - Pode lançar falso positivos silenciosos ao engolir falha estocástica `LangDetectException`.
     """
 
+    return langdetect_language(text) == lang.value.casefold()
+
+
+def langdetect_language(text: str) -> Optional[str]:
+    """
+    Detecta o idioma do texto com o langdetect.
+
+    Args:
+        text (str): Texto a identificar.
+
+    Returns:
+        Optional[str]: Código ISO 639-1 do idioma em minúsculas (ex.: ``pt``, ``ca``), ou `None`
+            se o langdetect não encontrar evidência suficiente (`LangDetectException`).
+    """
+
+    _ensure_langdetect_profiles()
+
     try:
-        return detect(text).casefold() == lang.value.casefold()  # type: ignore[no-any-return]
+        return detect(text).casefold()  # type: ignore[no-any-return]
     except LangDetectException:
-        return False
+        return None
 
 
-def normalize_text(content: str) -> str:
+def normalize_text(content: str, timer: "StageTimer" = NULL_TIMER) -> str:
     """
     Remove quebras de linha sujas provenientes do HTML/Markdown formatando para NPL padrão.
 
@@ -57,24 +118,77 @@ def normalize_text(content: str) -> str:
 
     Args:
         content (str): Escopo vetorial com possíveis resquícios lixos como tags e quebras escapadas "\\n".
+        timer (StageTimer, optional): Temporizador onde a tradução de emojis é medida como etapa ``demojize``.
 
     Returns:
         str: Conteúdo sanitizado e transposto inteiramente lower().
     """
 
     texto: str = content.replace("\n", " ").strip()
-    texto = str(emoji.demojize(texto))
+
+    # O demojize percorre o texto caractere a caractere; sem candidatos a emoji, ele não alteraria nada
+    if EMOJI_CANDIDATE_PATTERN.search(texto):
+        with timer.stage("demojize"):
+            texto = str(emoji.demojize(texto))
+
     texto = BAD_CHARACTERS.sub("", texto)
 
     return texto.strip().lower()
 
 
+@overload
+def normalize_texts(contents: pd.Series, timer: "StageTimer" = NULL_TIMER) -> pd.Series: ...
+
+
+@overload
+def normalize_texts(contents: Iterable[str], timer: "StageTimer" = NULL_TIMER) -> list[str]: ...
+
+
+def normalize_texts(contents: pd.Series | Iterable[str], timer: "StageTimer" = NULL_TIMER) -> pd.Series | list[str]:
+    """
+    Versão em lote de `normalize_text`, para colunas inteiras (ex.: renormalizar uma exportação).
+
+    Cada etapa é aplicada à coluna toda antes da seguinte: quebras de linha, seleção dos textos com
+    candidatos a emoji (`EMOJI_CANDIDATE_PATTERN`), `emoji.demojize` apenas nesses textos e, por fim,
+    remoção de caracteres de controle, `strip` e `lower` em uma única passada. Nos textos sem emoji,
+    o `strip` intermediário é dispensado: o final já produz o mesmo resultado.
+
+    Args:
+        contents (pd.Series | Iterable[str]): Coluna ou sequência de textos brutos.
+        timer (StageTimer, optional): Temporizador onde a tradução de emojis é medida como etapa ``demojize``.
+
+    Returns:
+        pd.Series | list[str]: Textos normalizados, idênticos aos de `normalize_text` texto a texto. Uma
+            `pd.Series` de entrada devolve uma `pd.Series` com o mesmo índice e nome; os demais casos, uma lista.
+
+    Observações:
+        - Valores que não são texto (ex.: células vazias lidas como ``NaN``) resultam em ``""``.
+    """
+
+    values = contents.tolist() if isinstance(contents, pd.Series) else list(contents)
+    texts = [value.replace("\n", " ") if isinstance(value, str) else "" for value in values]
+    candidates = [i for i, text in enumerate(texts) if EMOJI_CANDIDATE_PATTERN.search(text)]
+
+    if candidates:
+        with timer.stage("demojize", items=len(candidates)):
+            for i in candidates:
+                texts[i] = str(emoji.demojize(texts[i].strip()))
+
+    normalized = [BAD_CHARACTERS.sub("", text).strip().lower() for text in texts]
+
+    if isinstance(contents, pd.Series):
+        return pd.Series(normalized, index=contents.index, name=contents.name, dtype=object)
+
+    return normalized
+
+
 def preprocess_text(
     text: str,
-    stopwords: set[str],
+    stopwords: AbstractSet[str],
     nlp: "SpacyLanguage",
     allowed_pos: set[str] | None = None,
     min_token_len: int = 3,
+    cache: Optional["PreprocessCache"] = None,
 ) -> list[str]:
     """
     Pipeline monolítico de processamento linguístico: remoção pontuada, lematização e filtragem complexa de entidades sintáticas.
@@ -85,26 +199,163 @@ def preprocess_text(
 
     Args:
         text (str): Texto bruto ou pré-processado a ser analisado através da inteligência lexica e ML.
-        stopwords (set[str]): Aglomerado computacional com as words suprimíveis fornecido pelos modules sa/stopwords.
+        stopwords (AbstractSet[str]): Aglomerado computacional com as words suprimíveis fornecido pelos modules sa/stopwords.
         nlp (SpacyLanguage): Instância instanciada ativamente, carregada para memória da engine linguística `spacy`.
         allowed_pos (set[str] | None, optional): Seletor das classes das palavras em inglês (POS tags) a preservar.
                       Se desconsiderado engloba unicamente: {"NOUN", "ADJ", "VERB", "ADV"} ou seja (Substantivo, Adjetivo, Verbo e Adverbio).
         min_token_len (int, optional): Comprimento restritivo da lematização extraída antes de ser aceita em tokens, min size = 3 por default.
+        cache (Optional[PreprocessCache], optional): Cache de análises; textos (ou quase duplicados) já analisados não passam pelo modelo.
 
     Returns:
         list[str]: Retorna conjunto massivo array (Tokens Lematizados e pré depurados) próprios para submissão matemática de Nuvem gráficos ou Matplotlib Vector Space.
 
     Observações:
         - É agressiva a deleção da risada infinita de internet, onde kkk é descartado pra prever que estoure a amostragem.
+        - Para muitos textos, prefira `preprocess_texts`, que processa em lotes via `nlp.pipe`.
     """
 
-    if allowed_pos is None:
-        allowed_pos = {"NOUN", "ADJ", "VERB", "ADV"}
+    prefiltered = _prefilter_text(text, stopwords)
+
+    if cache is None:
+        return _filter_tokens(nlp(prefiltered), stopwords, allowed_pos, min_token_len)
+
+    key = cache.key(prefiltered)
+    analysis = cache.documents.get(key)
+
+    if analysis is None:
+        analysis = _analyze_doc(nlp(prefiltered))
+        cache.documents.put(key, analysis)
+
+    return _select_tokens(analysis, stopwords, allowed_pos, min_token_len)
+
+
+def preprocess_texts(
+    texts: Iterable[str],
+    stopwords: AbstractSet[str],
+    nlp: "SpacyLanguage",
+    allowed_pos: set[str] | None = None,
+    min_token_len: int = 3,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = 1,
+    cache: Optional["PreprocessCache"] = None,
+) -> Generator[list[str], None, None]:
+    """
+    Versão em lote de `preprocess_text`, conduzindo o spaCy via `nlp.pipe`.
+
+    Produz exatamente os mesmos tokens de `preprocess_text` para cada texto, mas entrega os
+    textos pré-filtrados ao modelo em lotes, amortizando o custo por documento e, com
+    ``n_process > 1``, distribuindo os lotes entre vários processos.
+
+    Args:
+        texts (Iterable[str]): Textos brutos ou pré-processados, consumidos sob demanda.
+        stopwords (AbstractSet[str]): Conjunto de stopwords a suprimir, como em `preprocess_text`.
+        nlp (SpacyLanguage): Instância carregada da engine linguística `spacy`.
+        allowed_pos (set[str] | None, optional): Classes gramaticais (POS tags) a preservar; se `None`, `DEFAULT_ALLOWED_POS`.
+        min_token_len (int, optional): Comprimento mínimo do lema aceito.
+        batch_size (int, optional): Quantidade de textos enviados ao modelo por lote.
+        n_process (int, optional): Processos usados pelo `nlp.pipe` (``-1`` usa todos os núcleos).
+        cache (Optional[PreprocessCache], optional): Cache de análises; apenas textos inéditos (nem em cache,
+            nem repetidos no próprio lote) são enviados ao modelo.
+
+    Yields:
+        list[str]: Tokens lematizados e filtrados de cada texto, na ordem de entrada.
+
+    Observações:
+        - Com ``n_process > 1`` o modelo é copiado para cada processo; o script chamador deve
+          estar protegido por ``if __name__ == "__main__"``.
+    """
+
+    if cache is None:
+        prefiltered = (_prefilter_text(text, stopwords) for text in texts)
+
+        for doc in nlp.pipe(prefiltered, batch_size=batch_size, n_process=n_process):
+            yield _filter_tokens(doc, stopwords, allowed_pos, min_token_len)
+
+        return
+
+    # Fila na ordem de entrada: análise já conhecida, ou `None` enquanto o modelo não a devolve
+    pending: deque[tuple[bytes, Optional["TokenAnalysis"]]] = deque()
+    waiting: dict[bytes, int] = {}
+    ready: dict[bytes, "TokenAnalysis"] = {}
+
+    def misses() -> Generator[tuple[str, bytes], None, None]:
+        for text in texts:
+            prefiltered = _prefilter_text(text, stopwords)
+            key = cache.key(prefiltered)
+
+            # Repetido enquanto a primeira ocorrência está no modelo: reaproveita a mesma análise
+            if key in waiting:
+                waiting[key] += 1
+                pending.append((key, None))
+                continue
+
+            analysis = cache.documents.get(key)
+            pending.append((key, analysis))
+
+            if analysis is None:
+                waiting[key] = 1
+                yield prefiltered, key
+
+    def drain() -> Generator[list[str], None, None]:
+        while pending:
+            key, analysis = pending[0]
+
+            if analysis is None:
+                if key not in ready:
+                    return
+
+                analysis = ready[key]
+                waiting[key] -= 1
+
+                if not waiting[key]:
+                    del waiting[key], ready[key]
+
+            pending.popleft()
+
+            yield _select_tokens(analysis, stopwords, allowed_pos, min_token_len)
+
+    for doc, key in nlp.pipe(misses(), as_tuples=True, batch_size=batch_size, n_process=n_process):
+        ready[key] = _analyze_doc(doc)
+        cache.documents.put(key, ready[key])
+
+        yield from drain()
+
+    yield from drain()
+
+
+def _prefilter_text(text: str, stopwords: AbstractSet[str]) -> str:
+    """
+    Remove acentos, pontuação e stopwords de um texto antes de enviá-lo ao spaCy.
+
+    Args:
+        text (str): Texto bruto ou pré-processado.
+        stopwords (AbstractSet[str]): Conjunto de stopwords a suprimir.
+
+    Returns:
+        str: Texto em minúsculas, sem acentos, pontuação nem stopwords.
+    """
 
     normalized = PUNCTUATION_PATTERN.sub(" ", unidecode(str(text)).lower())
-    pre_filtered = " ".join(w for w in normalized.split() if w not in stopwords)
 
-    doc = nlp(pre_filtered)
+    return " ".join(w for w in normalized.split() if w not in stopwords)
+
+
+def _filter_tokens(doc: "Doc", stopwords: AbstractSet[str], allowed_pos: AbstractSet[str] | None, min_token_len: int) -> list[str]:
+    """
+    Extrai de um documento processado os lemas aceitos pelos filtros de classe gramatical, tamanho e stopwords.
+
+    Args:
+        doc (Doc): Documento processado pelo spaCy.
+        stopwords (AbstractSet[str]): Conjunto de stopwords a suprimir.
+        allowed_pos (AbstractSet[str] | None): Classes gramaticais a preservar; se `None`, `DEFAULT_ALLOWED_POS`.
+        min_token_len (int): Comprimento mínimo do lema aceito.
+
+    Returns:
+        list[str]: Lemas aceitos, na ordem do documento.
+    """
+
+    if allowed_pos is None:
+        allowed_pos = DEFAULT_ALLOWED_POS
 
     tokens: list[str] = []
 
@@ -118,3 +369,47 @@ def preprocess_text(
             tokens.append(lemma)
 
     return tokens
+
+
+def _analyze_doc(doc: "Doc") -> "TokenAnalysis":
+    """
+    Extrai de um documento processado os pares ``(lema normalizado, classe gramatical)``, sem as risadas.
+
+    Args:
+        doc (Doc): Documento processado pelo spaCy.
+
+    Returns:
+        TokenAnalysis: Análise do documento, independente dos filtros de `_select_tokens`.
+    """
+
+    analysis: list[tuple[str, str]] = []
+
+    for token in doc:
+        lemma = token.lemma_.lower().strip()
+
+        if not REPEATED_K_PATTERN.fullmatch(lemma):
+            analysis.append((lemma, token.pos_))
+
+    return tuple(analysis)
+
+
+def _select_tokens(analysis: "TokenAnalysis", stopwords: AbstractSet[str], allowed_pos: AbstractSet[str] | None, min_token_len: int) -> list[str]:
+    """
+    Aplica os filtros de classe gramatical, tamanho e stopwords sobre uma análise em cache.
+
+    Equivale à filtragem de `_filter_tokens`, porém sobre os pares produzidos por `_analyze_doc`.
+
+    Args:
+        analysis (TokenAnalysis): Pares ``(lema normalizado, classe gramatical)`` do documento.
+        stopwords (AbstractSet[str]): Conjunto de stopwords a suprimir.
+        allowed_pos (AbstractSet[str] | None): Classes gramaticais a preservar; se `None`, `DEFAULT_ALLOWED_POS`.
+        min_token_len (int): Comprimento mínimo do lema aceito.
+
+    Returns:
+        list[str]: Lemas aceitos, na ordem do documento.
+    """
+
+    if allowed_pos is None:
+        allowed_pos = DEFAULT_ALLOWED_POS
+
+    return [lemma for lemma, pos in analysis if pos in allowed_pos and len(lemma) >= min_token_len and lemma not in stopwords]
@@ -0,0 +1,171 @@
+"""Contagem incremental e mesclável de n-gramas de tokens."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable, Optional, Sequence, Union
+
+MAX_NGRAM_ORDER = 3
+"""Maior ordem de n-grama suportada por `NGramCounter` (trigramas)."""
+
+NGRAM_SEPARATOR = " "
+"""Separador dos tokens de um n-grama nos resultados de `NGramCounter`."""
+
+NGram = Union[str, tuple[str, ...]]
+"""Chave interna de um n-grama: o próprio token nos unigramas, a tupla de tokens nas demais ordens."""
+
+
+class NGramCounter:
+    """
+    Contador de n-gramas (unigramas a trigramas) alimentado documento a documento.
+
+    Cada lista de tokens é contada assim que chega (`update`), sem concatenar o corpus em um texto
+    único; os n-gramas nunca atravessam a fronteira entre dois documentos. Contadores parciais,
+    produzidos por processos diferentes (ex.: `PreprocessPool.count_ngrams`) ou por lotes diferentes,
+    são somados com `merge` (ou ``+=``) e o resultado é idêntico ao da contagem sequencial.
+
+    Attributes:
+        orders (tuple[int, ...]): Ordens de n-grama contadas, em ordem crescente.
+        documents (int): Quantidade de documentos contados.
+
+    Observações:
+        - Os unigramas são contados pelo próprio token e as demais ordens por tuplas; os resultados
+          unem os tokens com `NGRAM_SEPARATOR`.
+        - Instâncias são serializáveis por `pickle` e podem ser devolvidas por processos de trabalho.
+    """
+
+    def __init__(self, orders: Iterable[int] = (1,)):
+        """
+        Inicializa o contador vazio.
+
+        Args:
+            orders (Iterable[int], optional): Ordens de n-grama contadas (entre 1 e `MAX_NGRAM_ORDER`).
+
+        Raises:
+            ValueError: Se nenhuma ordem for informada ou alguma estiver fora do intervalo suportado.
+        """
+
+        self.orders = tuple(sorted(set(orders)))
+
+        if not self.orders or self.orders[0] < 1 or self.orders[-1] > MAX_NGRAM_ORDER:
+            raise ValueError(f"As ordens de n-grama devem estar entre 1 e {MAX_NGRAM_ORDER}.")
+
+        self.documents = 0
+
+        self._counts: dict[int, Counter[NGram]] = {order: Counter() for order in self.orders}
+        """Frequência de cada n-grama, por ordem."""
+
+    def update(self, tokens: Sequence[str]) -> None:
+        """
+        Conta os n-gramas de um documento.
+
+        Args:
+            tokens (Sequence[str]): Tokens do documento, na ordem do texto.
+        """
+
+        self.documents += 1
+
+        for order, counts in self._counts.items():
+            if order == 1:
+                counts.update(tokens)
+            elif len(tokens) >= order:
+                counts.update(zip(*(tokens[i:] for i in range(order))))
+
+    def update_many(self, documents: Iterable[Sequence[str]]) -> NGramCounter:
+        """
+        Conta os n-gramas de vários documentos, consumidos sob demanda.
+
+        Args:
+            documents (Iterable[Sequence[str]]): Tokens de cada documento (ex.: a saída de `preprocess_texts`).
+
+        Returns:
+            NGramCounter: O próprio contador, para encadeamento.
+        """
+
+        for tokens in documents:
+            self.update(tokens)
+
+        return self
+
+    def merge(self, other: NGramCounter) -> None:
+        """
+        Soma a este contador as contagens de outro.
+
+        Args:
+            other (NGramCounter): Contador parcial com as mesmas ordens.
+
+        Raises:
+            ValueError: Se as ordens dos contadores forem diferentes.
+        """
+
+        if other.orders != self.orders:
+            raise ValueError(f"Não é possível mesclar contadores de ordens {other.orders} e {self.orders}.")
+
+        self.documents += other.documents
+
+        for order, counts in self._counts.items():
+            counts.update(other._counts[order])
+
+    def __iadd__(self, other: NGramCounter) -> NGramCounter:
+        self.merge(other)
+
+        return self
+
+    def most_common(self, n: Optional[int] = None, order: int = 1) -> list[tuple[str, int]]:
+        """
+        Lista os n-gramas mais frequentes de uma ordem.
+
+        Args:
+            n (Optional[int], optional): Quantidade de n-gramas devolvidos; se `None`, todos.
+            order (int, optional): Ordem dos n-gramas.
+
+        Returns:
+            list[tuple[str, int]]: Pares ``(n-grama, frequência)`` em ordem decrescente de frequência.
+        """
+
+        return [(self._format(ngram), count) for ngram, count in self._counter(order).most_common(n)]
+
+    def frequencies(self, order: int = 1) -> dict[str, int]:
+        """
+        Devolve a frequência de todos os n-gramas de uma ordem (ex.: para `generate_wordcloud`).
+
+        Args:
+            order (int, optional): Ordem dos n-gramas.
+
+        Returns:
+            dict[str, int]: Frequência de cada n-grama.
+        """
+
+        return {self._format(ngram): count for ngram, count in self._counter(order).items()}
+
+    def total(self, order: int = 1) -> int:
+        """
+        Soma as ocorrências de todos os n-gramas de uma ordem.
+
+        Args:
+            order (int, optional): Ordem dos n-gramas.
+
+        Returns:
+            int: Total de ocorrências contadas.
+        """
+
+        return self._counter(order).total()
+
+    def _counter(self, order: int) -> Counter[NGram]:
+        """Devolve as contagens de uma ordem, validando que ela é contada."""
+
+        try:
+            return self._counts[order]
+        except KeyError:
+            raise ValueError(f"A ordem {order} não é contada por este contador (ordens: {self.orders}).") from None
+
+    @staticmethod
+    def _format(ngram: NGram) -> str:
+        """Une os tokens de um n-grama com `NGRAM_SEPARATOR`."""
+
+        return ngram if isinstance(ngram, str) else NGRAM_SEPARATOR.join(ngram)
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(f"{order}: {len(counts)}" for order, counts in self._counts.items())
+
+        return f"NGramCounter(documents={self.documents}, ngrams={{{sizes}}})"
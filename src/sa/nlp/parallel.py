@@ -0,0 +1,280 @@
+"""Pré-processamento paralelo em processos, com um modelo spaCy carregado uma única vez por processo."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from types import TracebackType
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Generator, Iterable, Optional, TypeVar
+
+from .cache import PreprocessCache
+from .language import DEFAULT_BATCH_SIZE, preprocess_texts
+from .ngrams import NGramCounter
+from .pipeline import DEFAULT_SPACY_MODEL, PipelineProfile, load_pipeline
+
+if TYPE_CHECKING:
+    from spacy.language import Language as SpacyLanguage
+
+R = TypeVar("R")
+
+DEFAULT_CHUNK_SIZE = 128
+"""Quantidade padrão de textos enviados a um processo por tarefa em `PreprocessPool`."""
+
+
+class _WorkerState:
+    """Estado de um processo de trabalho, preenchido uma única vez por `_init_worker`."""
+
+    def __init__(self) -> None:
+        self.nlp: Optional["SpacyLanguage"] = None
+        """Modelo spaCy do processo de trabalho."""
+
+        self.stopwords: AbstractSet[str] = frozenset()
+        """Conjunto de stopwords do processo de trabalho."""
+
+        self.options: dict[str, object] = {}
+        """Parâmetros de `preprocess_texts` fixos durante toda a vida do processo de trabalho."""
+
+        self.cache: Optional[PreprocessCache] = None
+        """Cache de análises próprio do processo de trabalho (`None` se desativado)."""
+
+
+_WORKER = _WorkerState()
+"""Estado do processo de trabalho atual; no processo principal, permanece vazio."""
+
+
+def _init_worker(
+    model: str,
+    profile: PipelineProfile,
+    stopwords: frozenset[str],
+    allowed_pos: Optional[frozenset[str]],
+    min_token_len: int,
+    batch_size: int,
+    cache_size: int,
+) -> None:
+    """
+    Inicializa um processo de trabalho: carrega o modelo spaCy e guarda as stopwords e os parâmetros.
+
+    O processo ignora ``SIGINT``: o Ctrl-C é tratado apenas pelo processo principal, que cancela as
+    tarefas pendentes, em vez de cada processo imprimir seu próprio traceback.
+    """
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _WORKER.nlp = load_pipeline(model, profile)
+    _WORKER.stopwords = stopwords
+    _WORKER.options = {"allowed_pos": allowed_pos, "min_token_len": min_token_len, "batch_size": batch_size}
+    _WORKER.cache = PreprocessCache(maxsize=cache_size) if cache_size > 0 else None
+
+
+def _preprocess_chunk(texts: list[str]) -> list[list[str]]:
+    """Pré-processa um bloco de textos no processo de trabalho, com o modelo carregado por `_init_worker`."""
+
+    assert _WORKER.nlp is not None, "Processo de trabalho não inicializado."
+
+    return list(preprocess_texts(texts, _WORKER.stopwords, _WORKER.nlp, cache=_WORKER.cache, **_WORKER.options))  # type: ignore[arg-type]
+
+
+def _count_chunk(texts: list[str], orders: tuple[int, ...]) -> NGramCounter:
+    """Pré-processa um bloco de textos no processo de trabalho e devolve apenas a contagem dos seus n-gramas."""
+
+    return NGramCounter(orders).update_many(_preprocess_chunk(texts))
+
+
+class PreprocessPool:
+    """
+    Executor de `preprocess_texts` em vários processos, cada um com seu próprio modelo spaCy.
+
+    Ao contrário do ``n_process`` do `nlp.pipe`, que serializa o modelo para cada processo a cada
+    chamada, os processos daqui vivem enquanto o pool estiver aberto: o modelo (`load_pipeline`) e
+    as stopwords são carregados uma única vez por processo, no inicializador. Os textos são enviados
+    em blocos de `chunk_size`, com no máximo ``2 * workers`` blocos em andamento, e os tokens são
+    devolvidos na ordem de entrada.
+
+    Attributes:
+        workers (int): Quantidade de processos de trabalho.
+        chunk_size (int): Quantidade de textos enviados a um processo por tarefa.
+
+    Observações:
+        - Os processos são criados com ``spawn``; o script chamador deve estar protegido por
+          ``if __name__ == "__main__"``.
+        - Cada processo tem seu próprio `PreprocessCache` (com ``cache_size > 0``); o cache não é
+          compartilhado entre processos.
+        - Um Ctrl-C durante `map` cancela os blocos ainda não iniciados e encerra o pool sem
+          aguardá-los; os processos terminam após o bloco em andamento.
+    """
+
+    def __init__(
+        self,
+        stopwords: AbstractSet[str],
+        model: str = DEFAULT_SPACY_MODEL,
+        profile: PipelineProfile = PipelineProfile.LEMMA_POS,
+        allowed_pos: AbstractSet[str] | None = None,
+        min_token_len: int = 3,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache_size: int = 0,
+    ):
+        """
+        Configura o pool; os processos são iniciados em `start` (ou ao entrar no bloco ``with``).
+
+        Args:
+            stopwords (AbstractSet[str]): Conjunto de stopwords a suprimir, enviado uma única vez a cada processo.
+            model (str, optional): Nome do pacote ou caminho do modelo spaCy carregado em cada processo.
+            profile (PipelineProfile, optional): Perfil de carga do modelo.
+            allowed_pos (AbstractSet[str] | None, optional): Classes gramaticais preservadas; se `None`, `DEFAULT_ALLOWED_POS`.
+            min_token_len (int, optional): Comprimento mínimo do lema aceito.
+            workers (int | None, optional): Quantidade de processos; `None` ou ``-1`` usa todos os núcleos.
+            chunk_size (int, optional): Quantidade de textos enviados a um processo por tarefa.
+            batch_size (int, optional): Lote do `nlp.pipe` dentro de cada processo.
+            cache_size (int, optional): Textos analisados mantidos no cache de cada processo; ``0`` desativa.
+
+        Raises:
+            ValueError: Se `workers` ou `chunk_size` forem inválidos.
+        """
+
+        if workers is None or workers == -1:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError("A quantidade de processos deve ser maior ou igual a 1 (ou -1 para todos os núcleos).")
+
+        if chunk_size < 1:
+            raise ValueError("O tamanho do bloco deve ser maior ou igual a 1.")
+
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        self._initargs = (
+            model,
+            profile,
+            frozenset(stopwords),
+            frozenset(allowed_pos) if allowed_pos is not None else None,
+            min_token_len,
+            batch_size,
+            cache_size,
+        )
+        """Argumentos de `_init_worker`, enviados uma única vez a cada processo."""
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        """Executor ativo, ou `None` antes de `start` e depois de `close`."""
+
+    def start(self) -> None:
+        """Inicia o executor; os processos carregam o modelo na chegada do primeiro bloco."""
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=self._initargs,
+            )
+
+    def close(self, cancel: bool = False) -> None:
+        """
+        Encerra os processos de trabalho.
+
+        Args:
+            cancel (bool, optional): Cancela os blocos pendentes e retorna sem aguardar os processos.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=not cancel, cancel_futures=cancel)
+            self._executor = None
+
+    def map(self, texts: Iterable[str]) -> Generator[list[str], None, None]:
+        """
+        Pré-processa os textos nos processos de trabalho, como `preprocess_texts`.
+
+        Args:
+            texts (Iterable[str]): Textos brutos, consumidos sob demanda.
+
+        Yields:
+            list[str]: Tokens lematizados e filtrados de cada texto, na ordem de entrada.
+
+        Raises:
+            KeyboardInterrupt: Repassado após cancelar os blocos pendentes e encerrar o pool.
+        """
+
+        for tokens in self._run(_preprocess_chunk, texts):
+            yield from tokens
+
+    def count_ngrams(self, texts: Iterable[str], orders: Iterable[int] = (1,)) -> NGramCounter:
+        """
+        Pré-processa os textos e conta seus n-gramas nos próprios processos de trabalho.
+
+        Cada processo devolve apenas o `NGramCounter` parcial do seu bloco, em vez dos tokens de
+        cada texto; os contadores parciais são mesclados aqui.
+
+        Args:
+            texts (Iterable[str]): Textos brutos, consumidos sob demanda.
+            orders (Iterable[int], optional): Ordens de n-grama contadas.
+
+        Returns:
+            NGramCounter: Contagem de todos os textos.
+
+        Raises:
+            KeyboardInterrupt: Repassado após cancelar os blocos pendentes e encerrar o pool.
+        """
+
+        counter = NGramCounter(orders)
+
+        for partial in self._run(_count_chunk, texts, counter.orders):
+            counter.merge(partial)
+
+        return counter
+
+    def _run(self, task: Callable[..., R], texts: Iterable[str], *args: Any) -> Generator[R, None, None]:
+        """
+        Envia os textos em blocos a `task` nos processos de trabalho e devolve os resultados na ordem dos blocos.
+
+        Mantém no máximo ``2 * workers`` blocos em andamento, consumindo `texts` sob demanda.
+        """
+
+        self.start()
+        assert self._executor is not None
+
+        iterator = iter(texts)
+        in_flight: deque[Future[R]] = deque()
+
+        try:
+            while True:
+                while len(in_flight) < 2 * self.workers:
+                    chunk = [str(text) for text in islice(iterator, self.chunk_size)]
+
+                    if not chunk:
+                        break
+
+                    in_flight.append(self._executor.submit(task, chunk, *args))
+
+                if not in_flight:
+                    return
+
+                yield in_flight.popleft().result()
+        except GeneratorExit:
+            # Consumidor parou antes do fim: descarta os blocos restantes, mas mantém o pool aberto
+            for future in in_flight:
+                future.cancel()
+
+            raise
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+
+            self.close(cancel=True)
+            raise
+
+    def __enter__(self) -> PreprocessPool:
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        self.close(cancel=exc_type is not None)
+
+    def __repr__(self) -> str:
+        return f"PreprocessPool(workers={self.workers}, chunk_size={self.chunk_size})"
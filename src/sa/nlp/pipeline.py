@@ -0,0 +1,152 @@
+"""Perfis enxutos de pipeline spaCy e cache de modelos carregados no processo."""
+
+from __future__ import annotations
+
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import spacy
+import spacy.util
+
+if TYPE_CHECKING:
+    from spacy.language import Language as SpacyLanguage
+
+DEFAULT_SPACY_MODEL = "pt_core_news_lg"
+"""Modelo spaCy padrão do projeto para o português."""
+
+
+class PipelineProfile(Enum):
+    """
+    Perfis nomeados de carga do modelo spaCy, conforme os atributos que o chamador realmente lê.
+
+    Attributes:
+        FULL: Todos os componentes do modelo (comportamento padrão do `spacy.load`).
+        LEMMA_POS: Apenas o necessário para `token.lemma_` e `token.pos_` (tok2vec, morphologizer,
+            attribute_ruler e lemmatizer); exclui parser e NER, os componentes mais caros.
+            Atende `preprocess_text` e `preprocess_texts`.
+        TOKENIZE: Apenas o tokenizador; nenhum componente estatístico é carregado.
+    """
+
+    FULL = "full"
+    LEMMA_POS = "lemma-pos"
+    TOKENIZE = "tokenize"
+
+    @property
+    def exclude(self) -> tuple[str, ...]:
+        """Componentes excluídos da carga do modelo neste perfil."""
+
+        return _PROFILE_EXCLUDES[self]
+
+
+_PROFILE_EXCLUDES: dict[PipelineProfile, tuple[str, ...]] = {
+    PipelineProfile.FULL: (),
+    PipelineProfile.LEMMA_POS: ("parser", "ner", "senter"),
+    PipelineProfile.TOKENIZE: ("tok2vec", "morphologizer", "tagger", "attribute_ruler", "lemmatizer", "parser", "ner", "senter"),
+}
+"""Componentes excluídos por perfil; nomes ausentes do modelo são ignorados pelo spaCy."""
+
+
+class PipelineInfo(NamedTuple):
+    """
+    Metadados de um modelo spaCy carregado com um perfil, obtidos sem carregar seus pesos.
+
+    Expõe os mesmos atributos lidos de um modelo carregado (`meta` e `pipe_names`), podendo
+    substituí-lo onde apenas a identidade do modelo importa (ex.: `token_cache_fingerprint`).
+
+    Attributes:
+        meta (dict[str, Any]): Conteúdo do ``meta.json`` do modelo (``lang``, ``name``, ``version``...).
+        pipe_names (list[str]): Componentes ativos após a exclusão do perfil, na ordem do pipeline.
+    """
+
+    meta: dict[str, Any]
+    pipe_names: list[str]
+
+
+_PIPELINE_CACHE: dict[tuple[str, PipelineProfile], "SpacyLanguage"] = {}
+"""Modelos já carregados neste processo, por ``(modelo, perfil)``."""
+
+_PIPELINE_CACHE_LOCK = Lock()
+"""Lock que impede cargas simultâneas e duplicadas do mesmo modelo."""
+
+
+def load_pipeline(model: str = DEFAULT_SPACY_MODEL, profile: PipelineProfile = PipelineProfile.LEMMA_POS) -> "SpacyLanguage":
+    """
+    Carrega um modelo spaCy com os componentes do perfil, reaproveitando cargas anteriores do processo.
+
+    A primeira chamada para um par ``(modelo, perfil)`` executa `spacy.load` excluindo os
+    componentes desnecessários (economizando CPU e memória); as chamadas seguintes devolvem
+    a mesma instância já carregada.
+
+    Args:
+        model (str, optional): Nome do pacote ou caminho do modelo spaCy.
+        profile (PipelineProfile, optional): Perfil que determina os componentes carregados.
+
+    Returns:
+        SpacyLanguage: Instância compartilhada do modelo carregado.
+
+    Raises:
+        OSError: Se o modelo não estiver instalado.
+
+    Observações:
+        - A instância é compartilhada: não adicione nem remova componentes dela.
+        - É seguro para uso entre threads.
+    """
+
+    key = (model, profile)
+
+    with _PIPELINE_CACHE_LOCK:
+        nlp = _PIPELINE_CACHE.get(key)
+
+        if nlp is None:
+            nlp = _PIPELINE_CACHE[key] = spacy.load(model, exclude=list(profile.exclude))
+
+    return nlp
+
+
+def pipeline_info(model: str = DEFAULT_SPACY_MODEL, profile: PipelineProfile = PipelineProfile.LEMMA_POS) -> PipelineInfo:
+    """
+    Lê os metadados de um modelo spaCy com os componentes do perfil, sem carregá-lo.
+
+    Útil quando o modelo só é carregado em outros processos (ex.: `PreprocessPool`): o processo
+    principal obtém a identidade do modelo apenas do ``meta.json``, sem pagar a carga dos pesos.
+
+    Args:
+        model (str, optional): Nome do pacote ou caminho do modelo spaCy.
+        profile (PipelineProfile, optional): Perfil que determina os componentes ativos.
+
+    Returns:
+        PipelineInfo: Metadados do modelo e componentes que `load_pipeline` deixaria ativos.
+
+    Raises:
+        OSError: Se o modelo não estiver instalado.
+
+    Observações:
+        - Se o modelo já estiver carregado neste processo, os metadados vêm da instância em cache.
+    """
+
+    with _PIPELINE_CACHE_LOCK:
+        nlp = _PIPELINE_CACHE.get((model, profile))
+
+    if nlp is not None:
+        return PipelineInfo(nlp.meta, list(nlp.pipe_names))
+
+    # Mesma resolução do `spacy.load`: pacote instalado ou diretório do modelo
+    if spacy.util.is_package(model):
+        path = spacy.util.get_package_path(model)
+    elif Path(model).exists():
+        path = Path(model)
+    else:
+        raise OSError(f"Modelo spaCy não encontrado: {model!r}")
+
+    meta = spacy.util.get_model_meta(path)
+
+    return PipelineInfo(meta, [name for name in meta.get("pipeline", []) if name not in profile.exclude])
+
+
+def clear_pipeline_cache() -> None:
+    """Descarta os modelos carregados em cache, liberando a memória na próxima coleta de lixo."""
+
+    with _PIPELINE_CACHE_LOCK:
+        _PIPELINE_CACHE.clear()
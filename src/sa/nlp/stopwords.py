@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import json
+import os
+from hashlib import sha256
 from pathlib import Path
+from typing import AbstractSet, Optional
 
 import nltk
 import spacy
+import spacy.about
 from unidecode import unidecode
 
 _NLTK_TO_SPACY: dict[str, str] = {
@@ -15,6 +20,12 @@ _NLTK_TO_SPACY: dict[str, str] = {
 }
 """Mapeamento referencial para conversão sintáxica dos IDs base do inglês NLTK frente à SpaCy."""
 
+DEFAULT_STOPWORDS_CACHE_DIR = Path.home() / ".cache" / "sa" / "stopwords"
+"""Diretório padrão dos conjuntos de stopwords compilados por `load_stopwords`."""
+
+STOPWORDS_ARTIFACT_VERSION = 1
+"""Versão do formato dos artefatos compilados; alterá-la invalida os artefatos existentes."""
+
 
 def load_base_stopwords(lang: str = "portuguese") -> set[str]:
     """
@@ -97,3 +108,86 @@ def build_stopwords(
         sw = sw - keep
 
     return sw
+
+
+def stopwords_fingerprint(lang: str = "portuguese", extras_path: Path | None = None, keep: AbstractSet[str] | None = None) -> str:
+    """
+    Calcula a impressão digital de uma composição de stopwords, usada como chave do artefato compilado.
+
+    Combina o idioma, o checksum SHA-256 do conteúdo do CSV de extras (não seu caminho nem sua data),
+    o conjunto `keep`, as versões do NLTK e do spaCy (fontes da base) e `STOPWORDS_ARTIFACT_VERSION`.
+
+    Args:
+        lang (str, optional): Idioma no padrão do NLTK.
+        extras_path (Path | None, optional): CSV de stopwords extras, se houver.
+        keep (AbstractSet[str] | None, optional): Palavras removidas do conjunto final.
+
+    Returns:
+        str: Digest SHA-256 hexadecimal da composição.
+
+    Raises:
+        FileNotFoundError: Se `extras_path` não existir.
+    """
+
+    extras_checksum = sha256(Path(extras_path).read_bytes()).hexdigest() if extras_path is not None else None
+    key = {
+        "version": STOPWORDS_ARTIFACT_VERSION,
+        "lang": lang,
+        "extras": extras_checksum,
+        "keep": sorted(keep) if keep is not None else None,
+        "nltk": nltk.__version__,
+        "spacy": spacy.about.__version__,
+    }
+
+    return sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def load_stopwords(
+    lang: str = "portuguese",
+    extras_path: Path | None = None,
+    keep: AbstractSet[str] | None = None,
+    cache_dir: Optional[Path] = DEFAULT_STOPWORDS_CACHE_DIR,
+) -> frozenset[str]:
+    """
+    Carrega o conjunto de stopwords compilado, construindo-o com `build_stopwords` apenas na primeira vez.
+
+    A primeira chamada para uma composição ``(idioma, checksum dos extras, keep)`` executa `build_stopwords`
+    (download do NLTK, `spacy.blank` e leitura do CSV via pandas) e grava o resultado como artefato JSON em
+    `cache_dir`. As chamadas seguintes apenas leem o artefato, em milissegundos e sem acesso à rede.
+
+    Args:
+        lang (str, optional): Idioma no padrão do NLTK.
+        extras_path (Path | None, optional): CSV de stopwords extras (coluna ``palavra``), se houver.
+        keep (AbstractSet[str] | None, optional): Palavras removidas do conjunto final.
+        cache_dir (Optional[Path], optional): Diretório dos artefatos compilados; se `None`, sempre reconstrói sem gravar.
+
+    Returns:
+        frozenset[str]: Conjunto imutável de stopwords, idêntico ao de `build_stopwords`.
+
+    Observações:
+        - Editar o CSV de extras muda seu checksum e, portanto, gera um novo artefato; os antigos podem ser apagados livremente.
+        - O artefato é gravado em arquivo temporário e renomeado, então execuções concorrentes nunca leem um artefato parcial.
+    """
+
+    if cache_dir is None:
+        return frozenset(build_stopwords(lang, extras_path, set(keep) if keep is not None else None))
+
+    fingerprint = stopwords_fingerprint(lang, extras_path, keep)
+    artifact = Path(cache_dir) / f"{lang}-{fingerprint[:16]}.json"
+
+    try:
+        data = json.loads(artifact.read_text(encoding="utf-8"))
+
+        if data.get("fingerprint") == fingerprint:
+            return frozenset(data["words"])
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    words = build_stopwords(lang, extras_path, set(keep) if keep is not None else None)
+
+    artifact.parent.mkdir(parents=True, exist_ok=True)
+    partial = artifact.with_name(f"{artifact.name}.{os.getpid()}.partial")
+    partial.write_text(json.dumps({"fingerprint": fingerprint, "lang": lang, "words": sorted(words)}, ensure_ascii=False), encoding="utf-8")
+    partial.replace(artifact)
+
+    return frozenset(words)
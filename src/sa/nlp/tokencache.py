@@ -0,0 +1,373 @@
+"""Cache persistente, em arquivo colunar NumPy, dos tokens pré-processados de cada texto."""
+
+from __future__ import annotations
+
+import json
+import os
+from hashlib import md5, sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Optional
+
+import numpy as np
+import spacy.about
+
+from .language import DEFAULT_ALLOWED_POS, DEFAULT_BATCH_SIZE, preprocess_texts
+
+if TYPE_CHECKING:
+    from spacy.language import Language as SpacyLanguage
+
+    from .cache import PreprocessCache
+    from .parallel import PreprocessPool
+    from .pipeline import PipelineInfo
+
+DEFAULT_TOKEN_CACHE_DIR = Path.home() / ".cache" / "sa" / "tokens"
+"""Diretório padrão dos arquivos de tokens gravados por `TokenCorpusCache`."""
+
+TOKEN_CACHE_VERSION = 2
+"""Versão do formato do arquivo e do pré-processamento; alterá-la invalida os caches existentes."""
+
+
+def token_cache_fingerprint(
+    stopwords: AbstractSet[str],
+    nlp: "SpacyLanguage | PipelineInfo",
+    allowed_pos: AbstractSet[str] | None = None,
+    min_token_len: int = 3,
+) -> str:
+    """
+    Calcula a impressão digital de uma configuração de pré-processamento, usada como chave do cache de tokens.
+
+    Combina o conteúdo do conjunto de stopwords (e não sua origem), as classes gramaticais preservadas,
+    o comprimento mínimo dos lemas, o nome, a versão e os componentes ativos do modelo spaCy, a versão
+    do spaCy e `TOKEN_CACHE_VERSION`. Qualquer mudança gera um cache novo em vez de tokens obsoletos.
+
+    Args:
+        stopwords (AbstractSet[str]): Conjunto de stopwords suprimidas.
+        nlp (SpacyLanguage | PipelineInfo): Modelo spaCy carregado (com o perfil de pipeline em uso) ou
+            seus metadados, obtidos por `pipeline_info` sem carregar o modelo.
+        allowed_pos (AbstractSet[str] | None, optional): Classes gramaticais preservadas; se `None`, `DEFAULT_ALLOWED_POS`.
+        min_token_len (int, optional): Comprimento mínimo do lema aceito.
+
+    Returns:
+        str: Digest SHA-256 hexadecimal da configuração.
+    """
+
+    key = {
+        "version": TOKEN_CACHE_VERSION,
+        "stopwords": sha256("\n".join(sorted(stopwords)).encode()).hexdigest(),
+        "allowed_pos": sorted(allowed_pos if allowed_pos is not None else DEFAULT_ALLOWED_POS),
+        "min_token_len": min_token_len,
+        "model": f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}-{nlp.meta.get('version')}",
+        "pipes": list(nlp.pipe_names),
+        "spacy": spacy.about.__version__,
+    }
+
+    return sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def _text_key(text: str) -> int:
+    """Chave de 64 bits de um texto bruto: os primeiros 8 bytes do seu MD5."""
+
+    return int.from_bytes(md5(text.encode()).digest()[:8], "little")
+
+
+def _encode_vocabulary(vocabulary: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Codifica o vocabulário como um único bloco de bytes UTF-8, sem o preenchimento de um vetor ``<U{n}``.
+
+    Args:
+        vocabulary (list[str]): Termo de cada id.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Bytes (`uint8`) de todos os termos concatenados e o início de cada
+            termo no bloco, com uma posição a mais que o vocabulário.
+    """
+
+    encoded = [term.encode() for term in vocabulary]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode_vocabulary(blob: np.ndarray, offsets: np.ndarray) -> list[str]:
+    """
+    Decodifica o vocabulário gravado por `_encode_vocabulary`.
+
+    Args:
+        blob (np.ndarray): Bytes (`uint8`) de todos os termos concatenados.
+        offsets (np.ndarray): Início de cada termo no bloco, com uma posição a mais que o vocabulário.
+
+    Returns:
+        list[str]: Termo de cada id.
+    """
+
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+
+    return [data[start:end].decode() for start, end in zip(bounds, bounds[1:])]
+
+
+class TokenCorpusCache:
+    """
+    Cache persistente dos tokens de `preprocess_texts` por texto, para uma configuração de pré-processamento.
+
+    Cada configuração (`token_cache_fingerprint`) tem seu próprio arquivo ``tokens-<fingerprint>.npz`` em
+    `cache_dir`, em formato colunar: as chaves dos textos (64 bits do MD5 do texto bruto), ordenadas,
+    os deslocamentos de cada texto, os ids de todos os tokens em um único vetor e o vocabulário (os
+    termos em UTF-8 concatenados em um único bloco de bytes, com os deslocamentos de cada termo). A
+    consulta de um lote inteiro é uma busca binária vetorizada (`np.searchsorted`); apenas os textos
+    novos ou alterados chegam ao modelo spaCy e são acrescentados ao arquivo em `save`.
+
+    Attributes:
+        path (Path): Arquivo do cache desta configuração.
+        fingerprint (str): Impressão digital da configuração.
+        hits (int): Textos atendidos pelo cache nesta sessão.
+        misses (int): Textos processados pelo modelo nesta sessão.
+
+    Observações:
+        - Mudar as stopwords, as classes gramaticais, `min_token_len` ou o modelo gera outro arquivo;
+          os antigos podem ser apagados livremente.
+        - Linhas removidas da planilha continuam no arquivo (são apenas ignoradas); reconstruir o cache
+          (`load=False`) o reduz às linhas atuais.
+        - O arquivo é gravado compactado (`np.savez_compressed`) em um temporário e renomeado, então
+          uma execução interrompida nunca deixa um cache parcial.
+    """
+
+    def __init__(self, cache_dir: str | Path, fingerprint: str, load: bool = True):
+        """
+        Abre o cache de uma configuração, carregando o arquivo existente.
+
+        Args:
+            cache_dir (str | Path): Diretório dos arquivos de tokens.
+            fingerprint (str): Impressão digital da configuração (`token_cache_fingerprint`).
+            load (bool, optional): Carrega o arquivo existente; com `False`, o cache começa vazio e é regravado.
+        """
+
+        self.path = Path(cache_dir) / f"tokens-{fingerprint[:16]}.npz"
+        self.fingerprint = fingerprint
+
+        self._keys = np.zeros(0, dtype=np.uint64)
+        """Chave de cada texto armazenado, em ordem crescente."""
+
+        self._offsets = np.zeros(1, dtype=np.int64)
+        """Início de cada texto em `_ids`, com uma posição a mais que `_keys`."""
+
+        self._ids = np.zeros(0, dtype=np.int32)
+        """Id, no vocabulário, de cada token de todos os textos."""
+
+        self._vocabulary: list[str] = []
+        """Termo de cada id."""
+
+        self._new: dict[int, list[str]] = {}
+        """Tokens dos textos processados nesta sessão, ainda não gravados."""
+
+        self.hits = 0
+        self.misses = 0
+
+        if load:
+            self._load()
+
+    def _load(self) -> None:
+        """Carrega o arquivo desta configuração, se existir e for compatível."""
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if str(data["fingerprint"]) != self.fingerprint:
+                    return
+
+                self._keys = data["keys"]
+                self._offsets = data["offsets"]
+                self._ids = data["ids"]
+                self._vocabulary = _decode_vocabulary(data["vocabulary"], data["vocabulary_offsets"])
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            pass
+
+    def lookup(self, texts: Iterable[str]) -> tuple[list[Optional[list[str]]], list[int]]:
+        """
+        Consulta os tokens de vários textos de uma só vez.
+
+        Args:
+            texts (Iterable[str]): Textos brutos, exatamente como enviados a `preprocess_texts`.
+
+        Returns:
+            tuple[list[Optional[list[str]]], list[int]]: Tokens de cada texto (`None` se ausente do cache)
+                e a chave de cada texto, para registrar os ausentes com `put`.
+        """
+
+        keys = [_text_key(str(text)) for text in texts]
+        found: list[Optional[list[str]]] = [None] * len(keys)
+
+        if len(self._keys) and keys:
+            query = np.fromiter(keys, dtype=np.uint64, count=len(keys))
+            positions = np.minimum(np.searchsorted(self._keys, query), len(self._keys) - 1)
+            rows = np.flatnonzero(self._keys[positions] == query)
+
+            if len(rows):
+                starts = self._offsets[positions[rows]]
+                lengths = self._offsets[positions[rows] + 1] - starts
+
+                # Todos os tokens encontrados em um único gather, convertidos em termos de uma vez
+                gather = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+                vocabulary = self._vocabulary
+                terms = [vocabulary[i] for i in self._ids[gather].tolist()]
+                ends = np.cumsum(lengths).tolist()
+
+                for row, end, length in zip(rows.tolist(), ends, lengths.tolist()):
+                    found[row] = terms[end - length : end]
+
+        for row, key in enumerate(keys):
+            if found[row] is None and key in self._new:
+                found[row] = self._new[key]
+
+        return found, keys
+
+    def put(self, key: int, tokens: list[str]) -> None:
+        """
+        Registra os tokens de um texto processado nesta sessão (gravados em `save`).
+
+        Args:
+            key (int): Chave do texto, como devolvida por `lookup`.
+            tokens (list[str]): Tokens de `preprocess_texts` para o texto.
+        """
+
+        self._new[key] = tokens
+
+    def preprocess(
+        self,
+        texts: Iterable[str],
+        stopwords: AbstractSet[str],
+        nlp: Optional["SpacyLanguage"],
+        allowed_pos: set[str] | None = None,
+        min_token_len: int = 3,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+        cache: Optional["PreprocessCache"] = None,
+        pool: Optional["PreprocessPool"] = None,
+    ) -> list[list[str]]:
+        """
+        Equivalente a `preprocess_texts`, mas enviando ao modelo apenas os textos ausentes do cache.
+
+        Os argumentos de pré-processamento devem ser os mesmos usados em `token_cache_fingerprint`.
+
+        Args:
+            texts (Iterable[str]): Textos brutos.
+            stopwords (AbstractSet[str]): Conjunto de stopwords a suprimir.
+            nlp (Optional[SpacyLanguage]): Modelo spaCy carregado; pode ser `None` com `pool`, cujos processos têm o seu.
+            allowed_pos (set[str] | None, optional): Classes gramaticais preservadas; se `None`, `DEFAULT_ALLOWED_POS`.
+            min_token_len (int, optional): Comprimento mínimo do lema aceito.
+            batch_size (int, optional): Quantidade de textos enviados ao modelo por lote.
+            n_process (int, optional): Processos usados pelo `nlp.pipe`.
+            cache (Optional[PreprocessCache], optional): Cache em memória repassado a `preprocess_texts`.
+            pool (Optional[PreprocessPool], optional): Pool de processos que pré-processa os textos ausentes no lugar
+                de `preprocess_texts`; configurado com os mesmos parâmetros, que então são ignorados aqui.
+
+        Returns:
+            list[list[str]]: Tokens de cada texto, na ordem de entrada.
+
+        Raises:
+            ValueError: Se `nlp` e `pool` forem ambos `None`.
+        """
+
+        if nlp is None and pool is None:
+            raise ValueError("Informe o modelo spaCy ou o pool de processos que pré-processa os textos.")
+
+        batch = list(texts)
+        tokens, keys = self.lookup(batch)
+        missing = [i for i, found in enumerate(tokens) if found is None]
+
+        self.hits += len(batch) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            pending = (batch[i] for i in missing)
+
+            if pool is not None:
+                processed: Iterable[list[str]] = pool.map(pending)
+            else:
+                assert nlp is not None
+
+                processed = preprocess_texts(
+                    pending,
+                    stopwords,
+                    nlp,
+                    allowed_pos=allowed_pos,
+                    min_token_len=min_token_len,
+                    batch_size=batch_size,
+                    n_process=n_process,
+                    cache=cache,
+                )
+
+            for i, found in zip(missing, processed):
+                tokens[i] = found
+                self.put(keys[i], found)
+
+        return [found if found is not None else [] for found in tokens]
+
+    def save(self) -> None:
+        """
+        Acrescenta ao arquivo os textos processados nesta sessão, mantendo as chaves ordenadas.
+
+        Não grava nada se nenhum texto novo foi processado.
+        """
+
+        if not self._new:
+            return
+
+        terms = {term: i for i, term in enumerate(self._vocabulary)}
+
+        for tokens in self._new.values():
+            for term in tokens:
+                terms.setdefault(term, len(terms))
+
+        new_lengths = np.fromiter(map(len, self._new.values()), dtype=np.int64, count=len(self._new))
+        new_ids = np.fromiter((terms[term] for tokens in self._new.values() for term in tokens), dtype=np.int32, count=int(new_lengths.sum()))
+
+        keys = np.concatenate([self._keys, np.fromiter(self._new, dtype=np.uint64, count=len(self._new))])
+        lengths = np.concatenate([np.diff(self._offsets), new_lengths])
+        starts = np.concatenate([self._offsets[:-1], len(self._ids) + np.concatenate(([0], np.cumsum(new_lengths)[:-1]))])
+        ids = np.concatenate([self._ids, new_ids])
+
+        order = np.argsort(keys, kind="stable")
+        lengths = lengths[order]
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        gather = np.repeat(starts[order] - offsets[:-1], lengths) + np.arange(offsets[-1])
+
+        self._keys = keys[order]
+        self._offsets = offsets
+        self._ids = ids[gather].astype(np.int32)
+        self._vocabulary = list(terms)
+        self._new.clear()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(f"{self.path.name}.{os.getpid()}.partial")
+
+        vocabulary, vocabulary_offsets = _encode_vocabulary(self._vocabulary)
+
+        with partial.open("wb") as f:
+            np.savez_compressed(
+                f,
+                fingerprint=np.array(self.fingerprint),
+                keys=self._keys,
+                offsets=self._offsets,
+                ids=self._ids,
+                vocabulary=vocabulary,
+                vocabulary_offsets=vocabulary_offsets,
+            )
+
+        partial.replace(self.path)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração dos textos atendidos pelo cache nesta sessão (``0.0`` sem consultas)."""
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._new)
+
+    def __repr__(self) -> str:
+        return f"TokenCorpusCache(path={str(self.path)!r}, texts={len(self)}, terms={len(self._vocabulary)})"
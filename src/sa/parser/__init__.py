@@ -3,21 +3,37 @@ Módulo de parsing de argumentos de linha de comando (CLI).
 
 Fornece as classes base e módulos independentes para gerenciamento
 de argumentos via terminal para diferentes scripts operacionais do sistema
-(coleta, conversão de arquivos e geração visual).
+(coleta, conversão e deduplicação de arquivos, atribuição de palavras-chave, geração visual, treino e benchmarks).
 """
 
+from .benchmark import BenchmarkParserNamespace, create_benchmark_parser, parse_benchmark_args
 from .converter import ConverterParserNamespace, create_conveter_parser, parse_converter_args
+from .dedup import DedupParserNamespace, create_dedup_parser, parse_dedup_args
+from .keywords import KeywordsParserNamespace, create_keywords_parser, parse_keywords_args
 from .reddit import RedditParserNamespace, create_reddit_parser, parse_reddit_args
+from .train import TrainParserNamespace, create_train_parser, parse_train_args
 from .view import WordCloudParserNamespace, create_wordcloud_parser, parse_wordcloud_args
 
 __all__ = [
+    "BenchmarkParserNamespace",
+    "create_benchmark_parser",
     "ConverterParserNamespace",
+    "DedupParserNamespace",
     "create_conveter_parser",
+    "create_dedup_parser",
+    "create_keywords_parser",
     "create_reddit_parser",
+    "create_train_parser",
     "create_wordcloud_parser",
+    "parse_benchmark_args",
     "parse_converter_args",
+    "parse_dedup_args",
+    "parse_keywords_args",
     "parse_reddit_args",
+    "parse_train_args",
     "parse_wordcloud_args",
+    "KeywordsParserNamespace",
     "RedditParserNamespace",
+    "TrainParserNamespace",
     "WordCloudParserNamespace",
 ]
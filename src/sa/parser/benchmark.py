@@ -0,0 +1,170 @@
+"""Parser de argumentos CLI para os benchmarks de desempenho do pipeline de NLP."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from sa.nlp import DEFAULT_SPACY_MODEL, PipelineProfile
+
+DEFAULT_CORPUS_PATH = Path(".backup/TESTE_CEGO.csv")
+"""Corpus padrão dos benchmarks: amostra rotulada de posts do projeto (CSV)."""
+
+DEFAULT_CORPUS_COLUMN = "texto"
+"""Coluna do corpus que contém os textos avaliados."""
+
+DEFAULT_BENCHMARK_BATCH_SIZE = 256
+"""Quantidade padrão de textos enviados ao spaCy por lote durante o benchmark."""
+
+DEFAULT_LANGUAGE_BATCH_SIZE = 256
+"""Quantidade padrão de textos por chamada a `LanguageIdentifier.detect_batch` durante o benchmark."""
+
+DEFAULT_REPEAT = 3
+"""Quantidade padrão de repetições de cada medição; o menor tempo é reportado."""
+
+
+class BenchmarkParser(argparse.ArgumentParser):
+    """
+    Parser dedicado aos benchmarks de desempenho (`sa-benchmark`).
+
+    Cada subcomando mede um estágio do pipeline sobre o mesmo corpus de referência.
+    """
+
+
+class BenchmarkParserNamespace(argparse.Namespace):
+    """
+    Namespace tipado dos argumentos de benchmark.
+
+    Attributes:
+        command (str): Subcomando executado (``pipeline`` ou ``language``).
+        input_path (Path): Arquivo CSV do corpus de referência.
+        column (str): Coluna do corpus com os textos.
+        limit (int | None): Quantidade máxima de textos lidos do corpus; `None` usa todos.
+        repeat (int): Repetições de cada medição (reporta-se o menor tempo).
+        model (str): Modelo spaCy avaliado (subcomando ``pipeline``).
+        profiles (list[PipelineProfile]): Perfis de pipeline comparados (subcomando ``pipeline``).
+        batch_size (int): Textos por lote enviados ao spaCy (``pipeline``) ou ao identificador de idioma (``language``).
+    """
+
+    command: str
+    input_path: Path
+    column: str
+    limit: int | None
+    repeat: int
+    model: str
+    profiles: list[PipelineProfile]
+    batch_size: int
+
+
+def create_benchmark_parser() -> BenchmarkParser:
+    """
+    Cria o parser de benchmarks com um subcomando por estágio medido.
+
+    Returns:
+        BenchmarkParser: Parser configurado com as opções comuns de corpus e os subcomandos.
+    """
+
+    parser = BenchmarkParser(
+        prog="sa-benchmark",
+        description="Mede o desempenho dos estágios de NLP sobre um corpus de referência.",
+    )
+
+    # Do mesmo tipo do parser principal: os subcomandos de `add_subparsers` esperam pais `BenchmarkParser`
+    common = BenchmarkParser(add_help=False)
+
+    common.add_argument(
+        "-i",
+        "--input-path",
+        type=Path,
+        default=DEFAULT_CORPUS_PATH,
+        help=f"Arquivo CSV do corpus de referência (default: {DEFAULT_CORPUS_PATH})",
+    )
+
+    common.add_argument(
+        "-c",
+        "--column",
+        type=str,
+        default=DEFAULT_CORPUS_COLUMN,
+        help=f"Coluna do corpus com os textos (default: {DEFAULT_CORPUS_COLUMN})",
+    )
+
+    common.add_argument(
+        "-l",
+        "--limit",
+        type=int,
+        default=None,
+        help="Quantidade máxima de textos lidos do corpus (default: todos)",
+    )
+
+    common.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Repetições de cada medição; reporta-se o menor tempo (default: {DEFAULT_REPEAT})",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pipeline = subparsers.add_parser(
+        "pipeline",
+        parents=[common],
+        help="Compara os perfis de pipeline spaCy (carga, vazão e concordância dos tokens).",
+    )
+
+    pipeline.add_argument(
+        "-m",
+        "--model",
+        type=str,
+        default=DEFAULT_SPACY_MODEL,
+        help=f"Modelo spaCy avaliado (default: {DEFAULT_SPACY_MODEL})",
+    )
+
+    pipeline.add_argument(
+        "-p",
+        "--profiles",
+        type=PipelineProfile,
+        nargs="+",
+        default=list(PipelineProfile),
+        help=f"Perfis comparados (default: {' '.join(profile.value for profile in PipelineProfile)})",
+    )
+
+    pipeline.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BENCHMARK_BATCH_SIZE,
+        help=f"Textos por lote enviados ao spaCy (default: {DEFAULT_BENCHMARK_BATCH_SIZE})",
+    )
+
+    language = subparsers.add_parser(
+        "language",
+        parents=[common],
+        help="Compara o identificador de idioma por n-gramas com o langdetect (vazão, concordância e estabilidade).",
+    )
+
+    language.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=DEFAULT_LANGUAGE_BATCH_SIZE,
+        help=f"Textos por chamada ao identificador em lote (default: {DEFAULT_LANGUAGE_BATCH_SIZE})",
+    )
+
+    return parser
+
+
+def parse_benchmark_args(argv: list[str] | None = None) -> BenchmarkParserNamespace:
+    """
+    Interpreta os argumentos do benchmark.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos a interpretar; se `None`, usa `sys.argv`.
+
+    Returns:
+        BenchmarkParserNamespace: Argumentos convertidos para seus tipos (Paths, Enums, inteiros).
+    """
+
+    parser = create_benchmark_parser()
+
+    return parser.parse_args(argv, namespace=BenchmarkParserNamespace())
@@ -0,0 +1,119 @@
+"""Parser de argumentos CLI para a remoção de quase duplicados de exportações."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from sa.nlp import DEFAULT_NEAR_DUPLICATE_THRESHOLD
+
+DEFAULT_DEDUP_COLUMNS = ["title", "content"]
+"""Colunas padrão concatenadas para formar o texto comparado de cada linha."""
+
+DEFAULT_ID_COLUMN = "post_id"
+"""Coluna padrão que identifica cada linha na marcação dos quase duplicados."""
+
+
+class DedupParser(argparse.ArgumentParser):
+    """
+    Parser dedicado à remoção de quase duplicados de exportações (`sa-dedup`).
+    """
+
+
+class DedupParserNamespace(argparse.Namespace):
+    """
+    Namespace tipado dos argumentos de remoção de quase duplicados.
+
+    Attributes:
+        input_path (Path): Exportação lida (CSV ou XLSX, pela extensão).
+        output_path (Path): Arquivo gravado (CSV ou XLSX, pela extensão).
+        threshold (float): Similaridade estimada a partir da qual uma linha é quase duplicada.
+        columns (list[str]): Colunas concatenadas para formar o texto comparado.
+        id_column (str): Coluna que identifica cada linha em `--mark`; se ausente do arquivo, usa a posição.
+        mark (bool): Mantém todas as linhas e acrescenta a coluna `near_duplicate_of` em vez de removê-las.
+    """
+
+    input_path: Path
+    output_path: Path
+    threshold: float
+    columns: list[str]
+    id_column: str
+    mark: bool
+
+
+def create_dedup_parser() -> DedupParser:
+    """
+    Cria o parser de remoção de quase duplicados.
+
+    Returns:
+        DedupParser: Parser configurado com as opções de arquivo, limiar e colunas.
+    """
+
+    parser = DedupParser(
+        prog="sa-dedup",
+        description="Remove de uma exportação as linhas quase duplicadas (MinHash/LSH) de linhas anteriores.",
+    )
+
+    parser.add_argument(
+        "-i",
+        "--input-path",
+        type=Path,
+        required=True,
+        help="Exportação lida (CSV ou XLSX, pela extensão).",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output-path",
+        type=Path,
+        required=True,
+        help="Arquivo gravado (CSV ou XLSX, pela extensão).",
+    )
+
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+        help=f"Similaridade de Jaccard estimada a partir da qual uma linha é quase duplicada (default: {DEFAULT_NEAR_DUPLICATE_THRESHOLD})",
+    )
+
+    parser.add_argument(
+        "-c",
+        "--columns",
+        type=str,
+        nargs="+",
+        default=DEFAULT_DEDUP_COLUMNS,
+        help=f"Colunas concatenadas para formar o texto comparado (default: {' '.join(DEFAULT_DEDUP_COLUMNS)})",
+    )
+
+    parser.add_argument(
+        "--id-column",
+        type=str,
+        default=DEFAULT_ID_COLUMN,
+        help=f"Coluna que identifica cada linha em --mark; ausente no arquivo, usa a posição da linha (default: {DEFAULT_ID_COLUMN})",
+    )
+
+    parser.add_argument(
+        "--mark",
+        action="store_true",
+        help="Mantém todas as linhas e acrescenta a coluna near_duplicate_of em vez de remover os quase duplicados",
+    )
+
+    return parser
+
+
+def parse_dedup_args(argv: list[str] | None = None) -> DedupParserNamespace:
+    """
+    Interpreta os argumentos de remoção de quase duplicados.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos a interpretar; se `None`, usa `sys.argv`.
+
+    Returns:
+        DedupParserNamespace: Argumentos convertidos para seus tipos (Paths, números).
+    """
+
+    parser = create_dedup_parser()
+
+    return parser.parse_args(argv, namespace=DedupParserNamespace())
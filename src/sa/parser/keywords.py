@@ -0,0 +1,105 @@
+"""Parser de argumentos CLI para a atribuição local de palavras-chave em exportações."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+DEFAULT_KEYWORD_COLUMNS = ["title", "content"]
+"""Colunas padrão concatenadas para formar o texto pesquisado de cada linha."""
+
+
+class KeywordsParser(argparse.ArgumentParser):
+    """
+    Parser dedicado à atribuição local de palavras-chave em exportações (`sa-keywords`).
+    """
+
+
+class KeywordsParserNamespace(argparse.Namespace):
+    """
+    Namespace tipado dos argumentos de atribuição de palavras-chave.
+
+    Attributes:
+        input_path (Path): Exportação lida (CSV ou XLSX, pela extensão).
+        output_path (Path): Arquivo gravado (CSV ou XLSX, pela extensão).
+        keywords (Path): CSV de palavras-chave com as colunas `palavra` e `polaridade`.
+        columns (list[str]): Colunas concatenadas para formar o texto pesquisado.
+        only_matched (bool): Mantém apenas as linhas com ao menos uma palavra-chave.
+    """
+
+    input_path: Path
+    output_path: Path
+    keywords: Path
+    columns: list[str]
+    only_matched: bool
+
+
+def create_keywords_parser() -> KeywordsParser:
+    """
+    Cria o parser de atribuição de palavras-chave.
+
+    Returns:
+        KeywordsParser: Parser configurado com as opções de arquivo, palavras-chave e colunas.
+    """
+
+    parser = KeywordsParser(
+        prog="sa-keywords",
+        description="Acrescenta a uma exportação as palavras-chave (e polaridades) presentes no texto de cada linha.",
+    )
+
+    parser.add_argument(
+        "-i",
+        "--input-path",
+        type=Path,
+        required=True,
+        help="Exportação lida (CSV ou XLSX, pela extensão).",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output-path",
+        type=Path,
+        required=True,
+        help="Arquivo gravado (CSV ou XLSX, pela extensão).",
+    )
+
+    parser.add_argument(
+        "-k",
+        "--keywords",
+        type=Path,
+        required=True,
+        help="CSV de palavras-chave com as colunas 'palavra' e 'polaridade' (positive, negative ou neutral).",
+    )
+
+    parser.add_argument(
+        "-c",
+        "--columns",
+        type=str,
+        nargs="+",
+        default=DEFAULT_KEYWORD_COLUMNS,
+        help=f"Colunas concatenadas para formar o texto pesquisado (default: {' '.join(DEFAULT_KEYWORD_COLUMNS)})",
+    )
+
+    parser.add_argument(
+        "--only-matched",
+        action="store_true",
+        help="Mantém apenas as linhas em que ao menos uma palavra-chave foi encontrada",
+    )
+
+    return parser
+
+
+def parse_keywords_args(argv: list[str] | None = None) -> KeywordsParserNamespace:
+    """
+    Interpreta os argumentos de atribuição de palavras-chave.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos a interpretar; se `None`, usa `sys.argv`.
+
+    Returns:
+        KeywordsParserNamespace: Argumentos convertidos para seus tipos (Paths).
+    """
+
+    parser = create_keywords_parser()
+
+    return parser.parse_args(argv, namespace=KeywordsParserNamespace())
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from sa.file import FileFormat
 from sa.model import Language
+from sa.nlp import DEFAULT_NEAR_DUPLICATE_THRESHOLD, LanguageDetector
 
 DEFAULT_SUBREDDIT = "conversas"
 """Nó padrão estipulado em caso de flag `--subreddits` ausente no console."""
@@ -20,6 +21,18 @@ DEFAULT_OUTPUT_FORMAT = FileFormat.XLSX
 DEFAULT_TOTAL_PER_WORD = 50000
 """Teto operacional máximo garantido (cap) por tópico analisado."""
 
+DEFAULT_WORKERS = 1
+"""Quantidade padrão de subreddits coletados simultaneamente (1 = coleta sequencial)."""
+
+DEFAULT_KEYWORDS_PER_QUERY = 1
+"""Quantidade padrão de palavras-chave combinadas por busca (1 = uma busca por palavra-chave)."""
+
+DEFAULT_REPLAY_LATENCY = 0.0
+"""Latência simulada padrão por página reproduzida de um cassete (0 = sem espera)."""
+
+DEFAULT_LANGUAGE_DETECTOR = LanguageDetector.NGRAM
+"""Motor padrão de detecção de idioma: identificador de n-gramas determinístico e em lote."""
+
 
 class RedditParser(argparse.ArgumentParser):
     """
@@ -42,6 +55,22 @@ class RedditParserNamespace(argparse.Namespace):
         total (int): Volume numérico int teto usado na função `limit`.
         output (Path): Path consolidado garantindo compatibilidade da saída.
         format (FileFormat): Sinalética rigorosa para driver interpretador (pandas: csv/xlsx).
+        workers (int): Tamanho do pool de threads que coleta subreddits em paralelo.
+        index (Path | None): Arquivo SQLite do índice de deduplicação persistente entre execuções.
+        resume (bool): Retoma uma coleta interrompida a partir do journal de checkpoint.
+        watermarks (Path | None): Arquivo JSON de marcas d'água que habilita a coleta incremental.
+        keywords_per_query (int): Palavras-chave de uma polaridade combinadas (``OR``) em cada busca.
+        multireddit (bool): Busca todos os subreddits juntos via sintaxe ``a+b``.
+        rpm (float | None): Orçamento global de requisições por minuto à API; `None` desativa o agendador.
+        record (Path | None): Cassete onde as buscas feitas à API são gravadas.
+        replay (Path | None): Cassete cujas buscas gravadas substituem a API (execução offline, sem credenciais).
+        replay_latency (float): Latência simulada, em segundos, por página de resultados reproduzida.
+        profile (bool): Mede o tempo de cada etapa do pipeline e imprime um resumo ao final.
+        language_detector (LanguageDetector): Motor de detecção de idioma dos posts (``ngram`` ou ``langdetect``).
+        language_cache (Path | None): Arquivo SQLite do cache persistente de idiomas detectados.
+        score (bool): Acrescenta às exportações a coluna `sentiment`, pontuada por léxico.
+        lexicon (Path | None): Léxico de polaridade em CSV (formato OpLexicon); `None` usa o léxico embutido.
+        near_duplicates (float | None): Similaridade a partir da qual posts quase duplicados são descartados; `None` desativa.
     """
 
     subreddits: list[str]
@@ -49,6 +78,22 @@ class RedditParserNamespace(argparse.Namespace):
     total: int
     output: Path
     format: FileFormat
+    workers: int
+    index: Path | None
+    resume: bool
+    watermarks: Path | None
+    keywords_per_query: int
+    multireddit: bool
+    rpm: float | None
+    record: Path | None
+    replay: Path | None
+    replay_latency: float
+    profile: bool
+    language_detector: LanguageDetector
+    language_cache: Path | None
+    score: bool
+    lexicon: Path | None
+    near_duplicates: float | None
 
 
 def create_reddit_parser() -> RedditParser:
@@ -110,6 +155,124 @@ def create_reddit_parser() -> RedditParser:
         help=f"Formato do arquivo de saída (default: {DEFAULT_OUTPUT_FORMAT.value})",
     )
 
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Quantidade de subreddits coletados em paralelo (default: {DEFAULT_WORKERS})",
+    )
+
+    parser.add_argument(
+        "-x",
+        "--index",
+        type=Path,
+        default=None,
+        help="Arquivo SQLite de deduplicação persistente; posts já presentes nele são ignorados (default: desativado)",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--resume",
+        action="store_true",
+        help="Retoma uma coleta interrompida a partir do journal de checkpoint (<output>.journal)",
+    )
+
+    parser.add_argument(
+        "-m",
+        "--watermarks",
+        type=Path,
+        default=None,
+        help="Arquivo JSON de marcas d'água para coleta incremental desde a última execução (default: desativado)",
+    )
+
+    parser.add_argument(
+        "-k",
+        "--keywords-per-query",
+        type=int,
+        default=DEFAULT_KEYWORDS_PER_QUERY,
+        help=f"Palavras-chave de uma polaridade combinadas (OR) em cada busca (default: {DEFAULT_KEYWORDS_PER_QUERY})",
+    )
+
+    parser.add_argument(
+        "--multireddit",
+        action="store_true",
+        help="Busca todos os subreddits em uma única consulta (sintaxe a+b do Reddit)",
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help="Orçamento global de requisições por minuto à API, compartilhado entre os workers (default: desativado)",
+    )
+
+    cassette = parser.add_mutually_exclusive_group()
+
+    cassette.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        help="Grava as buscas feitas à API no cassete informado, para reprodução offline (default: desativado)",
+    )
+
+    cassette.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        help="Reproduz as buscas de um cassete gravado em vez de acessar a API; dispensa credenciais (default: desativado)",
+    )
+
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=DEFAULT_REPLAY_LATENCY,
+        help=f"Latência simulada, em segundos, por página de resultados reproduzida (default: {DEFAULT_REPLAY_LATENCY})",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mede tempo, chamadas e vazão de cada etapa (busca, normalização, idioma, exportação) e imprime um resumo",
+    )
+
+    parser.add_argument(
+        "--language-detector",
+        type=LanguageDetector,
+        default=DEFAULT_LANGUAGE_DETECTOR,
+        help=f"Motor de detecção de idioma: ngram (determinístico, em lote) ou langdetect (default: {DEFAULT_LANGUAGE_DETECTOR.value})",
+    )
+
+    parser.add_argument(
+        "--language-cache",
+        type=Path,
+        default=None,
+        help="Arquivo SQLite que guarda os idiomas detectados entre execuções, por hash do texto (default: desativado)",
+    )
+
+    parser.add_argument(
+        "--score",
+        action="store_true",
+        help="Acrescenta às exportações a coluna sentiment, com a polaridade de cada post pontuada por léxico",
+    )
+
+    parser.add_argument(
+        "--lexicon",
+        type=Path,
+        default=None,
+        help="Léxico de polaridade em CSV (termo,classe,polaridade ou termo,polaridade); implica --score (default: léxico embutido)",
+    )
+
+    parser.add_argument(
+        "--near-duplicates",
+        type=float,
+        nargs="?",
+        const=DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+        default=None,
+        metavar="THRESHOLD",
+        help=f"Descarta posts quase duplicados (MinHash/LSH) com similaridade a partir do limiar (sem valor: {DEFAULT_NEAR_DUPLICATE_THRESHOLD}; default: desativado)",
+    )
+
     return parser
 
 
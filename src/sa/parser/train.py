@@ -0,0 +1,147 @@
+"""Parser de argumentos CLI para o treino do classificador de polaridade."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from sa.sentiment import DEFAULT_ALPHA
+
+DEFAULT_TEXT_COLUMN = "texto_treino_ml"
+"""Coluna com os tokens pré-processados de cada post, separados por espaço."""
+
+DEFAULT_LABEL_COLUMN = "polaridade"
+"""Coluna com o rótulo de polaridade de cada post."""
+
+DEFAULT_HOLDOUT = 0.2
+"""Fração padrão dos posts reservada para avaliação (fora do treino)."""
+
+DEFAULT_SEED = 42
+"""Semente padrão do sorteio dos posts de avaliação."""
+
+DEFAULT_TRAIN_CHUNK_SIZE = 100_000
+"""Quantidade padrão de linhas do CSV lidas e acumuladas ao modelo por vez."""
+
+
+class TrainParser(argparse.ArgumentParser):
+    """
+    Parser dedicado ao treino do classificador de polaridade (`sa-train`).
+    """
+
+
+class TrainParserNamespace(argparse.Namespace):
+    """
+    Namespace tipado dos argumentos de treino.
+
+    Attributes:
+        input_path (Path): Arquivo CSV rotulado.
+        output_dir (Path): Diretório onde o modelo treinado é gravado.
+        text_column (str): Coluna com os tokens pré-processados, separados por espaço.
+        label_column (str): Coluna com o rótulo de cada post.
+        alpha (float): Suavização do Naive Bayes.
+        holdout (float): Fração dos posts reservada para avaliação; 0 treina com todos.
+        seed (int): Semente do sorteio dos posts de avaliação.
+        chunk_size (int): Linhas do CSV lidas por vez.
+    """
+
+    input_path: Path
+    output_dir: Path
+    text_column: str
+    label_column: str
+    alpha: float
+    holdout: float
+    seed: int
+    chunk_size: int
+
+
+def create_train_parser() -> TrainParser:
+    """
+    Cria o parser de treino do classificador.
+
+    Returns:
+        TrainParser: Parser configurado com as opções de corpus, modelo e avaliação.
+    """
+
+    parser = TrainParser(
+        prog="sa-train",
+        description="Treina o classificador de polaridade Naive Bayes sobre um corpus rotulado.",
+    )
+
+    parser.add_argument(
+        "-i",
+        "--input-path",
+        type=Path,
+        required=True,
+        help="Arquivo CSV rotulado. Não use o conjunto de teste cego (.backup/TESTE_CEGO.csv), reservado à avaliação.",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        required=True,
+        help="Diretório onde o modelo treinado é gravado.",
+    )
+
+    parser.add_argument(
+        "-t",
+        "--text-column",
+        type=str,
+        default=DEFAULT_TEXT_COLUMN,
+        help=f"Coluna com os tokens pré-processados, separados por espaço (default: {DEFAULT_TEXT_COLUMN})",
+    )
+
+    parser.add_argument(
+        "-y",
+        "--label-column",
+        type=str,
+        default=DEFAULT_LABEL_COLUMN,
+        help=f"Coluna com o rótulo de cada post (default: {DEFAULT_LABEL_COLUMN})",
+    )
+
+    parser.add_argument(
+        "-a",
+        "--alpha",
+        type=float,
+        default=DEFAULT_ALPHA,
+        help=f"Suavização do Naive Bayes (default: {DEFAULT_ALPHA})",
+    )
+
+    parser.add_argument(
+        "--holdout",
+        type=float,
+        default=DEFAULT_HOLDOUT,
+        help=f"Fração dos posts reservada para avaliação; 0 treina com todos (default: {DEFAULT_HOLDOUT})",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Semente do sorteio dos posts de avaliação (default: {DEFAULT_SEED})",
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_TRAIN_CHUNK_SIZE,
+        help=f"Linhas do CSV lidas e acumuladas ao modelo por vez (default: {DEFAULT_TRAIN_CHUNK_SIZE})",
+    )
+
+    return parser
+
+
+def parse_train_args(argv: list[str] | None = None) -> TrainParserNamespace:
+    """
+    Interpreta os argumentos do treino.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos a interpretar; se `None`, usa `sys.argv`.
+
+    Returns:
+        TrainParserNamespace: Argumentos convertidos para seus tipos (Paths, números).
+    """
+
+    parser = create_train_parser()
+
+    return parser.parse_args(argv, namespace=TrainParserNamespace())
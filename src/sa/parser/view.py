@@ -5,12 +5,51 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from sa.nlp import DEFAULT_STOPWORDS_CACHE_DIR, DEFAULT_TOKEN_CACHE_DIR, MAX_NGRAM_ORDER
+
 DEFAULT_SHEETS = ["positivo", "negativo", "neutro"]
 """Abas tabulares base utilizadas quando nenhum `-s` é indicado ao acionar o processador do gráfico."""
 
 DEFAULT_TOP_N = 20
 """Teto delimitante máximo gerado nas representações das Barras Analíticas de Plotagem."""
 
+DEFAULT_NGRAM = 1
+"""Ordem padrão dos n-gramas contados nos gráficos e nuvens (1 = palavras isoladas)."""
+
+DEFAULT_BATCH_SIZE = 256
+"""Quantidade padrão de textos enviados ao spaCy por lote."""
+
+DEFAULT_PROCESSES = 1
+"""Quantidade padrão de processos de pré-processamento (1 = processamento no processo atual)."""
+
+DEFAULT_CACHE_SIZE = 100_000
+"""Quantidade padrão de textos analisados mantidos no cache de pré-processamento (0 = desativado)."""
+
+
+def _process_count(value: str) -> int:
+    """
+    Converte e valida a quantidade de processos de `--processes`.
+
+    Args:
+        value (str): Valor informado na linha de comando.
+
+    Returns:
+        int: Quantidade de processos (``-1`` para todos os núcleos).
+
+    Raises:
+        argparse.ArgumentTypeError: Se o valor não for um inteiro maior ou igual a 1, nem ``-1``.
+    """
+
+    try:
+        processes = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inteiro inválido: {value!r}") from None
+
+    if processes < 1 and processes != -1:
+        raise argparse.ArgumentTypeError(f"deve ser maior ou igual a 1, ou -1 para todos os núcleos: {processes}")
+
+    return processes
+
 
 class WordCloudParser(argparse.ArgumentParser):
     """
@@ -33,14 +72,30 @@ class WordCloudParserNamespace(argparse.Namespace):
         output_dir (Path): Pasta alocada para emissão dos PNGs/JPGs pós rendering.
         sheets (list[str]): Referência matriz indicando as planilhas extraídas individualmente.
         top_n (int): Delimitador algorítimo limitando top items renderizados da word cloud / charts.
+        ngram (int): Ordem dos n-gramas contados (1 a 3).
         extras (Path | None): Referencia secundária ao stopwords.csv fornecido ao modelo via inject opcional.
+        batch_size (int): Quantidade de textos enviados ao spaCy por lote (`nlp.pipe`).
+        processes (int): Processos de pré-processamento, cada um com seu modelo spaCy (``-1`` usa todos os núcleos).
+        cache_size (int): Textos analisados mantidos no cache compartilhado entre abas (0 desativa).
+        stopwords_cache (Path): Diretório dos conjuntos de stopwords compilados.
+        rebuild_stopwords (bool): Reconstrói o conjunto de stopwords ignorando o artefato compilado.
+        token_cache (Path | None): Diretório do cache persistente de tokens pré-processados; `None` o desativa.
+        rebuild_tokens (bool): Reprocessa todos os textos e regrava o cache de tokens.
     """
 
     input_path: Path
     output_dir: Path
     sheets: list[str]
     top_n: int
+    ngram: int
     extras: Path | None
+    batch_size: int
+    processes: int
+    cache_size: int
+    stopwords_cache: Path
+    rebuild_stopwords: bool
+    token_cache: Path | None
+    rebuild_tokens: bool
 
 
 def create_wordcloud_parser() -> WordCloudParser:
@@ -92,6 +147,15 @@ def create_wordcloud_parser() -> WordCloudParser:
         help=f"Número de palavras mais frequentes para o gráfico de barras (default: {DEFAULT_TOP_N}).",
     )
 
+    parser.add_argument(
+        "-g",
+        "--ngram",
+        type=int,
+        choices=range(1, MAX_NGRAM_ORDER + 1),
+        default=DEFAULT_NGRAM,
+        help=f"Ordem dos n-gramas contados nos gráficos e nuvens: 1 palavras, 2 bigramas, 3 trigramas (default: {DEFAULT_NGRAM}).",
+    )
+
     parser.add_argument(
         "-e",
         "--extras",
@@ -100,6 +164,64 @@ def create_wordcloud_parser() -> WordCloudParser:
         help="Caminho para CSV de stopwords extras (coluna 'palavra').",
     )
 
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Quantidade de textos enviados ao spaCy por lote (default: {DEFAULT_BATCH_SIZE}).",
+    )
+
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=_process_count,
+        default=DEFAULT_PROCESSES,
+        help=f"Processos de pré-processamento, cada um com seu modelo spaCy; -1 usa todos os núcleos (default: {DEFAULT_PROCESSES}).",
+    )
+
+    parser.add_argument(
+        "-c",
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help=f"Textos analisados mantidos em cache entre abas; 0 desativa (default: {DEFAULT_CACHE_SIZE}).",
+    )
+
+    parser.add_argument(
+        "--stopwords-cache",
+        type=Path,
+        default=DEFAULT_STOPWORDS_CACHE_DIR,
+        help=f"Diretório dos conjuntos de stopwords compilados (default: {DEFAULT_STOPWORDS_CACHE_DIR}).",
+    )
+
+    parser.add_argument(
+        "--rebuild-stopwords",
+        action="store_true",
+        help="Reconstrói as stopwords (NLTK, spaCy e extras) sem ler nem gravar o conjunto compilado.",
+    )
+
+    parser.add_argument(
+        "--token-cache",
+        type=Path,
+        default=DEFAULT_TOKEN_CACHE_DIR,
+        help=f"Diretório do cache persistente de tokens pré-processados, reaproveitados entre execuções (default: {DEFAULT_TOKEN_CACHE_DIR}).",
+    )
+
+    parser.add_argument(
+        "--no-token-cache",
+        action="store_const",
+        const=None,
+        dest="token_cache",
+        help="Desativa o cache persistente de tokens: todos os textos passam pelo spaCy e nada é gravado.",
+    )
+
+    parser.add_argument(
+        "--rebuild-tokens",
+        action="store_true",
+        help="Reprocessa todos os textos e regrava o cache de tokens apenas com as linhas atuais.",
+    )
+
     return parser
 
 
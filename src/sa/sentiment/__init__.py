@@ -0,0 +1,37 @@
+"""
+Módulo de pontuação e classificação de sentimento.
+
+Atribui a cada post uma polaridade calculada a partir do próprio texto (e não apenas
+da palavra-chave que o trouxe na coleta): os tokens são mapeados por um léxico de
+polaridade do português para ids inteiros e pontuados em lote com NumPy, com
+tratamento de negação ("não", "nunca", "sem"). Oferece também um classificador
+Naive Bayes treinável sobre os tokens de `preprocess_text`.
+"""
+
+from .classifier import DEFAULT_ALPHA, NaiveBayesClassifier, PolarityClassifier
+from .lexicon import NEGATION_WORDS, Lexicon, normalize_term
+from .scorer import (
+    DEFAULT_NEGATION_FACTOR,
+    DEFAULT_NEGATION_WINDOW,
+    DEFAULT_TEXT_COLUMNS,
+    SENTIMENT_COLUMN,
+    SentimentScorer,
+    SentimentScores,
+    tokenize,
+)
+
+__all__ = [
+    "DEFAULT_ALPHA",
+    "DEFAULT_NEGATION_FACTOR",
+    "DEFAULT_NEGATION_WINDOW",
+    "DEFAULT_TEXT_COLUMNS",
+    "Lexicon",
+    "NaiveBayesClassifier",
+    "NEGATION_WORDS",
+    "normalize_term",
+    "PolarityClassifier",
+    "SENTIMENT_COLUMN",
+    "SentimentScorer",
+    "SentimentScores",
+    "tokenize",
+]
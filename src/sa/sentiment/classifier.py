@@ -0,0 +1,434 @@
+"""Classificador Naive Bayes multinomial em NumPy puro, treinado sobre bag-of-words esparso."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterable, Literal, Optional, Sequence
+
+import numpy as np
+
+from sa.nlp import CSRMatrix, Vocabulary
+
+DEFAULT_ALPHA = 1.0
+"""Suavização de Laplace/Lidstone padrão somada à contagem de cada termo por classe."""
+
+MODEL_FORMAT_VERSION = 1
+"""Versão do formato gravado por `NaiveBayesClassifier.save`; modelos de outra versão são recusados."""
+
+METADATA_FILE = "model.json"
+"""Arquivo com as classes, a suavização e a versão do modelo."""
+
+VOCABULARY_FILE = "vocabulary.txt"
+"""Arquivo com os termos do vocabulário, um por linha, na ordem das colunas."""
+
+FEATURE_LOG_PROB_FILE = "feature_log_prob.npy"
+"""Matriz ``(classes, termos)`` de log-probabilidades, carregada com memory-map."""
+
+CLASS_LOG_PRIOR_FILE = "class_log_prior.npy"
+"""Vetor de log-probabilidades a priori das classes."""
+
+FEATURE_COUNT_FILE = "feature_count.npy"
+"""Contagens ``(classes, termos)`` acumuladas, para continuar o treino de um modelo carregado."""
+
+CLASS_COUNT_FILE = "class_count.npy"
+"""Quantidade de documentos de treino de cada classe."""
+
+
+class NaiveBayesClassifier:
+    """
+    Naive Bayes multinomial sobre matrizes `CSRMatrix`, treinável de forma incremental.
+
+    O treino apenas acumula, por classe, a soma das contagens de cada termo (um `np.bincount`
+    por lote), então o corpus pode ser lido em blocos (`partial_fit`) sem nunca residir inteiro
+    em memória; o custo é proporcional aos valores não nulos. Classes e colunas novas podem
+    surgir a qualquer lote. A predição soma, por documento, ``log P(termo | classe) * contagem``
+    com um `np.bincount` por classe.
+
+    Attributes:
+        classes (list[str]): Rótulos conhecidos, na ordem das linhas das matrizes do modelo.
+        alpha (float): Suavização somada à contagem de cada termo.
+
+    Observações:
+        - As log-probabilidades são recalculadas sob demanda após cada `partial_fit`.
+        - `save` grava as matrizes em `.npy`; `load` as abre com ``mmap_mode="r"``, de modo que a
+          carga é praticamente instantânea e as páginas são lidas do disco sob demanda.
+        - Colunas além das vistas no treino (vocabulário que cresceu depois) são ignoradas na predição.
+    """
+
+    def __init__(self, classes: Sequence[str] = (), alpha: float = DEFAULT_ALPHA):
+        """
+        Cria um classificador sem treino.
+
+        Args:
+            classes (Sequence[str], optional): Rótulos conhecidos de antemão; outros são acrescentados no treino.
+            alpha (float, optional): Suavização somada à contagem de cada termo.
+
+        Raises:
+            ValueError: Se `alpha` não for positivo.
+        """
+
+        if alpha <= 0:
+            raise ValueError("A suavização (alpha) deve ser maior que 0.")
+
+        self.classes: list[str] = list(dict.fromkeys(classes))
+        self.alpha = alpha
+
+        self._feature_count = np.zeros((len(self.classes), 0), dtype=np.float64)
+        """Soma das contagens de cada termo por classe."""
+
+        self._class_count = np.zeros(len(self.classes), dtype=np.float64)
+        """Quantidade de documentos de treino de cada classe."""
+
+        self._feature_log_prob: Optional[np.ndarray] = None
+        """Cache de ``log P(termo | classe)``; `None` quando desatualizado."""
+
+        self._class_log_prior: Optional[np.ndarray] = None
+        """Cache de ``log P(classe)``; `None` quando desatualizado."""
+
+    @property
+    def n_features(self) -> int:
+        """Quantidade de colunas (termos) vistas no treino."""
+
+        return int(self._feature_count.shape[1])
+
+    def partial_fit(self, matrix: CSRMatrix, labels: Sequence[str]) -> "NaiveBayesClassifier":
+        """
+        Acumula um lote de documentos rotulados ao modelo.
+
+        Args:
+            matrix (CSRMatrix): Contagens de termos de cada documento.
+            labels (Sequence[str]): Rótulo de cada linha de `matrix`.
+
+        Returns:
+            NaiveBayesClassifier: O próprio classificador.
+
+        Raises:
+            ValueError: Se a quantidade de rótulos divergir da de linhas.
+        """
+
+        if len(labels) != matrix.shape[0]:
+            raise ValueError(f"Foram informados {len(labels)} rótulo(s) para {matrix.shape[0]} documento(s).")
+
+        y = self._encode_labels(labels)
+        self._reserve(len(self.classes), matrix.shape[1])
+
+        n_classes, n_features = self._feature_count.shape
+        keys = y[matrix.row_indices()] * n_features + matrix.indices
+
+        self._feature_count += np.bincount(keys, weights=matrix.data, minlength=n_classes * n_features).reshape(n_classes, n_features)
+        self._class_count += np.bincount(y, minlength=n_classes)
+
+        self._feature_log_prob = None
+        self._class_log_prior = None
+
+        return self
+
+    def fit(self, matrix: CSRMatrix, labels: Sequence[str]) -> "NaiveBayesClassifier":
+        """
+        Treina o modelo do zero, descartando o treino anterior (as classes conhecidas são mantidas).
+
+        Args:
+            matrix (CSRMatrix): Contagens de termos de cada documento.
+            labels (Sequence[str]): Rótulo de cada linha de `matrix`.
+
+        Returns:
+            NaiveBayesClassifier: O próprio classificador.
+        """
+
+        self._feature_count = np.zeros((len(self.classes), 0), dtype=np.float64)
+        self._class_count = np.zeros(len(self.classes), dtype=np.float64)
+
+        return self.partial_fit(matrix, labels)
+
+    @property
+    def feature_log_prob(self) -> np.ndarray:
+        """Matriz ``(classes, termos)`` de ``log P(termo | classe)`` suavizada."""
+
+        if self._feature_log_prob is None:
+            smoothed = self._feature_count + self.alpha
+            self._feature_log_prob = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+
+        return self._feature_log_prob
+
+    @property
+    def class_log_prior(self) -> np.ndarray:
+        """Vetor de ``log P(classe)`` estimado pela frequência das classes no treino."""
+
+        if self._class_log_prior is None:
+            with np.errstate(divide="ignore"):
+                self._class_log_prior = np.log(self._class_count) - np.log(max(self._class_count.sum(), 1.0))
+
+        return self._class_log_prior
+
+    def joint_log_likelihood(self, matrix: CSRMatrix) -> np.ndarray:
+        """
+        Calcula ``log P(classe) + Σ contagem * log P(termo | classe)`` de cada documento.
+
+        Args:
+            matrix (CSRMatrix): Contagens de termos de cada documento.
+
+        Returns:
+            np.ndarray: Matriz ``(documentos, classes)`` de log-verossimilhanças.
+
+        Raises:
+            ValueError: Se o modelo ainda não tiver sido treinado.
+        """
+
+        if not self.classes:
+            raise ValueError("O classificador ainda não foi treinado.")
+
+        feature_log_prob = self.feature_log_prob
+        prior = self.class_log_prior
+
+        known = matrix.indices < feature_log_prob.shape[1]
+        rows = matrix.row_indices()[known]
+        columns = matrix.indices[known]
+        counts = matrix.data[known]
+
+        jll = np.empty((matrix.shape[0], len(self.classes)), dtype=np.float64)
+
+        for c in range(len(self.classes)):
+            jll[:, c] = prior[c] + np.bincount(rows, weights=feature_log_prob[c, columns] * counts, minlength=matrix.shape[0])
+
+        return jll
+
+    def predict_proba(self, matrix: CSRMatrix) -> np.ndarray:
+        """
+        Calcula a probabilidade de cada classe para cada documento.
+
+        Args:
+            matrix (CSRMatrix): Contagens de termos de cada documento.
+
+        Returns:
+            np.ndarray: Matriz ``(documentos, classes)`` cujas linhas somam 1.
+        """
+
+        jll = self.joint_log_likelihood(matrix)
+        jll -= np.max(jll, axis=1, keepdims=True)
+
+        proba: np.ndarray = np.exp(jll)
+        proba /= proba.sum(axis=1, keepdims=True)
+
+        return proba
+
+    def predict(self, matrix: CSRMatrix) -> np.ndarray:
+        """
+        Prediz a classe mais provável de cada documento.
+
+        Args:
+            matrix (CSRMatrix): Contagens de termos de cada documento.
+
+        Returns:
+            np.ndarray: Índice (em `classes`) da classe predita para cada documento.
+        """
+
+        return np.asarray(np.argmax(self.joint_log_likelihood(matrix), axis=1), dtype=np.int64)
+
+    def save(self, directory: str | Path) -> None:
+        """
+        Grava as matrizes do modelo em `.npy` e os metadados em JSON, em um diretório (criado se necessário).
+
+        Args:
+            directory (str | Path): Diretório de destino.
+        """
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        np.save(directory / FEATURE_LOG_PROB_FILE, self.feature_log_prob)
+        np.save(directory / CLASS_LOG_PRIOR_FILE, self.class_log_prior)
+        np.save(directory / FEATURE_COUNT_FILE, self._feature_count)
+        np.save(directory / CLASS_COUNT_FILE, self._class_count)
+
+        metadata = {"version": MODEL_FORMAT_VERSION, "classes": self.classes, "alpha": self.alpha}
+        (directory / METADATA_FILE).write_text(json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True) -> "NaiveBayesClassifier":
+        """
+        Carrega um modelo gravado com `save`.
+
+        Args:
+            directory (str | Path): Diretório do modelo.
+            mmap (bool, optional): Abre as matrizes com memory-map (somente leitura) em vez de lê-las inteiras.
+
+        Returns:
+            NaiveBayesClassifier: Modelo pronto para predição; `partial_fit` continua o treino
+                a partir das contagens gravadas (copiando-as para a memória).
+
+        Raises:
+            FileNotFoundError: Se algum arquivo do modelo estiver ausente.
+            ValueError: Se o modelo tiver sido gravado em outra versão do formato.
+        """
+
+        directory = Path(directory)
+        metadata = json.loads((directory / METADATA_FILE).read_text(encoding="utf-8"))
+
+        if metadata.get("version") != MODEL_FORMAT_VERSION:
+            raise ValueError(f"Versão de modelo não suportada: {metadata.get('version')!r} (esperada {MODEL_FORMAT_VERSION}).")
+
+        mmap_mode: Literal["r"] | None = "r" if mmap else None
+
+        model = cls(metadata["classes"], metadata["alpha"])
+        model._feature_count = np.load(directory / FEATURE_COUNT_FILE, mmap_mode=mmap_mode)
+        model._class_count = np.load(directory / CLASS_COUNT_FILE, mmap_mode=mmap_mode)
+        model._feature_log_prob = np.load(directory / FEATURE_LOG_PROB_FILE, mmap_mode=mmap_mode)
+        model._class_log_prior = np.load(directory / CLASS_LOG_PRIOR_FILE, mmap_mode=mmap_mode)
+
+        return model
+
+    def _encode_labels(self, labels: Iterable[str]) -> np.ndarray:
+        """
+        Converte rótulos em índices de classe, registrando as classes novas.
+
+        Args:
+            labels (Iterable[str]): Rótulos dos documentos.
+
+        Returns:
+            np.ndarray: Índice (`int64`) da classe de cada rótulo.
+        """
+
+        index = {label: i for i, label in enumerate(self.classes)}
+        encoded: list[int] = []
+
+        for label in labels:
+            if label not in index:
+                index[label] = len(self.classes)
+                self.classes.append(label)
+
+            encoded.append(index[label])
+
+        return np.asarray(encoded, dtype=np.int64)
+
+    def _reserve(self, n_classes: int, n_features: int) -> None:
+        """
+        Amplia as matrizes de contagem para comportar novas classes e colunas.
+
+        Matrizes somente leitura (abertas com memory-map por `load`) são copiadas para a memória.
+
+        Args:
+            n_classes (int): Quantidade mínima de classes.
+            n_features (int): Quantidade mínima de colunas.
+        """
+
+        current_classes, current_features = self._feature_count.shape
+
+        if n_classes <= current_classes and n_features <= current_features:
+            if not self._feature_count.flags.writeable:
+                self._feature_count = np.array(self._feature_count)
+                self._class_count = np.array(self._class_count)
+
+            return
+
+        grown = np.zeros((max(n_classes, current_classes), max(n_features, current_features)), dtype=np.float64)
+        grown[:current_classes, :current_features] = self._feature_count
+        self._feature_count = grown
+
+        self._class_count = np.concatenate([self._class_count, np.zeros(grown.shape[0] - current_classes)])
+
+
+class PolarityClassifier:
+    """
+    Classificador de polaridade de documentos tokenizados: `Vocabulary` + `NaiveBayesClassifier`.
+
+    Recebe diretamente as listas de tokens de `preprocess_text` (ou a coluna ``texto_treino_ml``
+    dividida por espaços), tanto no treino incremental quanto na predição em lote.
+
+    Attributes:
+        vocabulary (Vocabulary): Colunas da matriz bag-of-words.
+        model (NaiveBayesClassifier): Modelo treinado sobre as contagens.
+    """
+
+    def __init__(self, vocabulary: Optional[Vocabulary] = None, model: Optional[NaiveBayesClassifier] = None):
+        """
+        Cria o classificador.
+
+        Args:
+            vocabulary (Optional[Vocabulary], optional): Vocabulário inicial; se `None`, vazio.
+            model (Optional[NaiveBayesClassifier], optional): Modelo inicial; se `None`, sem treino.
+        """
+
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.model = model if model is not None else NaiveBayesClassifier()
+
+    @property
+    def classes(self) -> list[str]:
+        """Rótulos conhecidos pelo modelo."""
+
+        return self.model.classes
+
+    def partial_fit(self, documents: Iterable[Sequence[str]], labels: Sequence[str]) -> "PolarityClassifier":
+        """
+        Acumula um lote de documentos rotulados, ampliando o vocabulário com os termos novos.
+
+        Args:
+            documents (Iterable[Sequence[str]]): Tokens de cada documento.
+            labels (Sequence[str]): Rótulo de cada documento.
+
+        Returns:
+            PolarityClassifier: O próprio classificador.
+        """
+
+        self.model.partial_fit(self.vocabulary.transform(documents, grow=True), labels)
+
+        return self
+
+    def predict_proba(self, documents: Iterable[Sequence[str]]) -> np.ndarray:
+        """
+        Calcula a probabilidade de cada classe (colunas na ordem de `classes`) para um lote.
+
+        Args:
+            documents (Iterable[Sequence[str]]): Tokens de cada documento.
+
+        Returns:
+            np.ndarray: Matriz ``(documentos, classes)``.
+        """
+
+        return self.model.predict_proba(self.vocabulary.transform(documents))
+
+    def predict(self, documents: Iterable[Sequence[str]]) -> list[str]:
+        """
+        Prediz o rótulo de cada documento de um lote.
+
+        Args:
+            documents (Iterable[Sequence[str]]): Tokens de cada documento.
+
+        Returns:
+            list[str]: Rótulo predito de cada documento, na ordem de entrada.
+        """
+
+        return [self.classes[i] for i in self.model.predict(self.vocabulary.transform(documents))]
+
+    def save(self, directory: str | Path) -> None:
+        """
+        Grava o modelo (`NaiveBayesClassifier.save`) e o vocabulário em um diretório.
+
+        Args:
+            directory (str | Path): Diretório de destino.
+        """
+
+        self.model.save(directory)
+        self.vocabulary.save(Path(directory) / VOCABULARY_FILE)
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True) -> "PolarityClassifier":
+        """
+        Carrega um classificador gravado com `save`.
+
+        Args:
+            directory (str | Path): Diretório do modelo.
+            mmap (bool, optional): Abre as matrizes com memory-map (somente leitura) em vez de lê-las inteiras.
+
+        Returns:
+            PolarityClassifier: Classificador pronto para predição ou para continuar o treino.
+
+        Raises:
+            FileNotFoundError: Se algum arquivo do modelo estiver ausente.
+            ValueError: Se o modelo tiver sido gravado em outra versão do formato.
+        """
+
+        return cls(Vocabulary.load(Path(directory) / VOCABULARY_FILE), NaiveBayesClassifier.load(directory, mmap))
+
+    def __repr__(self) -> str:
+        return f"PolarityClassifier(classes={self.classes}, vocabulary={self.vocabulary!r})"
@@ -0,0 +1,227 @@
+"""Léxico de polaridade do português codificado em ids inteiros para a pontuação vetorizada."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+from unidecode import unidecode
+
+UNKNOWN_ID = 0
+"""Id reservado aos tokens ausentes do léxico (polaridade nula)."""
+
+NEGATOR_ID = 1
+"""Id reservado aos negadores, que invertem a polaridade dos tokens seguintes."""
+
+BOUNDARY_ID = 2
+"""Id reservado ao fim de frase (`SENTENCE_BOUNDARY`), que encerra o alcance de um negador."""
+
+SENTENCE_BOUNDARY = "."
+"""Token que marca o fim de uma frase na saída de `tokenize`."""
+
+NEGATION_WORDS = frozenset("nao nunca sem nem jamais nenhum nenhuma ninguem".split())
+"""Negadores reconhecidos, sem acentos. Devem ser preservados no pré-processamento (`keep` de `load_stopwords`)."""
+
+_SEED_LEXICON = """
+2: adorar adoro adora amar amo ama amei amado amada apaixonado apaixonada excelente maravilhoso maravilhosa incrivel
+2: perfeito perfeita fantastico fantastica felicidade alegria encantado encantada sensacional lindo linda espetacular
+1: feliz felizes alegre alegres amor amoroso amorosa amizade amigo amiga carinho carinhoso carinhosa gostar gosto gostei
+1: bom boa bons boas otimo otima legal bonito bonita belo bela agradavel agradecer agradecido agradecida grato grata
+1: gratidao esperanca esperancoso calma calmo tranquilo tranquila paz sucesso vitoria vencer conquista conquistar
+1: orgulho orgulhoso orgulhosa animado animada empolgado empolgada divertido divertida diversao sorrir sorriso rir
+1: melhor melhorar apoio apoiar ajudar ajuda confianca confiar seguro segura saudavel forte aprovar aprovado aprovada
+1: satisfeito satisfeita contente aliviado aliviada alivio sonho realizar realizado realizada beleza fofo fofa querido
+1: querida acolher acolhido acolhida autoestima motivado motivada motivacao prazer paixao abraco abracar elogio elogiar
+1: recomendar recomendo valeu obrigado obrigada parabens celebrar comemorar festa ganhar incrivelmente
+-1: triste tristes tristeza chorar choro chorei sozinho sozinha solidao medo ansioso ansiosa ansiedade preocupado
+-1: preocupada preocupacao ruim ruins mau ma mal problema dificil cansado cansada cansaco raiva irritado irritada
+-1: chato chata chatear chateado chateada magoado magoada magoa decepcao decepcionado decepcionada frustrado frustrada
+-1: frustracao culpa culpado culpada vergonha sofrer sofrimento dor doer doente perder perdido perdida perda errar erro
+-1: fracasso fracassar falhar falha pior piorar briga brigar perigo perigoso perigosa estresse estressado estressada
+-1: infeliz infelizmente vazio vazia desanimado desanimada desistir inseguro insegura inseguranca abandonar
+-1: abandonado abandonada rejeitar rejeitado rejeitada rejeicao feio feia injusto injusta mentira mentir incomodar
+-1: incomodo ignorar ignorado ignorada machucar ferir ferido ferida golpe agressivo agressiva crise morrer morte
+-2: odiar odeio odeia odiei odeiar odio horrivel pessimo pessima terrivel depressao deprimido deprimida desespero
+-2: desesperado desesperada suicidio matar nojo nojento nojenta merda lixo detestar detesto insuportavel miseravel
+-2: humilhado humilhada humilhacao traumatizado trauma abuso abusivo abusiva angustia angustiado angustiada panico
+"""
+"""Léxico semente embutido: ``peso: palavras`` por linha, em lemas sem acentos e formas flexionadas frequentes."""
+
+
+def _parse_seed(seed: str) -> dict[str, float]:
+    """
+    Interpreta o léxico semente no formato ``peso: palavras``.
+
+    Args:
+        seed (str): Texto do léxico, uma faixa de peso por linha.
+
+    Returns:
+        dict[str, float]: Polaridade de cada palavra.
+    """
+
+    polarities: dict[str, float] = {}
+
+    for line in seed.strip().splitlines():
+        weight, words = line.split(":", 1)
+
+        for word in words.split():
+            polarities[word] = float(weight)
+
+    return polarities
+
+
+def normalize_term(term: str) -> str:
+    """
+    Normaliza um termo do léxico ou token de entrada: minúsculas, sem acentos e sem espaços nas bordas.
+
+    Args:
+        term (str): Termo bruto.
+
+    Returns:
+        str: Termo no mesmo formato dos lemas de `preprocess_text`.
+    """
+
+    return unidecode(term).lower().strip()
+
+
+class Lexicon:
+    """
+    Léxico de polaridade com vocabulário mapeado para ids inteiros contíguos.
+
+    Cada palavra recebe um id e sua polaridade fica em `weights[id]`, de modo que um lote
+    inteiro de tokens é pontuado com uma indexação NumPy (`weights[ids]`), sem dicionários
+    no laço interno. Os ids `UNKNOWN_ID`, `NEGATOR_ID` e `BOUNDARY_ID` são reservados, todos com peso zero.
+
+    Attributes:
+        vocabulary (dict[str, int]): Id de cada termo conhecido (palavras polarizadas e negadores).
+        weights (np.ndarray): Polaridade (`float32`) indexada pelo id.
+
+    Observações:
+        - Os termos são normalizados sem acentos e em minúsculas, como os lemas de `preprocess_text`.
+        - Termos com espaços (expressões) são descartados: a pontuação é feita token a token.
+    """
+
+    def __init__(self, polarities: Mapping[str, float], negators: Iterable[str] = NEGATION_WORDS):
+        """
+        Codifica o léxico.
+
+        Args:
+            polarities (Mapping[str, float]): Polaridade de cada termo; termos de peso zero são ignorados.
+            negators (Iterable[str], optional): Termos que invertem a polaridade dos tokens seguintes.
+        """
+
+        self.vocabulary: dict[str, int] = {SENTENCE_BOUNDARY: BOUNDARY_ID}
+        weights: list[float] = [0.0, 0.0, 0.0]
+
+        for term in negators:
+            self.vocabulary[normalize_term(term)] = NEGATOR_ID
+
+        for term, polarity in polarities.items():
+            term = normalize_term(term)
+
+            if not term or " " in term or not polarity or term in self.vocabulary:
+                continue
+
+            self.vocabulary[term] = len(weights)
+            weights.append(float(polarity))
+
+        self.weights = np.asarray(weights, dtype=np.float32)
+
+    @classmethod
+    def default(cls) -> "Lexicon":
+        """
+        Cria o léxico semente embutido no pacote.
+
+        Returns:
+            Lexicon: Léxico com as palavras de `_SEED_LEXICON` e os negadores de `NEGATION_WORDS`.
+        """
+
+        return cls(_parse_seed(_SEED_LEXICON))
+
+    @classmethod
+    def from_file(cls, path: str | Path, negators: Iterable[str] = NEGATION_WORDS) -> "Lexicon":
+        """
+        Carrega um léxico externo em CSV.
+
+        Aceita o formato do OpLexicon (``termo,classe,polaridade[,anotação]``) ou duas colunas
+        (``termo,polaridade``). Linhas cuja polaridade não é numérica (ex.: cabeçalho) são ignoradas;
+        termos repetidos mantêm a primeira ocorrência.
+
+        Args:
+            path (str | Path): Caminho do arquivo CSV (UTF-8).
+            negators (Iterable[str], optional): Termos que invertem a polaridade dos tokens seguintes.
+
+        Returns:
+            Lexicon: Léxico codificado.
+        """
+
+        polarities: dict[str, float] = {}
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                if len(row) < 2:
+                    continue
+
+                try:
+                    polarity = float(row[2] if len(row) >= 3 else row[1])
+                except ValueError:
+                    continue
+
+                polarities.setdefault(row[0], polarity)
+
+        return cls(polarities, negators)
+
+    def encode(self, tokens: Sequence[str]) -> np.ndarray:
+        """
+        Converte uma sequência plana de tokens em ids do léxico.
+
+        Os tokens são fatorados com `pd.factorize` (tabela hash em C) e apenas os valores distintos
+        são consultados no vocabulário, de modo que o custo em Python depende do vocabulário do lote,
+        e não da quantidade de tokens. Tokens distintos com acentos ou maiúsculas ausentes do
+        vocabulário são normalizados com `normalize_term` antes de uma segunda consulta.
+
+        Args:
+            tokens (Sequence[str]): Tokens do lote, documento após documento.
+
+        Returns:
+            np.ndarray: Id (`int32`) de cada token; `UNKNOWN_ID` para os ausentes do léxico.
+        """
+
+        if len(tokens) == 0:
+            return np.zeros(0, dtype=np.int32)
+
+        codes, uniques = pd.factorize(np.asarray(tokens, dtype=object))
+        ids = np.fromiter(map(self._lookup, uniques), dtype=np.int32, count=len(uniques))
+
+        return ids[codes]
+
+    def _lookup(self, term: str) -> int:
+        """
+        Consulta o id de um token, normalizando-o apenas se a forma recebida não constar no vocabulário.
+
+        Args:
+            term (str): Token a consultar.
+
+        Returns:
+            int: Id do token, ou `UNKNOWN_ID`.
+        """
+
+        token_id = self.vocabulary.get(term)
+
+        if token_id is None:
+            normalized = normalize_term(term)
+            token_id = self.vocabulary.get(normalized, UNKNOWN_ID) if normalized != term else UNKNOWN_ID
+
+        return token_id
+
+    def __contains__(self, term: object) -> bool:
+        return term in self.vocabulary
+
+    def __len__(self) -> int:
+        return len(self.weights) - 3
+
+    def __repr__(self) -> str:
+        return f"Lexicon(terms={len(self)}, negators={sum(i == NEGATOR_ID for i in self.vocabulary.values())})"
@@ -0,0 +1,230 @@
+"""Pontuação de sentimento em lote: tokens codificados pelo léxico e agregados com NumPy."""
+
+from __future__ import annotations
+
+import re
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from sa.logger import NULL_TIMER
+
+from .lexicon import BOUNDARY_ID, NEGATOR_ID, SENTENCE_BOUNDARY, Lexicon
+
+if TYPE_CHECKING:
+    from sa.logger import StageTimer
+
+DEFAULT_NEGATION_WINDOW = 3
+"""Quantidade padrão de tokens, após um negador, cuja polaridade é invertida."""
+
+DEFAULT_NEGATION_FACTOR = -1.0
+"""Fator padrão aplicado à polaridade dos tokens negados (``-1`` inverte o sinal)."""
+
+DEFAULT_SCORE_BATCH_SIZE = 20_000
+"""Quantidade padrão de documentos codificados e pontuados de cada vez, limitando o pico de memória."""
+
+SENTIMENT_COLUMN = "sentiment"
+"""Coluna acrescentada às exportações de posts com a pontuação de sentimento."""
+
+DEFAULT_TEXT_COLUMNS = ("title", "content")
+"""Colunas de um `PostRecord` concatenadas para pontuar cada post."""
+
+TOKEN_PATTERN = re.compile(r"([^\W\d_]+)|[.!?;]+")
+"""Palavras de um texto bruto (sequências de letras, acentuadas ou não), capturadas, e as pontuações de fim de frase."""
+
+
+class SentimentScores(NamedTuple):
+    """
+    Pontuações de um lote de documentos, alinhadas à ordem de entrada.
+
+    Attributes:
+        score (np.ndarray): Polaridade média (`float32`) dos tokens polarizados de cada documento;
+            com o léxico semente, fica em ``[-2, 2]``. ``0`` para documentos sem tokens do léxico.
+        total (np.ndarray): Soma (`float32`) das polaridades, já com a negação aplicada.
+        hits (np.ndarray): Quantidade (`int32`) de tokens polarizados em cada documento.
+    """
+
+    score: np.ndarray
+    total: np.ndarray
+    hits: np.ndarray
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Divide um texto bruto ou normalizado em palavras minúsculas.
+
+    Os acentos são preservados: `Lexicon.encode` os remove apenas dos tokens distintos
+    ausentes do vocabulário, em vez de percorrer o texto inteiro com `unidecode`. Cada sequência
+    de ``.``, ``!``, ``?`` ou ``;`` vira um `SENTENCE_BOUNDARY`, que encerra o alcance da negação.
+
+    Args:
+        text (str): Texto a tokenizar (ex.: saída de `normalize_text`).
+
+    Returns:
+        list[str]: Palavras do texto e marcadores de fim de frase, na ordem original.
+    """
+
+    return [word or SENTENCE_BOUNDARY for word in TOKEN_PATTERN.findall(str(text).lower())]
+
+
+class SentimentScorer:
+    """
+    Pontuador de sentimento por léxico, vetorizado sobre lotes inteiros de documentos.
+
+    O lote é achatado em um único vetor de ids (`Lexicon.encode`) e toda a pontuação,
+    inclusive a negação, é feita com operações NumPy sobre esse vetor:
+
+    - a polaridade de cada token é `weights[ids]`;
+    - a posição do último negador antes de cada token sai de um `np.maximum.accumulate`; o token é
+      negado se esse negador estiver no mesmo documento e na mesma frase (sem `SENTENCE_BOUNDARY`
+      entre eles) e a até `negation_window` posições;
+    - as somas por documento saem de `np.bincount` ponderado pelo índice do documento.
+
+    Observações:
+        - Aceita tanto listas de tokens de `preprocess_text` quanto textos brutos (`score_texts`).
+          Com tokens pré-processados, os negadores precisam ser preservados das stopwords
+          (``load_stopwords(keep=NEGATION_WORDS)``), ou a negação não terá efeito.
+        - Só textos brutos têm fins de frase; nos tokens pré-processados, sem pontuação, a
+          negação alcança a janela inteira.
+        - Textos brutos são comparados pela forma de superfície; o léxico semente inclui as
+          flexões mais frequentes, mas léxicos só de lemas casam menos palavras nesse modo.
+        - É seguro para uso entre threads: o estado é somente leitura após a construção.
+    """
+
+    def __init__(
+        self,
+        lexicon: Optional[Lexicon] = None,
+        negation_window: int = DEFAULT_NEGATION_WINDOW,
+        negation_factor: float = DEFAULT_NEGATION_FACTOR,
+        batch_size: int = DEFAULT_SCORE_BATCH_SIZE,
+    ):
+        """
+        Configura o pontuador.
+
+        Args:
+            lexicon (Optional[Lexicon], optional): Léxico de polaridade; se `None`, `Lexicon.default()`.
+            negation_window (int, optional): Tokens após um negador afetados pela negação (``0`` desativa).
+            negation_factor (float, optional): Fator aplicado à polaridade dos tokens negados.
+            batch_size (int, optional): Documentos codificados e pontuados de cada vez.
+
+        Raises:
+            ValueError: Se `negation_window` for negativo ou `batch_size` for menor que 1.
+        """
+
+        if negation_window < 0:
+            raise ValueError("A janela de negação deve ser maior ou igual a 0.")
+
+        if batch_size < 1:
+            raise ValueError("O tamanho do lote de pontuação deve ser maior ou igual a 1.")
+
+        self.lexicon = lexicon if lexicon is not None else Lexicon.default()
+        self.negation_window = negation_window
+        self.negation_factor = np.float32(negation_factor)
+        self.batch_size = batch_size
+
+    def score_tokens(self, documents: Iterable[Sequence[str]]) -> SentimentScores:
+        """
+        Pontua documentos já tokenizados, em lotes de `batch_size`.
+
+        Args:
+            documents (Iterable[Sequence[str]]): Tokens de cada documento (ex.: saída de `preprocess_texts`).
+                Pode ser um gerador: apenas um lote é mantido em memória por vez.
+
+        Returns:
+            SentimentScores: Pontuações de cada documento, na ordem de entrada.
+        """
+
+        iterator = iter(documents)
+        parts: list[SentimentScores] = []
+
+        while batch := list(islice(iterator, self.batch_size)):
+            lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+            ids = self.lexicon.encode(list(chain.from_iterable(batch)))
+            parts.append(self._score_ids(ids, lengths))
+
+        if not parts:
+            return self._score_ids(np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int64))
+
+        return SentimentScores(*(np.concatenate(arrays) for arrays in zip(*parts)))
+
+    def score_texts(self, texts: Iterable[str]) -> SentimentScores:
+        """
+        Pontua um lote de textos brutos ou normalizados, tokenizados com `tokenize`.
+
+        Args:
+            texts (Iterable[str]): Textos de cada documento.
+
+        Returns:
+            SentimentScores: Pontuações de cada documento, na ordem de entrada.
+        """
+
+        return self.score_tokens(map(tokenize, texts))
+
+    def score_frame(
+        self,
+        df: pd.DataFrame,
+        columns: Sequence[str] = DEFAULT_TEXT_COLUMNS,
+        timer: "StageTimer" = NULL_TIMER,
+    ) -> pd.Series:
+        """
+        Pontua cada linha de um `DataFrame` de posts, concatenando as colunas de texto.
+
+        Args:
+            df (pd.DataFrame): Posts (ex.: um bloco de `PostRecord`).
+            columns (Sequence[str], optional): Colunas de texto pontuadas; as ausentes do `df` são ignoradas.
+            timer (StageTimer, optional): Temporizador onde a pontuação é medida como etapa ``sentiment``.
+
+        Returns:
+            pd.Series: Coluna `SENTIMENT_COLUMN` com a pontuação de cada linha, no índice do `df`.
+        """
+
+        present = [column for column in columns if column in df.columns]
+        texts = df[present].fillna("").astype(str).agg(" ".join, axis=1) if present else pd.Series("", index=df.index)
+
+        with timer.stage("sentiment", items=len(df)):
+            scores = self.score_texts(texts)
+
+        return pd.Series(scores.score, index=df.index, name=SENTIMENT_COLUMN)
+
+    def _score_ids(self, ids: np.ndarray, lengths: np.ndarray) -> SentimentScores:
+        """
+        Agrega as polaridades de um lote codificado por documento, aplicando a negação.
+
+        Args:
+            ids (np.ndarray): Ids de todos os tokens do lote, documento após documento.
+            lengths (np.ndarray): Quantidade de tokens de cada documento.
+
+        Returns:
+            SentimentScores: Pontuações de cada documento.
+        """
+
+        documents = len(lengths)
+        doc_index = np.repeat(np.arange(documents), lengths)
+        weights = self.lexicon.weights[ids]
+        polarity = weights
+
+        if self.negation_window and len(ids):
+            positions = np.arange(len(ids))
+            doc_start = np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+            # Posição do último negador estritamente anterior a cada token (-1 se nenhum)
+            last_negator = np.maximum.accumulate(np.where(ids == NEGATOR_ID, positions, -1))
+            last_negator = np.concatenate(([-1], last_negator[:-1]))
+
+            # Um fim de frase depois do negador encerra seu alcance
+            last_boundary = np.maximum.accumulate(np.where(ids == BOUNDARY_ID, positions, -1))
+            scope_start = np.maximum(doc_start, last_boundary + 1)
+
+            negated = (last_negator >= scope_start) & (positions - last_negator <= self.negation_window)
+            polarity = np.where(negated, polarity * self.negation_factor, polarity)
+
+        total = np.bincount(doc_index, weights=polarity, minlength=documents).astype(np.float32)
+        hits = np.bincount(doc_index, weights=weights != 0, minlength=documents).astype(np.int32)
+        score = np.divide(total, hits, out=np.zeros(documents, dtype=np.float32), where=hits > 0)
+
+        return SentimentScores(score, total, hits)
+
+    def __repr__(self) -> str:
+        return f"SentimentScorer(lexicon={self.lexicon!r}, negation_window={self.negation_window}, negation_factor={self.negation_factor})"
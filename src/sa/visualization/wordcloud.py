@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Mapping
 
 from wordcloud import WordCloud  # type: ignore[import-untyped]
 
@@ -20,7 +21,7 @@ DEFAULT_BACKGROUND = "white"
 
 
 def generate_wordcloud(
-    text: str,
+    text: str | Mapping[str, int],
     output_path: Path,
     *,
     width: int = DEFAULT_WIDTH,
@@ -37,7 +38,8 @@ def generate_wordcloud(
     o que for secundário. No fim o transborda de memórias pros bytes do filesystem explicitamente.
 
     Args:
-        text (str): Grande texto base iterável limpo unificado e distanciado unicamente de espaços e não arrays em lista.
+        text (str | Mapping[str, int]): Grande texto base iterável limpo unificado e distanciado unicamente de espaços e não arrays em lista,
+            ou a frequência já contada de cada termo (ex.: `NGramCounter.frequencies`), usada diretamente sem retokenizar texto algum.
         output_path (Path): Path seguro estipulado da emissão em PNG para salvamento disco na infra.
         width (int, optional): Ocupação canvas lateral configurada a lib de plotagem Wordcloud.
         height (int, optional): Ocupação canvas vertical em base configurada sobre a classe instanciadora lib.
@@ -52,5 +54,8 @@ def generate_wordcloud(
         colormap=colormap,
     )
 
-    wc.generate(text)
+    if isinstance(text, str):
+        wc.generate(text)
+    else:
+        wc.generate_from_frequencies(text)
     wc.to_file(str(output_path))
@@ -0,0 +1,87 @@
+"""Dublês compartilhados pelos testes: cliente Reddit falso e relógio controlável."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Iterator
+
+import pytest
+
+LISTING_WORDS = ["praia", "serra", "cidade", "campo", "rio", "mar", "sol", "lua", "casa", "rua", "feira", "festa"]
+"""Palavras que distinguem os corpos de `make_listing` (a normalização descarta dígitos)."""
+
+
+def make_submission(post_id: str, title: str = "", selftext: str = "", subreddit: str = "brasil", created_utc: float = 0.0) -> SimpleNamespace:
+    """Cria uma submissão com os atributos de `praw.models.Submission` lidos pelo coletor."""
+
+    return SimpleNamespace(id=post_id, title=title, selftext=selftext, author="autor", created_utc=created_utc, subreddit=subreddit)
+
+
+def make_listing(prefix: str, newest: int, count: int) -> list[SimpleNamespace]:
+    """Submissões em português com corpos distintos, da mais nova (``created_utc=newest``) para a mais antiga, como em ``sort="new"``."""
+
+    return [
+        make_submission(
+            f"{prefix}{created}",
+            title="amor",
+            selftext=f"eu amo muito esse lugar, é maravilhoso: {LISTING_WORDS[created % 12]} e {LISTING_WORDS[created // 12 % 12]}",
+            created_utc=float(created),
+        )
+        for created in range(newest, newest - count, -1)
+    ]
+
+
+class FakeSubreddit:
+    """Subreddit que responde a qualquer busca com as submissões cadastradas para a consulta."""
+
+    def __init__(self, display_name: str, results: dict[str, list[SimpleNamespace]]):
+        self.display_name = display_name
+        self.results = results
+        self.searches: list[tuple[str, dict[str, Any]]] = []
+
+    def search(self, query: str, **generator_kwargs: Any) -> Iterator[SimpleNamespace]:
+        self.searches.append((query, generator_kwargs))
+        limit = generator_kwargs.get("limit")
+
+        yield from self.results.get(query, [])[:limit]
+
+
+class FakeRedditClient:
+    """Cliente Reddit local, sem rede nem credenciais, com a superfície de `RedditClientProtocol`."""
+
+    def __init__(self, results: dict[str, list[SimpleNamespace]] | None = None):
+        self.results = results if results is not None else {}
+        self.subreddits: dict[str, FakeSubreddit] = {}
+
+    def subreddit(self, display_name: str) -> FakeSubreddit:
+        return self.subreddits.setdefault(display_name, FakeSubreddit(display_name, self.results))
+
+
+class FakeClock:
+    """Relógio monotônico que só avança quando o teste manda."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_client() -> FakeRedditClient:
+    """Cliente com 250 submissões para ``amor`` e 3 para ``odio``."""
+
+    return FakeRedditClient(
+        {
+            "amor": [make_submission(f"a{i}", title=f"amor {i}", created_utc=float(i)) for i in range(250)],
+            "odio": [make_submission(f"o{i}", title=f"odio {i}", selftext="corpo", created_utc=float(i)) for i in range(3)],
+        }
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
@@ -0,0 +1,119 @@
+"""Testes da gravação e reprodução de buscas em cassete."""
+
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+from conftest import FakeRedditClient, make_submission
+
+from sa.client import RecordingRedditClient, ReplayRedditClient
+from sa.client.cassette import dump_submission
+from sa.collector import RedditCollector, WatermarkStore
+from sa.model import Language, Polarity
+
+
+def test_record_then_replay_round_trip(fake_client, tmp_path):
+    path = tmp_path / "cassetes" / "coleta.jsonl"
+    recorder = RecordingRedditClient(fake_client, path)
+
+    recorded = list(recorder.subreddit("brasil").search("odio", sort="new", limit=10))
+
+    assert recorder.recorded == 1
+
+    replay = ReplayRedditClient(path)
+    replayed = list(replay.subreddit("brasil").search("odio", sort="new", limit=10))
+
+    assert len(replay) == 1
+    assert [dump_submission(post) for post in replayed] == [dump_submission(post) for post in recorded]
+    assert str(replayed[0].subreddit) == "brasil"
+
+
+def test_replay_serves_smaller_limits(fake_client, tmp_path):
+    path = tmp_path / "coleta.jsonl"
+    list(RecordingRedditClient(fake_client, path).subreddit("brasil").search("amor", sort="new", limit=200))
+
+    replay = ReplayRedditClient(path)
+
+    assert [post.id for post in replay.subreddit("brasil").search("amor", sort="new", limit=5)] == [f"a{i}" for i in range(5)]
+    assert len(list(replay.subreddit("brasil").search("amor", sort="new", limit=200))) == 200
+
+
+def test_interrupted_search_is_recorded_as_partial(fake_client, tmp_path):
+    path = tmp_path / "coleta.jsonl"
+    recorder = RecordingRedditClient(fake_client, path)
+
+    search = recorder.subreddit("brasil").search("amor", sort="new", limit=100)
+    list(islice(search, 3))
+    search.close()
+
+    replay = ReplayRedditClient(path)
+
+    assert len(list(replay.subreddit("brasil").search("amor", sort="new", limit=3))) == 3
+
+    with pytest.raises(KeyError):
+        list(replay.subreddit("brasil").search("amor", sort="new", limit=4))
+
+
+def test_complete_recording_wins_over_partial(fake_client, tmp_path):
+    path = tmp_path / "coleta.jsonl"
+    recorder = RecordingRedditClient(fake_client, path)
+
+    list(recorder.subreddit("brasil").search("odio", sort="new"))
+    search = recorder.subreddit("brasil").search("odio", sort="new")
+    next(search)
+    search.close()
+
+    replayed = list(ReplayRedditClient(path).subreddit("brasil").search("odio", sort="new"))
+
+    assert [post.id for post in replayed] == ["o0", "o1", "o2"]
+
+
+def test_missing_search_raises(fake_client, tmp_path):
+    path = tmp_path / "coleta.jsonl"
+    list(RecordingRedditClient(fake_client, path).subreddit("brasil").search("odio", sort="new"))
+
+    replay = ReplayRedditClient(path)
+
+    with pytest.raises(KeyError):
+        list(replay.subreddit("brasil").search("odio", sort="relevance"))
+
+    with pytest.raises(KeyError):
+        list(replay.subreddit("portugal").search("odio", sort="new"))
+
+
+def test_negative_latency_is_rejected(tmp_path):
+    path = tmp_path / "vazio.jsonl"
+    path.write_text("", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        ReplayRedditClient(path, latency=-1)
+
+
+def test_incremental_collection_replays_from_the_same_watermarks(tmp_path):
+    bodies = ["eu amo a praia no verão", "que lugar maravilhoso para viver", "amo muito a minha cidade", "a serra é linda demais"]
+    client = FakeRedditClient(
+        {"amor": [make_submission(f"p{i}", title="amor", selftext=bodies[i - 1], created_utc=float(i)) for i in range(4, 0, -1)]}
+    )
+    keywords = {Polarity.POSITIVE: ["amor"]}
+
+    marks = WatermarkStore(tmp_path / "marcas.json")
+    marks.update("brasil", "amor", 2.0)
+    marks.save()
+
+    before = tmp_path / "marcas-antes.json"
+    before.write_text((tmp_path / "marcas.json").read_text(encoding="utf-8"), encoding="utf-8")
+
+    path = tmp_path / "coleta.jsonl"
+    recorder = RedditCollector(RecordingRedditClient(client, path), "brasil", watermarks=WatermarkStore(tmp_path / "marcas.json"))
+    recorded = [post["post_id"] for post in recorder.collect(keywords, Language.PT, 100)]
+
+    assert recorded == ["p4", "p3"]
+
+    # A busca gravada parou na marca d'água: com as mesmas marcas, a reprodução para no mesmo ponto
+    replayer = RedditCollector(ReplayRedditClient(path), "brasil", watermarks=WatermarkStore(before))
+
+    assert [post["post_id"] for post in replayer.collect(keywords, Language.PT, 100)] == recorded
+
+    with pytest.raises(KeyError):
+        list(RedditCollector(ReplayRedditClient(path), "brasil").collect(keywords, Language.PT, 100))
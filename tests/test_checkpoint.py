@@ -0,0 +1,95 @@
+"""Testes do journal de checkpoint e da retomada de uma coleta interrompida."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import FakeRedditClient, make_listing
+
+from sa.collector import CollectionJournal, ConcurrentRedditCollector
+from sa.model import Language, Polarity
+
+KEYWORDS = {Polarity.POSITIVE: ["amor"]}
+
+
+class FlakyRedditClient(FakeRedditClient):
+    """Cliente cuja busca cai por erro de rede depois de entregar `fail_after` submissões."""
+
+    def __init__(self, results, fail_after: int):
+        super().__init__(results)
+        self.fail_after = fail_after
+
+    def subreddit(self, display_name):
+        subreddit = super().subreddit(display_name)
+        search = subreddit.search
+
+        def flaky_search(query, **generator_kwargs):
+            for index, post in enumerate(search(query, **generator_kwargs)):
+                if index == self.fail_after:
+                    raise ConnectionError("conexão perdida")
+
+                yield post
+
+        subreddit.search = flaky_search
+
+        return subreddit
+
+
+def collect_ids(client, journal) -> list[str]:
+    collector = ConcurrentRedditCollector(client, ["brasil"], max_workers=1, journal=journal)
+
+    return [post["post_id"] for post in collector.collect(KEYWORDS, Language.PT, 100)]
+
+
+def test_resume_replays_journal_and_finishes_the_unit(tmp_path):
+    results = {"amor": make_listing("p", 20, 8)}
+    path = tmp_path / "coleta.journal"
+
+    with pytest.raises(ConnectionError):
+        with CollectionJournal(path) as journal:
+            collect_ids(FlakyRedditClient(results, fail_after=3), journal)
+
+    with CollectionJournal(path, resume=True) as journal:
+        assert journal.accepted_count("brasil") == 3
+        assert not journal.is_completed(("brasil", "positive", "amor"))
+
+        ids = collect_ids(FakeRedditClient(results), journal)
+
+        assert journal.is_completed(("brasil", "positive", "amor"))
+
+    # Os posts do journal vêm primeiro; os já registrados não são aceitos de novo na unidade refeita
+    assert ids == [f"p{created}" for created in range(20, 12, -1)]
+
+
+def test_completed_unit_is_not_searched_again(tmp_path):
+    client = FakeRedditClient({"amor": make_listing("p", 20, 4)})
+    path = tmp_path / "coleta.journal"
+
+    with CollectionJournal(path) as journal:
+        collect_ids(client, journal)
+
+    resumed = FakeRedditClient(client.results)
+
+    with CollectionJournal(path, resume=True) as journal:
+        assert len(collect_ids(resumed, journal)) == 4
+
+    assert resumed.subreddit("brasil").searches == []
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / "coleta.journal"
+
+    with CollectionJournal(path) as journal:
+        collect_ids(FakeRedditClient({"amor": make_listing("p", 20, 2)}), journal)
+
+    with path.open("a", encoding="utf-8") as file:
+        file.write('{"event": "post", "unit": ["brasil"')
+
+    assert [post["post_id"] for post in CollectionJournal(path, resume=True).replay()] == ["p20", "p19"]
+
+
+def test_existing_journal_requires_resume(tmp_path):
+    path = tmp_path / "coleta.journal"
+    path.write_text("", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        CollectionJournal(path)
@@ -0,0 +1,64 @@
+"""Testes de fumaça do classificador Naive Bayes e de sua persistência."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sa.nlp import CSRMatrix
+from sa.sentiment import NaiveBayesClassifier, PolarityClassifier
+
+
+def counts(rows: list[dict[int, int]], n_features: int) -> CSRMatrix:
+    ids = np.array([column for row in rows for column, count in row.items() for _ in range(count)], dtype=np.int64)
+    lengths = np.array([sum(row.values()) for row in rows], dtype=np.int64)
+
+    return CSRMatrix.from_ids(ids, lengths, n_features)
+
+
+def test_naive_bayes_save_load_round_trip(tmp_path):
+    train = counts([{0: 3, 1: 1}, {2: 2, 3: 1}, {0: 1, 4: 1}, {3: 2}], 5)
+    labels = ["positivo", "negativo", "positivo", "negativo"]
+    model = NaiveBayesClassifier(alpha=0.5).fit(train, labels)
+
+    test = counts([{0: 1}, {3: 1, 2: 1}, {}], 5)
+    expected = model.predict_proba(test)
+
+    model.save(tmp_path / "modelo")
+
+    for mmap in (True, False):
+        loaded = NaiveBayesClassifier.load(tmp_path / "modelo", mmap=mmap)
+
+        assert loaded.classes == model.classes
+        assert loaded.alpha == model.alpha
+        np.testing.assert_allclose(loaded.predict_proba(test), expected)
+        assert loaded.predict(test).tolist() == model.predict(test).tolist()
+
+    assert model.predict(test)[:2].tolist() == [0, 1]
+
+
+def test_loaded_model_keeps_training(tmp_path):
+    model = NaiveBayesClassifier().fit(counts([{0: 2}, {1: 2}], 2), ["positivo", "negativo"])
+    model.save(tmp_path / "modelo")
+
+    loaded = NaiveBayesClassifier.load(tmp_path / "modelo")
+    loaded.partial_fit(counts([{2: 3}], 3), ["neutro"])
+
+    assert loaded.classes == ["positivo", "negativo", "neutro"]
+    assert loaded.n_features == 3
+    assert loaded.predict(counts([{2: 1}], 3)).tolist() == [2]
+
+
+def test_polarity_classifier_round_trip(tmp_path):
+    classifier = PolarityClassifier()
+    classifier.partial_fit([["amar", "feliz"], ["odiar", "triste"], ["amar"]], ["positivo", "negativo", "positivo"])
+    classifier.save(tmp_path / "polaridade")
+
+    loaded = PolarityClassifier.load(tmp_path / "polaridade")
+
+    assert loaded.predict([["feliz"], ["triste", "odiar"], ["desconhecido", "amar"]]) == ["positivo", "negativo", "positivo"]
+
+
+def test_unfitted_classifier_raises():
+    with pytest.raises(ValueError):
+        NaiveBayesClassifier().predict(counts([{0: 1}], 1))
@@ -0,0 +1,71 @@
+"""Testes do `RedditCollector` com o cliente Reddit falso."""
+
+from __future__ import annotations
+
+from conftest import FakeRedditClient, make_listing, make_submission
+
+from sa.collector import RedditCollector, WatermarkStore
+from sa.model import Language, Polarity
+
+KEYWORDS = {Polarity.POSITIVE: ["amor"]}
+
+
+def collect_ids(collector: RedditCollector, total_per_word: int = 100) -> list[str]:
+    return [post["post_id"] for post in collector.collect(KEYWORDS, Language.PT, total_per_word)]
+
+
+def test_watermark_stops_search_and_advances(tmp_path):
+    client = FakeRedditClient({"amor": make_listing("p", 105, 5)})
+    watermarks = WatermarkStore(tmp_path / "marcas.json")
+
+    assert len(collect_ids(RedditCollector(client, "brasil", watermarks=watermarks))) == 5
+    assert watermarks.get("brasil", "amor") == 105
+
+    client.results["amor"] = make_listing("p", 108, 8)
+    collector = RedditCollector(client, "brasil", watermarks=watermarks)
+
+    assert collect_ids(collector) == ["p108", "p107", "p106"]
+    assert collector.stats.fetched == 3
+    assert watermarks.get("brasil", "amor") == 108
+
+
+def test_watermark_is_kept_when_limit_cuts_the_search(tmp_path):
+    client = FakeRedditClient({"amor": make_listing("p", 110, 10)})
+    watermarks = WatermarkStore(tmp_path / "marcas.json")
+    watermarks.update("brasil", "amor", 100.0)
+
+    # O limite corta a busca em 110..106: os posts 105..101 ficam entre a marca e o que foi visto
+    assert len(collect_ids(RedditCollector(client, "brasil", watermarks=watermarks), total_per_word=5)) == 5
+    assert watermarks.get("brasil", "amor") == 100
+
+    assert len(collect_ids(RedditCollector(client, "brasil", watermarks=watermarks), total_per_word=20)) == 10
+    assert watermarks.get("brasil", "amor") == 110
+
+
+def test_posts_already_evaluated_skip_the_nlp():
+    portuguese = make_submission("p1", title="amor", selftext="eu amo muito esse lugar, é maravilhoso")
+    english = make_submission("p2", title="amor", selftext="I really love this place, it is wonderful")
+    other = make_submission("p3", title="amor", selftext="que saudade da minha cidade natal")
+    copy = make_submission("p4", title=other.title, selftext=other.selftext)
+
+    client = FakeRedditClient({"amor": [portuguese, english, other], "odio": [portuguese, english, copy]})
+    collector = RedditCollector(client, "brasil")
+
+    ids = [post["post_id"] for post in collector.collect({Polarity.POSITIVE: ["amor"], Polarity.NEGATIVE: ["odio"]}, Language.PT, 100)]
+
+    assert ids == ["p1", "p3"]
+
+    # O post em inglês, rejeitado na primeira busca, não passa de novo pela detecção de idioma
+    assert collector.stats.as_dict() == {
+        "fetched": 6,
+        "skipped_indexed": 0,
+        "skipped_seen": 2,
+        "skipped_raw_duplicate": 1,
+        "unattributed": 0,
+        "normalized": 3,
+        "rejected_language": 1,
+        "rejected_duplicate": 0,
+        "rejected_near_duplicate": 0,
+        "accepted": 2,
+    }
+    assert collector.stats.skipped == 3
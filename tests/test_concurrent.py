@@ -0,0 +1,64 @@
+"""Testes da coleta concorrente de vários subreddits e da inicialização thread-safe do langdetect."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from conftest import FakeRedditClient, make_listing
+
+from sa.collector import ConcurrentRedditCollector, MemoryDedupIndex
+from sa.model import Language, Polarity
+from sa.nlp import language
+
+KEYWORDS = {Polarity.POSITIVE: ["amor"]}
+
+
+def test_shared_dedup_accepts_each_post_once():
+    # Todos os subreddits recebem as mesmas submissões
+    client = FakeRedditClient({"amor": make_listing("p", 20, 8)})
+    dedup_index = MemoryDedupIndex()
+    collector = ConcurrentRedditCollector(client, ["brasil", "portugal", "conversas"], max_workers=3, dedup_index=dedup_index)
+
+    ids = [post["post_id"] for post in collector.collect(KEYWORDS, Language.PT, 100)]
+
+    assert sorted(ids) == sorted(f"p{created}" for created in range(13, 21))
+    assert collector.stats.fetched == 24
+    assert collector.stats.accepted == 8
+    assert len(dedup_index) == 8
+
+
+def test_worker_error_is_raised_to_the_consumer():
+    class BrokenClient(FakeRedditClient):
+        def subreddit(self, display_name):
+            if display_name == "quebrado":
+                raise RuntimeError("falha de rede")
+
+            return super().subreddit(display_name)
+
+    collector = ConcurrentRedditCollector(BrokenClient({"amor": make_listing("p", 5, 5)}), ["brasil", "quebrado"], max_workers=2)
+
+    with pytest.raises(RuntimeError):
+        list(collector.collect(KEYWORDS, Language.PT, 100))
+
+
+def test_langdetect_profiles_are_loaded_once(monkeypatch):
+    calls: list[int] = []
+
+    def slow_init_factory() -> None:
+        time.sleep(0.05)
+        calls.append(1)
+
+    monkeypatch.setattr(language, "_LANGDETECT_READY", threading.Event())
+    monkeypatch.setattr(language, "init_factory", slow_init_factory)
+
+    threads = [threading.Thread(target=language._ensure_langdetect_profiles) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
@@ -0,0 +1,75 @@
+"""Testes dos índices de deduplicação em memória e em SQLite."""
+
+from __future__ import annotations
+
+from hashlib import md5
+
+import pytest
+from conftest import FakeRedditClient, make_listing
+
+from sa.collector import MemoryDedupIndex, RedditCollector, SQLiteDedupIndex
+from sa.model import Language, Polarity
+
+
+def digest(text: str) -> str:
+    return md5(text.encode()).hexdigest()
+
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def index(request, tmp_path):
+    if request.param == "memoria":
+        yield MemoryDedupIndex()
+    else:
+        with SQLiteDedupIndex(tmp_path / "dedup.sqlite3") as sqlite_index:
+            yield sqlite_index
+
+
+def test_index_rejects_repeated_content(index):
+    assert index.add("p1", digest("texto"))
+    assert index.contains_post("p1")
+    assert not index.contains_post("p2")
+
+    # Outro id com o mesmo conteúdo é duplicata, mas o id passa a ser conhecido
+    assert not index.add("p2", digest("texto"))
+    assert index.contains_post("p2")
+    assert len(index) == 1
+
+
+def test_sqlite_index_persists_between_sessions(tmp_path):
+    path = tmp_path / "dedup.sqlite3"
+
+    with SQLiteDedupIndex(path, commit_every=2) as index:
+        for i in range(5):
+            index.add(f"p{i}", digest(f"texto {i}"))
+
+    with SQLiteDedupIndex(path) as index:
+        assert len(index) == 5
+        assert index.contains_post("p4")
+        assert not index.add("p9", digest("texto 0"))
+
+
+def test_sqlite_index_discards_uncommitted_session(tmp_path):
+    path = tmp_path / "dedup.sqlite3"
+
+    index = SQLiteDedupIndex(path, commit_every=None)
+    index.add("p1", digest("texto"))
+    index.close(commit=False)
+
+    with SQLiteDedupIndex(path) as index:
+        assert len(index) == 0
+        assert not index.contains_post("p1")
+
+
+def test_collector_skips_posts_indexed_by_a_previous_run(tmp_path):
+    client = FakeRedditClient({"amor": make_listing("p", 10, 6)})
+    keywords = {Polarity.POSITIVE: ["amor"]}
+
+    with SQLiteDedupIndex(tmp_path / "dedup.sqlite3") as index:
+        assert len(list(RedditCollector(client, "brasil", dedup_index=index).collect(keywords, Language.PT, 100))) == 6
+
+    with SQLiteDedupIndex(tmp_path / "dedup.sqlite3") as index:
+        collector = RedditCollector(client, "brasil", dedup_index=index)
+
+        assert list(collector.collect(keywords, Language.PT, 100)) == []
+        assert collector.stats.skipped_indexed == 6
+        assert collector.stats.normalized == 0
@@ -0,0 +1,57 @@
+"""Testes de fumaça da matriz CSR e do `HashingVectorizer`."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from sa.nlp import CSRMatrix, HashingVectorizer
+
+
+def dense(matrix: CSRMatrix) -> np.ndarray:
+    result = np.zeros(matrix.shape, dtype=np.float32)
+    result[matrix.row_indices(), matrix.indices] = matrix.data
+
+    return result
+
+
+def test_csr_from_ids_keeps_document_boundaries():
+    ids = np.array([0, 0, 2, -1, 1, 2, 2], dtype=np.int64)
+    matrix = CSRMatrix.from_ids(ids, np.array([3, 0, 4]), n_features=3)
+
+    assert matrix.shape == (3, 3)
+    assert matrix.indptr.tolist() == [0, 2, 2, 4]
+    assert dense(matrix).tolist() == [[2, 0, 1], [0, 0, 0], [0, 1, 2]]
+
+
+def test_hashing_ngrams_do_not_cross_documents():
+    vectorizer = HashingVectorizer(n_features=2**20, ngram_range=(1, 2))
+
+    together = vectorizer.transform([["bom", "dia"], ["noite", "boa"]])
+    apart = [vectorizer.transform([tokens]) for tokens in (["bom", "dia"], ["noite", "boa"])]
+    crossing = vectorizer.transform([["dia", "noite"]])
+
+    assert together.nnz == 6
+    assert dense(together)[0].tolist() == dense(apart[0])[0].tolist()
+    assert dense(together)[1].tolist() == dense(apart[1])[0].tolist()
+
+    # O bigrama "dia noite" só existe se os dois tokens estiverem no mesmo documento
+    bigram = set(crossing.indices.tolist()) - set(vectorizer.transform([["dia"], ["noite"]]).indices.tolist())
+
+    assert bigram and not bigram & set(together.indices.tolist())
+
+
+def test_hashing_handles_empty_documents():
+    vectorizer = HashingVectorizer(n_features=16, ngram_range=(1, 3))
+    matrix = vectorizer.transform([[], ["so"], []])
+
+    assert matrix.shape == (3, 16)
+    assert np.diff(matrix.indptr).tolist() == [0, 1, 0]
+
+
+def test_hashing_stream_matches_transform():
+    documents = [["a", "b", "c"], [], ["b"], ["c", "a"], ["a"]]
+    vectorizer = HashingVectorizer(n_features=64, ngram_range=(1, 2))
+
+    streamed = np.vstack([dense(chunk) for chunk in vectorizer.stream(documents, chunk_size=2)])
+
+    assert streamed.tolist() == dense(vectorizer.transform(documents)).tolist()
@@ -0,0 +1,38 @@
+"""Testes do `KeywordMatcher` (Aho-Corasick) contra uma referência por expressão regular."""
+
+from __future__ import annotations
+
+import random
+import re
+
+from sa.model import Polarity
+from sa.nlp import KeywordMatcher
+
+
+def regex_keywords(keywords: list[str], text: str) -> set[str]:
+    """Referência: cada palavra-chave procurada isoladamente com ``\\b...\\b`` no texto dobrado."""
+
+    folded = KeywordMatcher.fold(text)
+
+    return {keyword for keyword in keywords if re.search(rf"\b{re.escape(KeywordMatcher.fold(keyword))}\b", folded)}
+
+
+def test_keyword_matcher_agrees_with_regex():
+    rng = random.Random(7)
+    words = ["amor", "amo", "amorzinho", "ódio", "odiar", "muito", "bom", "pão", "Pao", "de", "mel"]
+    keywords = ["amor", "amo", "ódio", "muito bom", "pão de mel", "de", "Pao"]
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(500):
+        text = "".join(rng.choice(words) + rng.choice([" ", "  ", ", ", "!", "\n", "-"]) for _ in range(rng.randint(0, 12)))
+
+        assert set(matcher.matched_keywords(text)) == regex_keywords(keywords, text), text
+
+
+def test_keyword_matcher_positions_and_polarities():
+    matcher = KeywordMatcher({Polarity.POSITIVE: ["amor"], Polarity.NEGATIVE: ["ódio", "odio"]})
+    matches = matcher.find("Amor e ODIO")
+
+    assert [(match.keyword, match.start, match.end) for match in matches] == [("amor", 0, 4), ("ódio", 7, 11), ("odio", 7, 11)]
+    assert matcher.matched_polarities("tanto ódio, tanto amor") == [Polarity.NEGATIVE, Polarity.POSITIVE]
+    assert matcher.matched_keywords("amorzinho") == []
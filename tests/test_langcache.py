@@ -0,0 +1,56 @@
+"""Testes do cache persistente de idiomas detectados."""
+
+from __future__ import annotations
+
+import pytest
+
+from sa.nlp import LanguageCache, LanguageDetector, langcache, text_hash
+
+TEXTS = ["eu gosto muito de café com leite pela manhã", "I would like a cup of coffee in the morning", "1234 !!!"]
+
+
+@pytest.fixture
+def detections(monkeypatch) -> list[list[str]]:
+    """Registra os lotes enviados ao detector de verdade."""
+
+    calls: list[list[str]] = []
+    detect_languages = langcache.detect_languages
+
+    def spy(texts, detector):
+        calls.append(list(texts))
+
+        return detect_languages(texts, detector)
+
+    monkeypatch.setattr(langcache, "detect_languages", spy)
+
+    return calls
+
+
+def test_only_missing_texts_are_detected(tmp_path, detections):
+    with LanguageCache(tmp_path / "idiomas.sqlite3") as cache:
+        assert cache.detect_batch(TEXTS[:2], LanguageDetector.NGRAM) == ["pt", "en"]
+        assert cache.detect_batch(TEXTS, LanguageDetector.NGRAM) == ["pt", "en", None]
+
+        assert detections == [TEXTS[:2], TEXTS[2:]]
+        assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_cache_persists_undetermined_texts(tmp_path, detections):
+    with LanguageCache(tmp_path / "idiomas.sqlite3", commit_every=None) as cache:
+        cache.detect_batch(TEXTS, LanguageDetector.NGRAM)
+
+    with LanguageCache(tmp_path / "idiomas.sqlite3") as cache:
+        assert len(cache) == 3
+        assert cache.detect(TEXTS[2], LanguageDetector.NGRAM, text_hash(TEXTS[2])) is None
+        assert cache.hit_rate == 1.0
+
+    assert len(detections) == 1
+
+
+def test_each_detector_has_its_own_entry(tmp_path):
+    with LanguageCache(tmp_path / "idiomas.sqlite3") as cache:
+        cache.put(text_hash(TEXTS[0]), LanguageDetector.LANGDETECT, "gl")
+
+        assert cache.detect(TEXTS[0], LanguageDetector.LANGDETECT) == "gl"
+        assert cache.detect(TEXTS[0], LanguageDetector.NGRAM) == "pt"
+        assert len(cache) == 2
@@ -0,0 +1,55 @@
+"""Testes do identificador de idioma por perfis de n-gramas."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from sa.model import Language
+from sa.nlp import LanguageIdentifier, detect_languages, get_language_identifier
+
+TEXTS = {
+    "Eu gosto muito de café com leite pela manhã": Language.PT,
+    "I would like a cup of coffee in the morning": Language.EN,
+    "Me gusta mucho el café con leche por la mañana": Language.ES,
+    "Je voudrais une tasse de café le matin, s'il vous plaît": None,
+    "Vorrei una tazza di caffè al mattino": None,
+    "1234 !!!": None,
+    "": None,
+}
+
+
+@pytest.fixture(scope="module")
+def identifier() -> LanguageIdentifier:
+    return LanguageIdentifier()
+
+
+def test_known_languages_and_distractors(identifier):
+    assert identifier.detect_batch(list(TEXTS)) == list(TEXTS.values())
+
+
+def test_batch_matches_single_detection(identifier):
+    texts = list(TEXTS) * 3
+
+    assert identifier.detect_batch(texts) == [identifier.detect(text) for text in texts]
+    assert identifier.matches("Eu gosto muito de café com leite pela manhã", Language.PT)
+    assert not identifier.matches("I would like a cup of coffee in the morning", Language.PT)
+
+
+def test_detect_languages_returns_codes():
+    assert detect_languages(list(TEXTS)) == [lang.value if lang else None for lang in TEXTS.values()]
+
+
+def test_default_identifier_is_shared_between_threads():
+    found: list[LanguageIdentifier] = []
+    threads = [threading.Thread(target=lambda: found.append(get_language_identifier())) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(found) == 4
+    assert all(instance is get_language_identifier() for instance in found)
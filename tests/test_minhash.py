@@ -0,0 +1,75 @@
+"""Testes do índice MinHash/LSH de quase duplicados."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from sa.nlp import MinHasher, NearDuplicateIndex, find_near_duplicates
+
+
+def random_texts(count: int, words: int = 40, seed: int = 13) -> list[str]:
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(5000)]
+
+    return [" ".join(rng.choice(vocabulary) for _ in range(words)) for _ in range(count)]
+
+
+def edit_word(text: str, position: int, word: str = "editado") -> str:
+    tokens = text.split()
+    tokens[position] = word
+
+    return " ".join(tokens)
+
+
+def test_edited_repost_is_a_near_duplicate():
+    original, unrelated = random_texts(2)
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+
+    assert index.add("a", original) is None
+    assert index.add("b", edit_word(original, 39)) == "a"
+    assert index.add("c", unrelated) is None
+    assert index.add("d", "") is None
+    assert len(index) == 2
+
+
+def test_index_grows_without_losing_buckets():
+    texts = random_texts(3000)
+    index: NearDuplicateIndex[int] = NearDuplicateIndex()
+
+    assert [index.add(i, text) for i, text in enumerate(texts)] == [None] * len(texts)
+
+    # Cópias exatas coincidem em todas as bandas: qualquer bucket perdido no crescimento apareceria aqui
+    assert [index.query(text) for text in texts] == list(range(len(texts)))
+
+
+def test_batch_pass_matches_incremental_index():
+    base = random_texts(50)
+    texts = base + [edit_word(text, 0) for text in base[:20]] + base[:5]
+
+    index: NearDuplicateIndex[int] = NearDuplicateIndex()
+    expected = [index.add(i, text) for i, text in enumerate(texts)]
+
+    assert find_near_duplicates(texts) == expected
+    assert expected[50:] == list(range(20)) + list(range(5))
+
+
+def test_batch_signatures_match_single_signatures():
+    hasher = MinHasher()
+    texts = random_texts(10) + ["", "duas palavras"]
+    signatures, valid = hasher.signatures(texts, batch_size=4)
+
+    for text, signature, ok in zip(texts, signatures, valid):
+        single = hasher.signature(text)
+
+        assert ok == (single is not None)
+
+        if ok:
+            assert np.array_equal(signature, single)
+
+
+def test_invalid_threshold_is_rejected():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(threshold=0)
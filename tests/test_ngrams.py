@@ -0,0 +1,40 @@
+"""Testes de fumaça da contagem e da fusão de n-gramas do `NGramCounter`."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from sa.nlp import NGramCounter
+
+
+def test_ngram_merge_matches_sequential_count():
+    rng = random.Random(3)
+    documents = [[rng.choice("abcde") for _ in range(rng.randint(0, 8))] for _ in range(60)]
+
+    sequential = NGramCounter((1, 2, 3)).update_many(documents)
+
+    merged = NGramCounter((1, 2, 3))
+    for start in range(0, len(documents), 7):
+        merged += NGramCounter((1, 2, 3)).update_many(documents[start : start + 7])
+
+    assert merged.documents == sequential.documents == 60
+
+    for order in (1, 2, 3):
+        assert merged.frequencies(order) == sequential.frequencies(order)
+        assert merged.total(order) == sequential.total(order)
+
+
+def test_ngrams_do_not_cross_documents():
+    counter = NGramCounter((2,)).update_many([["bom", "dia"], ["boa", "noite"]])
+
+    assert counter.frequencies(2) == {"bom dia": 1, "boa noite": 1}
+
+
+def test_ngram_merge_rejects_different_orders():
+    with pytest.raises(ValueError):
+        NGramCounter((1,)).merge(NGramCounter((1, 2)))
+
+    with pytest.raises(ValueError):
+        NGramCounter((1,)).most_common(order=2)
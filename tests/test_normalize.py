@@ -0,0 +1,33 @@
+"""Testes da normalização de textos em lote contra a versão texto a texto."""
+
+from __future__ import annotations
+
+import random
+
+import pandas as pd
+
+from sa.nlp import normalize_text, normalize_texts
+
+PIECES = ["Olá", "MUNDO", "ação", " ", "  ", "\n", "\t", "\x01", "\x0b", "\x1f", "😀", "👍🏽", "©", "®", "‼", "→", "ñ", "k" * 4, ".", "!"]
+
+
+def random_texts(count: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+
+    return ["".join(rng.choice(PIECES) for _ in range(rng.randint(0, 10))) for _ in range(count)]
+
+
+def test_batch_matches_single_normalization():
+    texts = random_texts(1000)
+
+    assert normalize_texts(texts) == [normalize_text(text) for text in texts]
+
+
+def test_series_keeps_index_and_name():
+    series = pd.Series(["  Bom\nDia 😀 ", None, float("nan"), "TCHAU"], index=[10, 20, 30, 40], name="texto")
+    normalized = normalize_texts(series)
+
+    assert isinstance(normalized, pd.Series)
+    assert normalized.index.tolist() == [10, 20, 30, 40]
+    assert normalized.name == "texto"
+    assert normalized.tolist() == [normalize_text("  Bom\nDia 😀 "), "", "", "tchau"]
@@ -0,0 +1,57 @@
+"""Testes do `PreprocessPool` com um modelo spaCy mínimo gravado em disco."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+import spacy
+from spacy.lookups import Lookups
+
+from sa.nlp import PipelineProfile, PreprocessPool, clear_pipeline_cache, load_pipeline, pipeline_info, preprocess_texts, token_cache_fingerprint
+
+STOPWORDS = frozenset({"casa"})
+
+
+@pytest.fixture(scope="module")
+def tiny_model(tmp_path_factory) -> str:
+    """Modelo sem pesos: todo token alfabético é ``NOUN`` e o lema é o próprio texto (salvo ``casas``)."""
+
+    nlp = spacy.blank("pt")
+    nlp.add_pipe("attribute_ruler").add([[{"IS_ALPHA": True}]], {"POS": "NOUN"})
+
+    lookups = Lookups()
+    lookups.add_table("lemma_lookup", {"casas": "casa"})
+    nlp.add_pipe("lemmatizer", config={"mode": "lookup"}).initialize(lookups=lookups)
+
+    # Excluído pelo perfil LEMMA_POS
+    nlp.add_pipe("sentencizer", name="senter")
+
+    path = tmp_path_factory.mktemp("modelo") / "pt_teste"
+    nlp.to_disk(path)
+
+    return str(path)
+
+
+def test_pool_keeps_input_order(tiny_model):
+    rng = random.Random(5)
+    words = ["praia", "serra", "casas", "cidade", "campo", "festa", "de", "rio"]
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 6))) for _ in range(300)]
+
+    expected = list(preprocess_texts(texts, STOPWORDS, load_pipeline(tiny_model), allowed_pos={"NOUN"}))
+
+    with PreprocessPool(STOPWORDS, tiny_model, allowed_pos={"NOUN"}, workers=2, chunk_size=7) as pool:
+        assert list(pool.map(texts)) == expected
+        assert pool.count_ngrams(texts, (1, 2)).frequencies(1)["praia"] == sum(tokens.count("praia") for tokens in expected)
+
+
+def test_pipeline_info_matches_loaded_model(tiny_model):
+    # Sem o modelo em cache, os metadados vêm do meta.json
+    clear_pipeline_cache()
+    info = pipeline_info(tiny_model, PipelineProfile.LEMMA_POS)
+
+    assert info.pipe_names == ["attribute_ruler", "lemmatizer"]
+    assert token_cache_fingerprint(STOPWORDS, info) == token_cache_fingerprint(STOPWORDS, load_pipeline(tiny_model, PipelineProfile.LEMMA_POS))
+
+    with pytest.raises(OSError):
+        pipeline_info("modelo_inexistente")
@@ -0,0 +1,109 @@
+"""Testes do orçamento e da justiça do `RequestScheduler`."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from sa.client import RequestScheduler, ScheduledRedditClient
+
+# Orçamento alto: a espera real entre as verificações do balde fica em milissegundos
+RPM = 60_000
+TOKEN_SECONDS = 60 / RPM
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+
+    while not condition():
+        assert time.monotonic() < deadline, "condição não atingida a tempo"
+        time.sleep(0.001)
+
+
+def test_burst_is_granted_without_waiting(clock):
+    scheduler = RequestScheduler(RPM, burst=3, clock=clock)
+
+    for _ in range(3):
+        scheduler.acquire("a")
+
+    assert scheduler.requests_made == 3
+    assert scheduler.estimate_seconds(2) == pytest.approx(2 * TOKEN_SECONDS)
+
+
+def test_request_waits_for_refill(clock):
+    scheduler = RequestScheduler(RPM, burst=1, clock=clock)
+    scheduler.acquire("a")
+
+    waiter = threading.Thread(target=scheduler.acquire, args=("a",), daemon=True)
+    waiter.start()
+    waiter.join(0.05)
+
+    # Sem o relógio avançar, o balde continua vazio
+    assert waiter.is_alive()
+    assert scheduler.requests_made == 1
+
+    clock.advance(TOKEN_SECONDS)
+    waiter.join(2.0)
+
+    assert not waiter.is_alive()
+    assert scheduler.requests_made == 2
+
+
+def test_refill_is_capped_at_burst(clock):
+    scheduler = RequestScheduler(RPM, burst=2, clock=clock)
+    clock.advance(1000 * TOKEN_SECONDS)
+
+    scheduler.acquire()
+    scheduler.acquire()
+
+    assert scheduler.estimate_seconds(1) == pytest.approx(TOKEN_SECONDS)
+
+
+def test_least_served_unit_goes_first(clock):
+    scheduler = RequestScheduler(RPM, burst=2, clock=clock)
+    scheduler.acquire("busy")
+    scheduler.acquire("busy")
+
+    order: list[str] = []
+
+    def request(unit: str) -> None:
+        scheduler.acquire(unit)
+        order.append(unit)
+
+    # "busy" chega primeiro, mas já foi atendida duas vezes
+    busy = threading.Thread(target=request, args=("busy",), daemon=True)
+    busy.start()
+    wait_for(lambda: len(scheduler._waiting) == 1)
+
+    idle = threading.Thread(target=request, args=("idle",), daemon=True)
+    idle.start()
+    wait_for(lambda: len(scheduler._waiting) == 2)
+
+    clock.advance(TOKEN_SECONDS)
+    wait_for(lambda: len(order) == 1)
+    clock.advance(TOKEN_SECONDS)
+
+    busy.join(2.0)
+    idle.join(2.0)
+
+    assert order == ["idle", "busy"]
+
+
+def test_invalid_budget_is_rejected():
+    with pytest.raises(ValueError):
+        RequestScheduler(0)
+
+    with pytest.raises(ValueError):
+        RequestScheduler(60, burst=0)
+
+
+def test_scheduled_client_acquires_once_per_page(fake_client, clock):
+    scheduler = RequestScheduler(RPM, burst=10, clock=clock)
+    client = ScheduledRedditClient(fake_client, scheduler, page_size=100)
+
+    posts = list(client.subreddit("brasil").search("amor", sort="new", limit=250))
+
+    assert len(posts) == 250
+    assert scheduler.requests_made == 3
@@ -0,0 +1,57 @@
+"""Testes de fumaça da pontuação de sentimento por léxico com negação."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sa.sentiment import Lexicon, SentimentScorer, tokenize
+
+
+@pytest.fixture(scope="module")
+def scorer() -> SentimentScorer:
+    return SentimentScorer(Lexicon({"feliz": 1, "triste": -1, "otimo": 2}))
+
+
+def score(scorer: SentimentScorer, text: str) -> float:
+    return float(scorer.score_texts([text]).score[0])
+
+
+def test_negator_flips_following_tokens(scorer):
+    assert score(scorer, "feliz") == 1
+    assert score(scorer, "não feliz") == -1
+    assert score(scorer, "nunca estive tão triste") == 1
+
+
+def test_negation_window_is_limited(scorer):
+    assert score(scorer, "nao um dois tres feliz") == 1
+    assert score(scorer, "nao um dois feliz") == -1
+
+
+def test_negation_stops_at_sentence_boundary(scorer):
+    assert tokenize("Nunca fui feliz. Triste!") == ["nunca", "fui", "feliz", ".", "triste", "."]
+
+    result = scorer.score_texts(["nunca fui feliz. triste"])
+
+    # "feliz" é negado; "triste", em outra frase, não
+    assert result.total[0] == -2
+    assert result.hits[0] == 2
+
+
+def test_negation_does_not_cross_documents(scorer):
+    result = scorer.score_tokens([["feliz", "nao"], ["feliz"]])
+
+    assert result.score.tolist() == [1, 1]
+
+
+def test_documents_without_lexicon_terms_score_zero(scorer):
+    result = scorer.score_texts(["", "nada a ver"])
+
+    assert result.score.tolist() == [0, 0]
+    assert result.hits.tolist() == [0, 0]
+
+
+def test_batches_match_single_pass():
+    texts = ["otimo dia", "nao gostei", "triste. feliz", ""] * 5
+
+    assert np.array_equal(SentimentScorer(batch_size=3).score_texts(texts).score, SentimentScorer().score_texts(texts).score)
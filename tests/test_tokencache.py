@@ -0,0 +1,82 @@
+"""Testes do cache persistente de tokens pré-processados."""
+
+from __future__ import annotations
+
+import pytest
+
+from sa.nlp import PipelineInfo, TokenCorpusCache, token_cache_fingerprint, tokencache
+
+FINGERPRINT = "a" * 64
+
+MODEL = PipelineInfo({"lang": "pt", "name": "core_news_lg", "version": "3.8.0"}, ["tok2vec", "morphologizer", "lemmatizer"])
+
+
+def store(cache: TokenCorpusCache, tokens_by_text: dict[str, list[str]]) -> None:
+    _, keys = cache.lookup(tokens_by_text)
+
+    for key, tokens in zip(keys, tokens_by_text.values()):
+        cache.put(key, tokens)
+
+
+def test_save_and_lookup_round_trip(tmp_path):
+    first = {"bom dia": ["dia"], "sem tokens": [], "ação rápida": ["ação", "rápido"]}
+    second = {"outro texto": ["outro", "texto"], "bom dia": ["dia"]}
+
+    cache = TokenCorpusCache(tmp_path, FINGERPRINT)
+    store(cache, first)
+    cache.save()
+
+    cache = TokenCorpusCache(tmp_path, FINGERPRINT)
+    store(cache, {"outro texto": second["outro texto"]})
+    cache.save()
+
+    reloaded = TokenCorpusCache(tmp_path, FINGERPRINT)
+    texts = [*first, "outro texto", "ausente"]
+    tokens, _ = reloaded.lookup(texts)
+
+    assert len(reloaded) == 4
+    assert tokens == [*first.values(), second["outro texto"], None]
+
+
+def test_preprocess_only_sends_missing_texts(tmp_path, monkeypatch):
+    sent: list[str] = []
+
+    def fake_preprocess_texts(texts, stopwords, nlp, **options):
+        for text in texts:
+            sent.append(text)
+            yield text.split()
+
+    monkeypatch.setattr(tokencache, "preprocess_texts", fake_preprocess_texts)
+
+    cache = TokenCorpusCache(tmp_path, FINGERPRINT)
+    store(cache, {"bom dia": ["dia"]})
+
+    assert cache.preprocess(["bom dia", "boa noite", "bom dia"], frozenset(), object()) == [["dia"], ["boa", "noite"], ["dia"]]
+    assert sent == ["boa noite"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    with pytest.raises(ValueError):
+        cache.preprocess(["bom dia"], frozenset(), None)
+
+
+def test_different_fingerprint_starts_empty(tmp_path):
+    cache = TokenCorpusCache(tmp_path, FINGERPRINT)
+    store(cache, {"bom dia": ["dia"]})
+    cache.save()
+
+    # Mesmo arquivo (16 primeiros caracteres iguais), configuração diferente
+    assert len(TokenCorpusCache(tmp_path, FINGERPRINT[:16] + "b" * 48)) == 0
+    assert len(TokenCorpusCache(tmp_path, "b" * 64)) == 0
+    assert len(TokenCorpusCache(tmp_path, FINGERPRINT, load=False)) == 0
+    assert len(TokenCorpusCache(tmp_path, FINGERPRINT)) == 1
+
+
+def test_fingerprint_tracks_the_preprocessing_configuration():
+    base = token_cache_fingerprint(frozenset({"de", "a"}), MODEL, {"NOUN"})
+
+    assert token_cache_fingerprint(frozenset({"a", "de"}), MODEL, {"NOUN"}) == base
+    assert token_cache_fingerprint(frozenset({"de"}), MODEL, {"NOUN"}) != base
+    assert token_cache_fingerprint(frozenset({"de", "a"}), MODEL, {"NOUN", "ADJ"}) != base
+    assert token_cache_fingerprint(frozenset({"de", "a"}), MODEL, {"NOUN"}, min_token_len=2) != base
+    assert token_cache_fingerprint(frozenset({"de", "a"}), MODEL._replace(pipe_names=["tok2vec"]), {"NOUN"}) != base
+    assert token_cache_fingerprint(frozenset({"de", "a"}), MODEL._replace(meta={**MODEL.meta, "version": "3.8.1"}), {"NOUN"}) != base